@@ -19,6 +19,8 @@ Main Components:
 
     Shared:
         State: Enum representing FireObject lifecycle states
+        request_cache: Context manager that deduplicates document reads
+        configure_recent_snapshots: Enable the cache behind fetch(source='cache')
 
 Example Usage (Synchronous):
     from google.cloud import firestore
@@ -87,6 +89,7 @@ from .fire_collection import FireCollection
 from .fire_object import FireObject
 from .fire_query import FireQuery
 from .fireprox import FireProx
+from .request_cache import configure_recent_snapshots, request_cache
 
 # Shared
 from .state import State
@@ -106,6 +109,8 @@ __all__ = [
     "AsyncFireQuery",
     # Shared
     "State",
+    "request_cache",
+    "configure_recent_snapshots",
     # Aggregations
     "Count",
     "Sum",
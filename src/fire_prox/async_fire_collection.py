@@ -5,15 +5,14 @@ This module implements the asynchronous FireCollection class for use with
 google.cloud.firestore.AsyncClient.
 """
 
-from typing import TYPE_CHECKING, Any, AsyncIterator, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 from .async_fire_object import AsyncFireObject
+from .async_fire_query import AsyncFireQuery
 from .base_fire_collection import BaseFireCollection
+from .base_fire_query import order_direction, validate_operator
 from .state import State
 
-if TYPE_CHECKING:
-    from .async_fire_query import AsyncFireQuery
-
 
 class AsyncFireCollection(BaseFireCollection):
     """
@@ -43,6 +42,8 @@ class AsyncFireCollection(BaseFireCollection):
             print(user.name)
     """
 
+    __slots__ = ()
+
     # =========================================================================
     # Document Creation
     # =========================================================================
@@ -58,13 +59,8 @@ class AsyncFireCollection(BaseFireCollection):
         **_: Any,
     ) -> AsyncFireObject:
         """Instantiate the asynchronous FireObject wrapper."""
-        return AsyncFireObject(
-            doc_ref=doc_ref,
-            sync_doc_ref=sync_doc_ref,
-            sync_client=sync_client,
-            initial_state=initial_state,
-            parent_collection=parent_collection,
-        )
+        # Positional call: this runs once per document handed out by new()/doc()
+        return AsyncFireObject(doc_ref, initial_state, parent_collection, sync_doc_ref, sync_client)
 
     def _get_new_kwargs(self) -> dict[str, Any]:
         return {'sync_client': self._sync_client}
@@ -77,11 +73,11 @@ class AsyncFireCollection(BaseFireCollection):
 
     def new(self) -> AsyncFireObject:
         """Create a new AsyncFireObject in DETACHED state."""
-        return super().new()
+        return BaseFireCollection.new(self)
 
     def doc(self, doc_id: str) -> AsyncFireObject:
         """Get a reference to a specific document in this collection."""
-        return super().doc(doc_id)
+        return BaseFireCollection.doc(self, doc_id)
 
     # =========================================================================
     # Properties (inherited from BaseFireCollection)
@@ -98,13 +94,20 @@ class AsyncFireCollection(BaseFireCollection):
             AsyncFireObject representing the parent document if this is a
             subcollection, None if this is a root-level collection.
         """
-        raise NotImplementedError("Phase 2 feature - subcollections")
+        parent_ref = self._collection_ref.parent
+        if parent_ref is None:
+            return None
+
+        sync_doc_ref = None
+        if self._sync_client is not None:
+            sync_doc_ref = self._sync_client.document(parent_ref.path)
+        return AsyncFireObject(parent_ref, State.ATTACHED, None, sync_doc_ref, self._sync_client)
 
     # =========================================================================
     # Query Methods (Phase 2)
     # =========================================================================
 
-    def where(self, field: str, op: str, value: Any) -> 'AsyncFireQuery':
+    def where(self, field: str, op: str, value: Any) -> AsyncFireQuery:
         """
         Create a query with a filter condition.
 
@@ -125,20 +128,17 @@ class AsyncFireCollection(BaseFireCollection):
             async for user in query.stream():
                 print(user.name)
         """
-        from google.cloud.firestore_v1.base_query import FieldFilter
-
-        from .async_fire_query import AsyncFireQuery
+        validate_operator(op)
 
         # Create initial query with filter
-        filter_obj = FieldFilter(field, op, value)
-        native_query = self._collection_ref.where(filter=filter_obj)
+        native_query = self._where_query(field, op, value)
         return AsyncFireQuery(native_query, parent_collection=self)
 
     def order_by(
         self,
         field: str,
         direction: str = 'ASCENDING'
-    ) -> 'AsyncFireQuery':
+    ) -> AsyncFireQuery:
         """
         Create a query with ordering.
 
@@ -151,23 +151,10 @@ class AsyncFireCollection(BaseFireCollection):
         Returns:
             An AsyncFireQuery instance for method chaining.
         """
-        from google.cloud.firestore_v1 import Query as QueryClass
-
-        from .async_fire_query import AsyncFireQuery
-
-        # Convert direction string to constant
-        if direction.upper() == 'ASCENDING':
-            direction_const = QueryClass.ASCENDING
-        elif direction.upper() == 'DESCENDING':
-            direction_const = QueryClass.DESCENDING
-        else:
-            raise ValueError(f"Invalid direction: {direction}. Must be 'ASCENDING' or 'DESCENDING'")
-
-        # Create query with ordering
-        native_query = self._collection_ref.order_by(field, direction=direction_const)
+        native_query = self._order_by_query(field, order_direction(direction))
         return AsyncFireQuery(native_query, parent_collection=self)
 
-    def limit(self, count: int) -> 'AsyncFireQuery':
+    def limit(self, count: int) -> AsyncFireQuery:
         """
         Create a query with a result limit.
 
@@ -179,16 +166,11 @@ class AsyncFireCollection(BaseFireCollection):
         Returns:
             An AsyncFireQuery instance for method chaining.
         """
-        from .async_fire_query import AsyncFireQuery
-
-        if count <= 0:
-            raise ValueError(f"Limit count must be positive, got {count}")
-
-        # Create query with limit
-        native_query = self._collection_ref.limit(count)
+        # Create query with limit (validated by _limit_query)
+        native_query = self._limit_query(count)
         return AsyncFireQuery(native_query, parent_collection=self)
 
-    def select(self, *field_paths: str) -> 'AsyncFireQuery':
+    def select(self, *field_paths: str) -> AsyncFireQuery:
         """
         Create a query with field projection.
 
@@ -206,13 +188,11 @@ class AsyncFireCollection(BaseFireCollection):
             results = await users.select('name', 'email').get()
             # Returns: [{'name': 'Alice', 'email': 'alice@example.com'}, ...]
         """
-        from .async_fire_query import AsyncFireQuery
-
         if not field_paths:
             raise ValueError("select() requires at least one field path")
 
         # Create query with projection
-        native_query = self._collection_ref.select(list(field_paths))
+        native_query = self._select_query(field_paths)
         return AsyncFireQuery(native_query, parent_collection=self, projection=field_paths)
 
     async def get_all(self) -> AsyncIterator[AsyncFireObject]:
@@ -230,7 +210,7 @@ class AsyncFireCollection(BaseFireCollection):
         """
         # Stream all documents from the collection
         async for snapshot in self._collection_ref.stream():
-            yield AsyncFireObject.from_snapshot(snapshot, parent_collection=self)
+            yield AsyncFireObject.from_snapshot(snapshot, parent_collection=self, copy=False)
 
     # =========================================================================
     # Vector Query Methods
@@ -243,7 +223,7 @@ class AsyncFireCollection(BaseFireCollection):
         distance_measure: Any,
         limit: int,
         distance_result_field: Optional[str] = None,
-    ) -> 'AsyncFireQuery':
+    ) -> AsyncFireQuery:
         """
         Find the nearest neighbors based on vector similarity.
 
@@ -283,14 +263,10 @@ class AsyncFireCollection(BaseFireCollection):
             - Can be combined with where() for pre-filtering (requires composite index)
             - Does not work with Firestore emulator (production only)
         """
-        from .async_fire_query import AsyncFireQuery
-
-        # Create vector query using native find_nearest
+        # Create vector query using native find_nearest (note the native
+        # argument order puts limit before distance_measure)
         native_query = self._collection_ref.find_nearest(
-            vector_field=vector_field,
-            query_vector=query_vector,
-            distance_measure=distance_measure,
-            limit=limit,
+            vector_field, query_vector, limit, distance_measure,
             distance_result_field=distance_result_field,
         )
         return AsyncFireQuery(native_query, parent_collection=self)
@@ -313,7 +289,6 @@ class AsyncFireCollection(BaseFireCollection):
             total = await users.count()
             print(f"Total users: {total}")
         """
-        from .async_fire_query import AsyncFireQuery
         # Use collection reference directly as a query for aggregation
         query = AsyncFireQuery(self._collection_ref, parent_collection=self)
         return await query.count()
@@ -334,7 +309,6 @@ class AsyncFireCollection(BaseFireCollection):
         Example:
             total_revenue = await orders.sum('amount')
         """
-        from .async_fire_query import AsyncFireQuery
         # Use collection reference directly as a query for aggregation
         query = AsyncFireQuery(self._collection_ref, parent_collection=self)
         return await query.sum(field)
@@ -355,7 +329,6 @@ class AsyncFireCollection(BaseFireCollection):
         Example:
             avg_rating = await products.avg('rating')
         """
-        from .async_fire_query import AsyncFireQuery
         # Use collection reference directly as a query for aggregation
         query = AsyncFireQuery(self._collection_ref, parent_collection=self)
         return await query.avg(field)
@@ -383,7 +356,6 @@ class AsyncFireCollection(BaseFireCollection):
             )
             # Returns: {'total': 42, 'total_score': 5000, 'avg_age': 28.5}
         """
-        from .async_fire_query import AsyncFireQuery
         # Use collection reference directly as a query for aggregation
         query = AsyncFireQuery(self._collection_ref, parent_collection=self)
         return await query.aggregate(**aggregations)
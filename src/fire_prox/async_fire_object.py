@@ -5,14 +5,82 @@ This module implements the asynchronous FireObject class for use with
 google.cloud.firestore.AsyncClient.
 """
 
-from typing import Any, Dict, List, Optional
+from __future__ import annotations
 
+import asyncio
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+
+from google.api_core.exceptions import DeadlineExceeded, RetryError, ServiceUnavailable
+from google.api_core.gapic_v1.method import DEFAULT
 from google.cloud.exceptions import NotFound
 from google.cloud.firestore_v1.async_document import AsyncDocumentReference
 from google.cloud.firestore_v1.document import DocumentSnapshot
 
-from .base_fire_object import BaseFireObject
-from .state import State
+from .base_fire_object import (
+    _ATTACHED,
+    _DETACHED,
+    _LOADED,
+    _MISSING,
+    _SCALAR_TYPES,
+    MAX_BATCH_SIZE,
+    BaseFireObject,
+    _auto_id,
+    _check_bulk_target,
+    _direct_ref,
+)
+from .request_cache import (
+    ASYNC_FALLBACK_RETRY,
+    SERVER_AND_CACHE_TIMEOUT,
+    cached_snapshot,
+    invalidate,
+    recent_snapshot,
+    store_snapshot,
+    validate_source,
+)
+
+# Writer installed by AsyncFireObject.bulk(). A context variable rather than
+# a thread-local, since concurrent tasks share the event loop's thread
+_bulk_writer: ContextVar[Optional['_AsyncBulkWriter']] = ContextVar('fire_prox_bulk_writer', default=None)
+
+
+class _AsyncBulkWriter:
+    """Accumulate implicit writes inside AsyncFireObject.bulk() and commit them in chunks."""
+
+    def __init__(self, client: Any, batch_size: int):
+        self._client = client
+        self._batch_size = batch_size
+        self._batch = client.batch()
+        self._pending = 0
+
+    async def set(self, doc_ref: Any, data: Dict[str, Any]) -> None:
+        _check_bulk_target(self._client, doc_ref)
+        self._batch.set(doc_ref, data)
+        await self._added()
+
+    async def update(self, doc_ref: Any, update_dict: Dict[str, Any]) -> None:
+        _check_bulk_target(self._client, doc_ref)
+        self._batch.update(doc_ref, update_dict)
+        await self._added()
+
+    async def delete(self, doc_ref: Any) -> None:
+        _check_bulk_target(self._client, doc_ref)
+        self._batch.delete(doc_ref)
+        await self._added()
+
+    async def _added(self) -> None:
+        self._pending += 1
+        if self._pending >= self._batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Commit any pending writes and start a fresh batch."""
+        if self._pending:
+            # Swap first so writes from other tasks land in the new batch
+            # while this one is being committed
+            batch, self._batch, self._pending = self._batch, self._client.batch(), 0
+            await batch.commit()
 
 
 class AsyncFireObject(BaseFireObject):
@@ -52,26 +120,58 @@ class AsyncFireObject(BaseFireObject):
         await user.delete()
     """
 
+    __slots__ = ()
+
     # =========================================================================
     # Firestore I/O Hooks
     # =========================================================================
 
-    async def _get_snapshot(self, transaction: Optional[Any] = None) -> DocumentSnapshot:
+    async def _get_snapshot(
+        self,
+        transaction: Optional[Any] = None,
+        retry: Any = DEFAULT,
+        timeout: Optional[float] = None,
+    ) -> DocumentSnapshot:
         """Retrieve a document snapshot using the async client."""
         if transaction is not None:
             return await self._doc_ref.get(transaction=transaction)
-        return await self._doc_ref.get()
+
+        snapshot = cached_snapshot(self._doc_ref)
+        if snapshot is None:
+            snapshot = await _direct_ref(self._doc_ref).get(retry=retry, timeout=timeout)
+            store_snapshot(self._doc_ref, snapshot)
+        return snapshot
+
+    async def _unmodified_on_server(self) -> bool:
+        """Check with a field-less read whether the loaded data is still current."""
+        if not self._can_skip_refresh():
+            return False
+        meta = await _direct_ref(self._doc_ref).get(field_paths=['__name__'])
+        return meta.exists and meta.update_time == self._update_time
+
+    async def _read_snapshot(self, transaction: Optional[Any], source: str) -> Any:
+        """Retrieve a snapshot from the server and/or the recent-snapshot cache."""
+        if source == 'server':
+            return await self._get_snapshot(transaction)
+
+        validate_source(source, transaction)
+        if source == 'cache':
+            return recent_snapshot(self._doc_ref)
+
+        try:
+            return await self._get_snapshot(retry=ASYNC_FALLBACK_RETRY, timeout=SERVER_AND_CACHE_TIMEOUT)
+        except (DeadlineExceeded, ServiceUnavailable, RetryError) as exc:
+            # Serve a recent copy if there is one, otherwise surface the outage
+            try:
+                return recent_snapshot(self._doc_ref)
+            except NotFound:
+                raise exc from None
 
     def _create_document(self, doc_id: Optional[str] = None) -> AsyncDocumentReference:
         """Create a new async document reference for DETACHED saves."""
-        if not self._parent_collection:
-            raise ValueError("DETACHED object has no parent collection")
-
-        collection_ref = self._parent_collection._collection_ref
-        if doc_id:
-            doc_ref = collection_ref.document(doc_id)
-        else:
-            doc_ref = collection_ref.document()
+        # _prepare_detached_save() has already checked for a parent collection,
+        # which keeps collection_ref.document pre-bound
+        doc_ref = self._parent_collection._document(doc_id or _auto_id())
 
         object.__setattr__(self, '_doc_ref', doc_ref)
 
@@ -90,13 +190,16 @@ class AsyncFireObject(BaseFireObject):
     ) -> None:
         """Persist data via a set call on the async client."""
         target_ref = doc_ref or self._doc_ref
+        invalidate(target_ref)
 
         if transaction is not None:
             transaction.set(target_ref, data)
         elif batch is not None:
             batch.set(target_ref, data)
+        elif (writer := _bulk_writer.get()) is not None:
+            await writer.set(target_ref, data)
         else:
-            await target_ref.set(data)
+            await _direct_ref(target_ref).set(data)
 
     async def _write_update(
         self,
@@ -105,19 +208,25 @@ class AsyncFireObject(BaseFireObject):
         batch: Optional[Any] = None,
     ) -> None:
         """Perform an update operation using the async client."""
+        invalidate(self._doc_ref)
         if transaction is not None:
             transaction.update(self._doc_ref, update_dict)
         elif batch is not None:
             batch.update(self._doc_ref, update_dict)
+        elif (writer := _bulk_writer.get()) is not None:
+            await writer.update(self._doc_ref, update_dict)
         else:
-            await self._doc_ref.update(update_dict)
+            await _direct_ref(self._doc_ref).update(update_dict)
 
     async def _write_delete(self, batch: Optional[Any] = None) -> None:
         """Delete the document using the async client."""
+        invalidate(self._doc_ref)
         if batch is not None:
             batch.delete(self._doc_ref)
+        elif (writer := _bulk_writer.get()) is not None:
+            await writer.delete(self._doc_ref)
         else:
-            await self._doc_ref.delete()
+            await _direct_ref(self._doc_ref).delete()
 
     def __getattr__(self, name: str) -> Any:
         """
@@ -153,53 +262,87 @@ class AsyncFireObject(BaseFireObject):
         if name in self._INTERNAL_ATTRS:
             raise AttributeError(f"Internal attribute {name} not set")
 
-        # If we're in ATTACHED state, trigger lazy loading via sync fetch
-        if self._state == State.ATTACHED and self._sync_doc_ref:
-            # Use sync doc ref for lazy loading (synchronous fetch)
-            snapshot = self._sync_doc_ref.get()
-
-            if not snapshot.exists:
-                raise NotFound(f"Document {self._sync_doc_ref.path} does not exist")
-
-            # Get data and convert special types (DocumentReference → FireObject, etc.)
-            data = snapshot.to_dict() or {}
-            converted_data = {}
-            sync_client = (
-                self._sync_doc_ref._client
-                if hasattr(self, '_sync_doc_ref') and self._sync_doc_ref
-                else None
-            )
-            for key, value in data.items():
-                converted_data[key] = self._convert_snapshot_value_for_retrieval(
-                    value,
-                    is_async=True,
-                    sync_client=sync_client,
-                )
+        # Fast path: scalar values need no state check or materialization
+        value = self._data.get(name, _MISSING)
+        if type(value) in _SCALAR_TYPES:
+            return value
+
+        if value is _MISSING:
+            # Firestore reserves __*__ field names, so protocol probes such
+            # as copy's __deepcopy__ can never be fields and must not fetch
+            if name.startswith('__'):
+                raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
-            # Transition to LOADED with converted data
-            self._transition_to_loaded(converted_data)
+            # An ATTACHED object holds no fetched fields, so lazy loading via
+            # sync fetch only has to be considered when the lookup misses
+            if self._state is _ATTACHED and self._sync_doc_ref:
+                # Load every prefetched object in one round-trip if this is one
+                if self._is_prefetched():
+                    self._load_prefetched()
+
+                if self._state is _ATTACHED:
+                    self._process_snapshot(self._sync_doc_ref.get(), is_async=True)
 
         return self._materialize_field(name)
 
+    def _load_prefetched(self) -> None:
+        """
+        Load every pending prefetched AsyncFireObject through its sync client.
+
+        Like single-object lazy loading, this blocks on the companion sync
+        client, but makes one get_all() call per client instead of one
+        get() per object.
+        """
+        by_client: Dict[int, Dict[str, List['AsyncFireObject']]] = {}
+        for obj in self._take_prefetched(AsyncFireObject):
+            sync_ref = obj._sync_doc_ref
+            if sync_ref is not None:
+                group = by_client.setdefault(id(sync_ref._client), {})
+                group.setdefault(sync_ref.path, []).append(obj)
+
+        for group in by_client.values():
+            refs = [objects[0]._sync_doc_ref for objects in group.values()]
+            snapshots = list(refs[0]._client.get_all(refs))
+            # Missing documents stay ATTACHED; each raises NotFound from its
+            # own lazy load when it is accessed
+            self._hydrate_fetch_many(group, snapshots, is_async=True, missing_ok=True)
+
     # =========================================================================
     # Async Lifecycle Methods
     # =========================================================================
 
-    async def fetch(self, force: bool = False, transaction: Optional[Any] = None) -> 'AsyncFireObject':
+    async def fetch(
+        self,
+        force: bool = False,
+        transaction: Optional[Any] = None,
+        prefetch_collections: bool = False,
+        source: str = 'server',
+        if_modified: bool = False,
+    ) -> 'AsyncFireObject':
         """
         Fetch document data from Firestore asynchronously.
 
         Args:
             force: If True, fetch data even if already LOADED.
             transaction: Optional transaction object for transactional reads.
+            prefetch_collections: If True, list the document's subcollections
+                                 concurrently with the fetch. The next
+                                 collections() call returns that listing
+                                 instead of issuing its own RPC.
+            source: 'server' (default), 'cache' or 'server_and_cache'.
+                   See FireObject.fetch().
+            if_modified: With force=True, skip the full read if the
+                        document's update_time is unchanged. See
+                        FireObject.fetch().
 
         Returns:
             Self, to allow method chaining.
 
         Raises:
-            ValueError: If called on DETACHED object.
+            ValueError: If called on DETACHED object, or source is invalid.
             RuntimeError: If called on DELETED object.
-            NotFound: If document doesn't exist.
+            NotFound: If document doesn't exist, or source='cache' and no
+                     recent snapshot is cached.
 
         State Transitions:
             ATTACHED -> LOADED
@@ -218,14 +361,80 @@ class AsyncFireObject(BaseFireObject):
                 return user.credits
             credits = await read_user(transaction)
         """
-        if self._should_skip_fetch(force):
+        # Only LOADED and ATTACHED objects can be fetched; LOADED ones are
+        # already current unless a refresh is forced
+        state = self._state
+        if state is _LOADED:
+            if not force:
+                return self
+        elif state is not _ATTACHED:
+            self._validate_has_document("fetch()")
+
+        if force:
+            invalidate(self._doc_ref, recent=False)
+            if (
+                if_modified
+                and transaction is None
+                and source == 'server'
+                and await self._unmodified_on_server()
+            ):
+                return self
+
+        if not prefetch_collections:
+            snapshot = await self._read_snapshot(transaction, source)
+            self._process_snapshot(snapshot, is_async=True)
             return self
 
-        snapshot = await self._get_snapshot(transaction)
+        snapshot, collection_ids = await asyncio.gather(
+            self._read_snapshot(transaction, source),
+            self._list_collection_ids(),
+        )
         self._process_snapshot(snapshot, is_async=True)
+        object.__setattr__(self, '_prefetched_collections', collection_ids)
 
         return self
 
+    @classmethod
+    async def fetch_many(
+        cls,
+        objects: Iterable['AsyncFireObject'],
+        force: bool = False,
+        *,
+        missing_ok: bool = False,
+    ) -> List['AsyncFireObject']:
+        """
+        Fetch several documents with a single get_all() round-trip.
+
+        Async counterpart of FireObject.fetch_many().
+
+        Args:
+            objects: AsyncFireObjects to fetch. They must share a client.
+            force: If True, also refresh objects that are already LOADED.
+            missing_ok: If True, leave objects for documents that don't
+                       exist ATTACHED instead of raising NotFound.
+
+        Returns:
+            The objects, as a list in the order given.
+
+        Raises:
+            ValueError: If any object is DETACHED.
+            RuntimeError: If any object is DELETED.
+            NotFound: If some documents don't exist and missing_ok is False.
+                     All existing documents are still loaded before this is
+                     raised.
+
+        Example:
+            users = [db.doc(f'users/{uid}') for uid in user_ids]
+            await AsyncFireObject.fetch_many(users)  # One RPC
+        """
+        objects = list(objects)
+        pending, refs, snapshots = cls._plan_fetch_many(objects, force)
+        if refs:
+            async for snapshot in refs[0]._client.get_all(refs):
+                snapshots.append(snapshot)
+        cls._hydrate_fetch_many(pending, snapshots, is_async=True, missing_ok=missing_ok)
+        return objects
+
     async def save(
         self,
         doc_id: Optional[str] = None,
@@ -235,6 +444,12 @@ class AsyncFireObject(BaseFireObject):
         """
         Save the object's data to Firestore asynchronously.
 
+        Saving an ATTACHED object with no assigned fields makes no network
+        call: it neither creates an empty document nor wipes an existing one,
+        and the object stays ATTACHED. Assigned fields on an ATTACHED object
+        are written with a full set() rather than set(merge=True), so the
+        object's data matches the stored document once it becomes LOADED.
+
         Args:
             doc_id: Optional custom document ID for DETACHED objects.
             transaction: Optional transaction object for transactional writes.
@@ -252,6 +467,8 @@ class AsyncFireObject(BaseFireObject):
         State Transitions:
             DETACHED -> LOADED (creates new document)
             LOADED -> LOADED (updates if dirty)
+            ATTACHED -> LOADED (overwrites with the assigned fields)
+            ATTACHED -> ATTACHED (no-op if no fields were assigned)
 
         Example:
             # Normal save
@@ -276,27 +493,31 @@ class AsyncFireObject(BaseFireObject):
         """
         self._validate_not_deleted("save()")
 
-        if self._state == State.DETACHED:
+        state = self._state
+        if state is _DETACHED:
             doc_ref, storage_data = self._prepare_detached_save(doc_id, transaction, batch)
             await self._write_set(storage_data, doc_ref=doc_ref)
-            object.__setattr__(self, '_state', State.LOADED)
-            self._mark_clean()
+            self._transition_loaded_clean()
             return self
 
-        if self._state == State.LOADED:
+        if state is _LOADED:
             if not self.is_dirty():
                 return self
 
             update_dict = self._build_update_dict()
             await self._write_update(update_dict, transaction=transaction, batch=batch)
-            self._mark_clean()
+            self._transition_loaded_clean()
             return self
 
-        if self._state == State.ATTACHED:
+        if state is _ATTACHED:
+            # Nothing was fetched or modified, so a set() would only wipe
+            # the stored document; stay ATTACHED and skip the write
+            if not self.is_dirty():
+                return self
+
             storage_data = self._prepare_data_for_storage()
             await self._write_set(storage_data, transaction=transaction, batch=batch)
-            object.__setattr__(self, '_state', State.LOADED)
-            self._mark_clean()
+            self._transition_loaded_clean()
             return self
 
         return self
@@ -311,16 +532,22 @@ class AsyncFireObject(BaseFireObject):
         Returns:
             List of subcollection names or AsyncFireCollection wrappers.
         """
-        self._validate_not_detached("collections()")
-        self._validate_not_deleted("collections()")
+        self._validate_has_document("collections()")
 
-        results: List[Any] = []
-        async for subcollection_ref in self._doc_ref.collections():
-            if names_only:
-                results.append(subcollection_ref.id)
-            else:
-                results.append(self.collection(subcollection_ref.id))
-        return results
+        collection_ids = self._prefetched_collections
+        if collection_ids is None:
+            collection_ids = await self._list_collection_ids()
+        else:
+            object.__setattr__(self, '_prefetched_collections', None)
+
+        if names_only:
+            return collection_ids
+
+        return [self.collection(name) for name in collection_ids]
+
+    async def _list_collection_ids(self) -> List[str]:
+        """List the IDs of this document's subcollections asynchronously."""
+        return [col.id async for col in self._doc_ref.collections()]
 
     async def delete(
         self,
@@ -328,6 +555,8 @@ class AsyncFireObject(BaseFireObject):
         *,
         recursive: bool = True,
         batch_size: int = 50,
+        max_concurrency: int = 8,
+        subcollection_ids: Optional[Iterable[str]] = None,
     ) -> None:
         """
         Delete the document from Firestore asynchronously.
@@ -337,11 +566,21 @@ class AsyncFireObject(BaseFireObject):
                   the delete will be accumulated in the batch (committed later).
             recursive: When True (default), delete all subcollections first.
             batch_size: Batch size to use for recursive subcollection cleanup.
+            max_concurrency: Maximum number of subcollections (or, with
+                            subcollection_ids, delete batches) cleared
+                            concurrently during recursive deletion. Use 1 to
+                            clear them serially.
+            subcollection_ids: Optional collection IDs to clear with one
+                              collection-group query each instead of walking
+                              the subcollection tree level by level. Only
+                              descendants in collections with these IDs (at
+                              any depth) are deleted.
 
         Raises:
             ValueError: If called on DETACHED object.
             RuntimeError: If called on DELETED object.
-            ValueError: If recursive deletion is requested while using a batch.
+            ValueError: If recursive deletion is requested while using a batch,
+                       or if batch_size or max_concurrency is not positive.
 
         State Transitions:
             ATTACHED -> DELETED
@@ -362,18 +601,88 @@ class AsyncFireObject(BaseFireObject):
                 raise ValueError("Cannot delete recursively as part of a batch.")
             if batch_size <= 0:
                 raise ValueError(f"batch_size must be positive, got {batch_size}")
-            await self._delete_descendant_collections(batch_size=batch_size)
+            if max_concurrency <= 0:
+                raise ValueError(f"max_concurrency must be positive, got {max_concurrency}")
+            if subcollection_ids is not None:
+                await self._delete_collection_group_descendants(
+                    subcollection_ids, batch_size, max_concurrency
+                )
+            else:
+                await self._delete_descendant_collections(
+                    batch_size=batch_size, max_concurrency=max_concurrency
+                )
 
         self._prepare_delete()
         await self._write_delete(batch=batch)
         self._transition_to_deleted()
 
-    async def _delete_descendant_collections(self, batch_size: int) -> None:
-        """Delete all subcollections beneath this document asynchronously."""
+    async def _delete_collection_group_descendants(
+        self, collection_ids: Iterable[str], batch_size: int, max_concurrency: int = 8
+    ) -> None:
+        """
+        Delete descendants in the given collection groups asynchronously.
+
+        Async counterpart of FireObject._delete_collection_group_descendants():
+        only document IDs are fetched, and up to max_concurrency batches of
+        batch_size deletes are committed at once. The first failure cancels
+        the remaining commits and is re-raised.
+        """
+        client = self._doc_ref._client
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def commit(refs: List[Any]) -> None:
+            async with semaphore:
+                batch = client.batch()
+                for ref in refs:
+                    batch.delete(ref)
+                await batch.commit()
+
+        tasks = []
+        try:
+            refs: List[Any] = []
+            for collection_id in collection_ids:
+                async for snapshot in self._descendant_group_query(collection_id).stream():
+                    refs.append(snapshot.reference)
+                    if len(refs) == batch_size:
+                        tasks.append(asyncio.ensure_future(commit(refs)))
+                        refs = []
+            if refs:
+                tasks.append(asyncio.ensure_future(commit(refs)))
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    async def _delete_descendant_collections(
+        self, batch_size: int, max_concurrency: int = 8
+    ) -> None:
+        """
+        Delete all subcollections beneath this document asynchronously.
+
+        Subcollections are independent, so up to max_concurrency of them are
+        cleared at once. The first failure cancels the remaining work and is
+        re-raised.
+        """
         names = await self.collections(names_only=True)
-        for name in names:
-            subcollection = self.collection(name)
-            await subcollection.delete_all(batch_size=batch_size, recursive=True)
+        if len(names) <= 1 or max_concurrency == 1:
+            for name in names:
+                await self.collection(name).delete_all(batch_size=batch_size, recursive=True)
+            return
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def clear(name: str) -> None:
+            async with semaphore:
+                await self.collection(name).delete_all(batch_size=batch_size, recursive=True)
+
+        tasks = [asyncio.ensure_future(clear(name)) for name in names]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
 
     # =========================================================================
     # Subcollection Utilities
@@ -410,12 +719,140 @@ class AsyncFireObject(BaseFireObject):
     # Factory Methods
     # =========================================================================
 
+    @classmethod
+    @asynccontextmanager
+    async def bulk(cls, client: Any, batch_size: int = MAX_BATCH_SIZE) -> AsyncIterator[None]:
+        """
+        Route save() and delete() writes through batched commits.
+
+        Async counterpart of FireObject.bulk(). Inside the block, every
+        write made by save() or delete() in this task (and tasks it starts)
+        without an explicit transaction or batch is added to a native
+        AsyncWriteBatch, committed every batch_size writes and once more
+        when the block exits normally.
+
+        Args:
+            client: The native google.cloud.firestore.AsyncClient, or an
+                   AsyncFireProx instance wrapping one.
+            batch_size: Writes per commit (1-500). Default is 500, the
+                       Firestore limit.
+
+        Raises:
+            ValueError: If batch_size is outside 1-500, or (from save() or
+                       delete() inside the block) if a document belongs to
+                       another project or database than client.
+
+        Example:
+            async with AsyncFireObject.bulk(db):
+                for i in range(1000):
+                    user = users.new()
+                    user.name = f'User {i}'
+                    await user.save()  # Queued, committed in chunks of 500
+
+        Note:
+            See FireObject.bulk(); the same caveats about state transitions,
+            errors and recursive deletes apply.
+        """
+        if not 0 < batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {MAX_BATCH_SIZE}, got {batch_size}")
+
+        if _bulk_writer.get() is not None:
+            yield
+            return
+
+        native_client = getattr(client, 'native_client', client)
+        writer = _AsyncBulkWriter(native_client, batch_size)
+        token = _bulk_writer.set(writer)
+        try:
+            yield
+            await writer.flush()
+        finally:
+            _bulk_writer.reset(token)
+
+    @classmethod
+    async def save_many(
+        cls,
+        objects: Iterable['AsyncFireObject'],
+        client: Optional[Any] = None,
+        batch_size: int = MAX_BATCH_SIZE,
+    ) -> List['AsyncFireObject']:
+        """
+        Save several objects with batched commits.
+
+        Async counterpart of FireObject.save_many().
+
+        Args:
+            objects: AsyncFireObjects to save.
+            client: Native async client (or AsyncFireProx) used for the
+                   batches. Defaults to the first object's client.
+            batch_size: Writes per commit (1-500).
+
+        Returns:
+            The objects, as a list in the order given.
+
+        Raises:
+            ValueError: If batch_size is outside 1-500, or if a DETACHED
+                       object has no parent collection.
+            RuntimeError: If any object is DELETED.
+
+        Example:
+            await AsyncFireObject.save_many(users)
+        """
+        objects = list(objects)
+        if not objects:
+            return objects
+
+        async with cls.bulk(client or objects[0]._native_client(), batch_size):
+            for obj in objects:
+                await obj.save()
+        return objects
+
+    @classmethod
+    async def delete_many(
+        cls,
+        objects: Iterable['AsyncFireObject'],
+        client: Optional[Any] = None,
+        batch_size: int = MAX_BATCH_SIZE,
+        *,
+        recursive: bool = True,
+    ) -> None:
+        """
+        Delete several documents with batched commits.
+
+        Async counterpart of FireObject.delete_many().
+
+        Args:
+            objects: AsyncFireObjects to delete.
+            client: Native async client (or AsyncFireProx) used for the
+                   batches. Defaults to the first object's client.
+            batch_size: Writes per commit (1-500).
+            recursive: When True (default), each document's subcollections
+                      are cleared first, immediately and outside the batches.
+
+        Raises:
+            ValueError: If batch_size is outside 1-500, or if any object
+                       is DETACHED.
+            RuntimeError: If any object is already DELETED.
+
+        Example:
+            await AsyncFireObject.delete_many(old_users, recursive=False)
+        """
+        objects = list(objects)
+        if not objects:
+            return
+
+        async with cls.bulk(client or objects[0]._native_client(), batch_size):
+            for obj in objects:
+                await obj.delete(recursive=recursive)
+
     @classmethod
     def from_snapshot(
         cls,
         snapshot: DocumentSnapshot,
         parent_collection: Optional[Any] = None,
-        sync_client: Optional[Any] = None
+        sync_client: Optional[Any] = None,
+        *,
+        copy: bool = True,
     ) -> 'AsyncFireObject':
         """
         Create an AsyncFireObject from a DocumentSnapshot.
@@ -424,6 +861,8 @@ class AsyncFireObject(BaseFireObject):
             snapshot: DocumentSnapshot from native async API.
             parent_collection: Optional parent collection reference.
             sync_client: Optional sync Firestore client for async lazy loading.
+            copy: If False, skip the deep copy made by snapshot.to_dict();
+                 see FireObject.from_snapshot().
 
         Returns:
             AsyncFireObject in LOADED state.
@@ -435,16 +874,11 @@ class AsyncFireObject(BaseFireObject):
             async for doc in query.stream():
                 user = AsyncFireObject.from_snapshot(doc)
         """
-        init_data = cls._create_from_snapshot_base(snapshot, parent_collection, sync_client)
-
-        obj = cls(
-            doc_ref=init_data['doc_ref'],
-            initial_state=init_data['initial_state'],
-            parent_collection=init_data['parent_collection'],
-            sync_client=sync_client
+        doc_ref, data = cls._create_from_snapshot_base(
+            snapshot, parent_collection, sync_client, copy=copy
         )
 
-        object.__setattr__(obj, '_data', init_data['data'])
-        # Dirty tracking is already cleared by __init__ and _transition_to_loaded
-
-        return obj
+        # Dirty tracking starts empty
+        return cls._new_loaded(
+            doc_ref, data, parent_collection, sync_client, snapshot.update_time
+        )
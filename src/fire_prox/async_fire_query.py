@@ -6,7 +6,8 @@ Firestore AsyncQuery objects and provides a chainable interface for building and
 executing async queries.
 """
 
-from typing import Any, AsyncIterator, Dict, List, Optional, Union
+import asyncio
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Union
 
 from google.cloud.firestore_v1.async_document import AsyncDocumentReference
 from google.cloud.firestore_v1.async_query import AsyncQuery
@@ -14,6 +15,9 @@ from google.cloud.firestore_v1.base_query import FieldFilter
 from google.cloud.firestore_v1.document import DocumentReference
 
 from .async_fire_object import AsyncFireObject
+from .base_fire_object import _SCALAR_TYPES
+from .base_fire_query import order_direction, shard_cursors, validate_operator
+from .request_cache import recent_query_results, store_query_results
 
 
 class AsyncFireQuery:
@@ -56,6 +60,9 @@ class AsyncFireQuery:
             results = [AsyncFireObject.from_snapshot(snap) async for snap in native_query.stream()]
     """
 
+    # Every builder call creates a new query, so keep instances small
+    __slots__ = ('_query', '_parent_collection', '_projection')
+
     def __init__(
         self,
         native_query: AsyncQuery,
@@ -93,13 +100,16 @@ class AsyncFireQuery:
                 '<' (less than), '<=' (less than or equal),
                 '>' (greater than), '>=' (greater than or equal),
                 'in' (value in list), 'not-in' (value not in list),
-                'array-contains' (array contains value),
-                'array-contains-any' (array contains any of the values).
+                'array_contains' (array contains value),
+                'array_contains_any' (array contains any of the values).
             value: The value to compare against.
 
         Returns:
             A new AsyncFireQuery instance with the added filter.
 
+        Raises:
+            ValueError: If op is not a supported comparison operator.
+
         Example:
             # Single condition
             query = users.where('birth_year', '>', 1800)
@@ -109,6 +119,8 @@ class AsyncFireQuery:
                      .where('birth_year', '>', 1800)
                      .where('country', '==', 'England'))
         """
+        validate_operator(op)
+
         # Create FieldFilter and add to query
         filter_obj = FieldFilter(field, op, value)
         new_query = self._query.where(filter=filter_obj)
@@ -140,17 +152,7 @@ class AsyncFireQuery:
                      .order_by('country')
                      .order_by('birth_year', direction='DESCENDING'))
         """
-        # Convert direction string to Query constant
-        if direction.upper() == 'ASCENDING':
-            from google.cloud.firestore_v1 import Query as QueryClass
-            direction_const = QueryClass.ASCENDING
-        elif direction.upper() == 'DESCENDING':
-            from google.cloud.firestore_v1 import Query as QueryClass
-            direction_const = QueryClass.DESCENDING
-        else:
-            raise ValueError(f"Invalid direction: {direction}. Must be 'ASCENDING' or 'DESCENDING'")
-
-        new_query = self._query.order_by(field, direction=direction_const)
+        new_query = self._query.order_by(field, direction=order_direction(direction))
         return AsyncFireQuery(new_query, self._parent_collection, self._projection)
 
     def limit(self, count: int) -> 'AsyncFireQuery':
@@ -212,8 +214,7 @@ class AsyncFireQuery:
             last_snapshot = await last_doc_ref.get()
             page2 = await users.order_by('age').start_at(last_snapshot).limit(10).get()
         """
-        new_query = self._query.start_at(*document_fields_or_snapshot)
-        return AsyncFireQuery(new_query, self._parent_collection, self._projection)
+        return self._with_cursor('start_at', document_fields_or_snapshot)
 
     def start_after(self, *document_fields_or_snapshot) -> 'AsyncFireQuery':
         """
@@ -243,8 +244,7 @@ class AsyncFireQuery:
             last_snapshot = await last_doc_ref.get()
             page2 = await users.order_by('age').start_after(last_snapshot).limit(10).get()
         """
-        new_query = self._query.start_after(*document_fields_or_snapshot)
-        return AsyncFireQuery(new_query, self._parent_collection, self._projection)
+        return self._with_cursor('start_after', document_fields_or_snapshot)
 
     def end_at(self, *document_fields_or_snapshot) -> 'AsyncFireQuery':
         """
@@ -271,8 +271,7 @@ class AsyncFireQuery:
             target_snapshot = await target_doc_ref.get()
             query = users.order_by('age').end_at(target_snapshot)
         """
-        new_query = self._query.end_at(*document_fields_or_snapshot)
-        return AsyncFireQuery(new_query, self._parent_collection, self._projection)
+        return self._with_cursor('end_at', document_fields_or_snapshot)
 
     def end_before(self, *document_fields_or_snapshot) -> 'AsyncFireQuery':
         """
@@ -299,8 +298,7 @@ class AsyncFireQuery:
             target_snapshot = await target_doc_ref.get()
             query = users.order_by('age').end_before(target_snapshot)
         """
-        new_query = self._query.end_before(*document_fields_or_snapshot)
-        return AsyncFireQuery(new_query, self._parent_collection, self._projection)
+        return self._with_cursor('end_before', document_fields_or_snapshot)
 
     def select(self, *field_paths: str) -> 'AsyncFireQuery':
         """
@@ -357,7 +355,7 @@ class AsyncFireQuery:
             raise ValueError("select() requires at least one field path")
 
         # Create new query with projection
-        new_query = self._query.select(list(field_paths))
+        new_query = self._query.select(field_paths)
         return AsyncFireQuery(new_query, self._parent_collection, projection=field_paths)
 
     def find_nearest(
@@ -408,12 +406,10 @@ class AsyncFireQuery:
             - Maximum limit is 1000 documents
             - Does not work with Firestore emulator (production only)
         """
-        # Create vector query using native find_nearest
+        # Create vector query using native find_nearest (note the native
+        # argument order puts limit before distance_measure)
         new_query = self._query.find_nearest(
-            vector_field=vector_field,
-            query_vector=query_vector,
-            distance_measure=distance_measure,
-            limit=limit,
+            vector_field, query_vector, limit, distance_measure,
             distance_result_field=distance_result_field,
         )
         return AsyncFireQuery(new_query, self._parent_collection, self._projection)
@@ -694,6 +690,21 @@ class AsyncFireQuery:
     # Helper Methods
     # =========================================================================
 
+    def _with_cursor(self, cursor: str, document_fields_or_snapshot: tuple) -> 'AsyncFireQuery':
+        """
+        Return a new query with a start or end cursor applied.
+
+        Args:
+            cursor: Name of the native Query cursor method ('start_at',
+                   'start_after', 'end_at' or 'end_before').
+            document_fields_or_snapshot: Arguments for that method.
+
+        Returns:
+            A new AsyncFireQuery with the cursor applied.
+        """
+        new_query = getattr(self._query, cursor)(*document_fields_or_snapshot)
+        return AsyncFireQuery(new_query, self._parent_collection, self._projection)
+
     def _convert_projection_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Convert DocumentReferences in projection data to AsyncFireObjects.
@@ -713,7 +724,9 @@ class AsyncFireQuery:
 
         result = {}
         for key, value in data.items():
-            if isinstance(value, (DocumentReference, AsyncDocumentReference)):
+            if type(value) in _SCALAR_TYPES:
+                result[key] = value
+            elif isinstance(value, (DocumentReference, AsyncDocumentReference)):
                 # Convert DocumentReference/AsyncDocumentReference to AsyncFireObject in ATTACHED state
                 result[key] = AsyncFireObject(
                     doc_ref=value,
@@ -740,11 +753,26 @@ class AsyncFireQuery:
                 result[key] = value
         return result
 
+    async def _read_snapshots(self) -> List[Any]:
+        """
+        Run the query to completion and release its stream.
+
+        The stream is closed even if reading fails part-way, so the gRPC
+        call is cancelled right away instead of staying open until the
+        iterator is garbage collected. Results are fully read before any
+        hydration starts.
+        """
+        snapshot_stream = self._query.stream()
+        try:
+            return [snapshot async for snapshot in snapshot_stream]
+        finally:
+            await snapshot_stream.aclose()
+
     # =========================================================================
     # Query Execution Methods
     # =========================================================================
 
-    async def get(self) -> Union[List[AsyncFireObject], List[Dict[str, Any]]]:
+    async def get(self, max_age: Optional[float] = None) -> Union[List[AsyncFireObject], List[Dict[str, Any]]]:
         """
         Execute the query and return results as a list.
 
@@ -753,6 +781,13 @@ class AsyncFireQuery:
         (via .select()), returns vanilla dictionaries instead of AsyncFireObject
         instances.
 
+        Args:
+            max_age: If given, reuse the results of an identical query run
+                    within the last max_age seconds instead of querying
+                    Firestore again. Results may be stale by up to max_age;
+                    writes do not invalidate them. Each call still returns
+                    fresh objects.
+
         Returns:
             - If no projection: List of AsyncFireObject instances for all documents
               matching the query.
@@ -777,24 +812,110 @@ class AsyncFireQuery:
                 print(f"Found {len(results)} users")
             else:
                 print("No users found")
+
+            # Dashboard refresh: tolerate results up to 5 seconds old
+            top = await query.order_by('score', direction='DESCENDING').limit(10).get(max_age=5)
         """
-        # Execute query
-        results = []
+        # Execute query, or reuse recent results for an identical one
+        copy = False
+        if max_age is None:
+            snapshots = await self._read_snapshots()
+        else:
+            snapshots = recent_query_results(self._query, max_age)
+            if snapshots is None:
+                snapshots = await self._read_snapshots()
+                store_query_results(self._query, snapshots)
+            # Cached snapshots are shared between calls, so objects need their own data
+            copy = True
 
         # If projection is active, return vanilla dictionaries
         if self._projection:
-            async for snap in self._query.stream():
-                data = snap.to_dict()
-                # Convert DocumentReferences to AsyncFireObjects
-                converted_data = self._convert_projection_data(data)
-                results.append(converted_data)
-            return results
+            convert = self._convert_projection_data
+            if copy:
+                # Cached snapshots are shared between calls, so convert a
+                # deep copy that the caller is free to mutate
+                return [convert(snap.to_dict()) for snap in snapshots]
+            # Fresh snapshots are not reused, so read their data directly
+            # instead of deep-copying it with to_dict() first
+            return [convert(snap._data) for snap in snapshots]
 
         # Otherwise, return AsyncFireObjects as usual
-        async for snapshot in self._query.stream():
-            obj = AsyncFireObject.from_snapshot(snapshot, self._parent_collection)
-            results.append(obj)
-        return results
+        from_snapshot = AsyncFireObject.from_snapshot
+        parent_collection = self._parent_collection
+        return [from_snapshot(snapshot, parent_collection, copy=copy) for snapshot in snapshots]
+
+    @classmethod
+    async def get_many(
+        cls,
+        queries: Iterable['AsyncFireQuery'],
+        max_age: Optional[float] = None,
+    ) -> List[Union[List[AsyncFireObject], List[Dict[str, Any]]]]:
+        """
+        Execute independent queries concurrently.
+
+        The queries run together on the event loop, so N queries take about
+        as long as the slowest one instead of the sum of all of them.
+
+        Args:
+            queries: The queries to execute.
+            max_age: Passed through to each query's get().
+
+        Returns:
+            One result list per query, in the order given.
+
+        Example:
+            active, admins = await AsyncFireQuery.get_many([
+                users.where('active', '==', True),
+                users.where('role', '==', 'admin'),
+            ])
+        """
+        return list(await asyncio.gather(*(query.get(max_age) for query in queries)))
+
+    async def get_parallel(
+        self,
+        shard_field: str,
+        boundaries: Sequence[Any],
+    ) -> Union[List[AsyncFireObject], List[Dict[str, Any]]]:
+        """
+        Execute the query as parallel shards and return results as a list.
+
+        Splits the query into contiguous ranges of shard_field at the given
+        boundaries and runs one sub-query per range concurrently.
+        Results are concatenated in shard order, so they match get() for
+        the same query. Useful for large result sets, where a single
+        query stream is bound by one round-trip at a time.
+
+        The query must be ordered by shard_field first and must not have
+        a limit, offset or cursor of its own.
+
+        Args:
+            shard_field: The field to shard on; the query's first order_by().
+            boundaries: Split points in the same order as the query's
+                       ordering on shard_field. N boundaries give N + 1
+                       shards.
+
+        Returns:
+            The same list get() would return.
+
+        Raises:
+            ValueError: If the query can't be sharded on shard_field.
+
+        Example:
+            # Dump a collection in four concurrent ranges
+            query = users_collection.order_by('birth_year')
+            users = await query.get_parallel('birth_year', [1850, 1900, 1950])
+        """
+        shards = []
+        for start, end in shard_cursors(self._query, shard_field, boundaries):
+            shard = self
+            if start is not None:
+                shard = shard.start_at(start)
+            if end is not None:
+                shard = shard.end_before(end)
+            shards.append(shard)
+
+        results = await asyncio.gather(*(shard.get() for shard in shards))
+        return [item for shard_results in results for item in shard_results]
 
     async def stream(self) -> Union[AsyncIterator[AsyncFireObject], AsyncIterator[Dict[str, Any]]]:
         """
@@ -831,14 +952,14 @@ class AsyncFireQuery:
         # If projection is active, stream vanilla dictionaries
         if self._projection:
             async for snapshot in self._query.stream():
-                data = snapshot.to_dict()
-                # Convert DocumentReferences to AsyncFireObjects
-                converted_data = self._convert_projection_data(data)
+                # The conversion builds new containers, so read the snapshot's
+                # data directly instead of deep-copying it with to_dict() first
+                converted_data = self._convert_projection_data(snapshot._data)
                 yield converted_data
         else:
             # Otherwise, stream AsyncFireObjects as usual
             async for snapshot in self._query.stream():
-                yield AsyncFireObject.from_snapshot(snapshot, self._parent_collection)
+                yield AsyncFireObject.from_snapshot(snapshot, self._parent_collection, copy=False)
 
     # =========================================================================
     # Real-Time Listeners (Sync-only via sync_client)
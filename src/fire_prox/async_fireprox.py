@@ -5,13 +5,54 @@ This module provides the AsyncFireProx class, which serves as the primary interf
 for users to interact with Firestore asynchronously through the FireProx API.
 """
 
-from typing import Any, Dict
+import os
+from collections import OrderedDict
+from contextlib import AbstractAsyncContextManager
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Union
 
+from google.cloud import firestore
 from google.cloud.firestore import AsyncClient as AsyncFirestoreClient
 
 from .async_fire_collection import AsyncFireCollection
-from .async_fire_object import AsyncFireObject
-from .base_fireprox import BaseFireProx
+from .async_fire_object import MAX_BATCH_SIZE, AsyncFireObject
+from .async_fire_query import AsyncFireQuery
+from .base_fireprox import BaseFireProx, _cached_ref
+
+# Number of companion sync clients (and their gRPC channels) kept alive
+COMPANION_CLIENT_CACHE_SIZE = 8
+
+
+@lru_cache(maxsize=COMPANION_CLIENT_CACHE_SIZE)
+def _cached_companion_client(
+    project: str,
+    database: str,
+    emulator_host: Optional[str],
+    credentials_file: Optional[str],
+) -> firestore.Client:
+    # emulator_host and credentials_file are only part of the cache key:
+    # firestore.Client reads both from the environment itself
+    return firestore.Client(project=project, database=database)
+
+
+def _companion_sync_client(project: str, database: str) -> firestore.Client:
+    """
+    Return the shared sync client used for lazy loading against a database.
+
+    Building a client resolves credentials, and each client opens its own
+    gRPC channel on first use. Sharing one keeps AsyncFireProx instances
+    created per request from repeating that work. Clients are keyed by the
+    project and database plus the FIRESTORE_EMULATOR_HOST and
+    GOOGLE_APPLICATION_CREDENTIALS settings they were built with, so
+    changing either yields a new client, and at most
+    COMPANION_CLIENT_CACHE_SIZE clients are kept.
+    """
+    return _cached_companion_client(
+        project,
+        database,
+        os.environ.get('FIRESTORE_EMULATOR_HOST'),
+        os.environ.get('GOOGLE_APPLICATION_CREDENTIALS'),
+    )
 
 
 class AsyncFireProx(BaseFireProx):
@@ -51,7 +92,9 @@ class AsyncFireProx(BaseFireProx):
         await user.delete()
     """
 
-    def __init__(self, client: AsyncFirestoreClient):
+    def __init__(
+        self, client: AsyncFirestoreClient, pool: Optional[Iterable[AsyncFirestoreClient]] = None
+    ):
         """
         Initialize AsyncFireProx with a native async Firestore client.
 
@@ -59,9 +102,25 @@ class AsyncFireProx(BaseFireProx):
             client: A configured google.cloud.firestore.AsyncClient instance.
                    Authentication and project configuration should be handled
                    before creating this instance.
+            pool: Optional extra google.cloud.firestore.AsyncClient instances
+                 for the same project and database. Direct fetch(), save()
+                 and delete() calls on documents from this instance rotate
+                 between client and the pooled clients; see FireProx.
+                 Lazy loading still uses the companion sync client.
 
         Raises:
-            TypeError: If client is not a google.cloud.firestore.AsyncClient.
+            TypeError: If client or a pooled client is not a
+                      google.cloud.firestore.AsyncClient.
+            ValueError: If a pooled client uses another project or database,
+                       or client already has a pool from another FireProx.
+
+        Note:
+            Every collection, query and document created from this instance
+            uses its client, and each native client owns its own gRPC channel.
+            Create one AsyncClient per process (per event loop) and share one
+            AsyncFireProx across requests. The companion sync client used for
+            lazy loading is already shared between instances for the same
+            project, database, emulator host and credentials file.
 
         Example:
             from google.cloud import firestore
@@ -82,15 +141,12 @@ class AsyncFireProx(BaseFireProx):
                 f"got {type(client)}"
             )
 
-        super().__init__(client)
+        super().__init__(client, pool)
 
-            # Create companion sync client for lazy loading
-        # Both clients point to the same Firestore backend
-        from google.cloud import firestore
-        self._sync_client = firestore.Client(
-            project=client.project,
-            database=client._database
-        )
+        # Companion sync client for lazy loading, pointing at the same
+        # Firestore backend and shared between instances
+        self._sync_client = _companion_sync_client(client.project, client._database)
+        self._sync_document_refs: 'OrderedDict[str, Any]' = OrderedDict()
 
     # =========================================================================
     # Document Access
@@ -178,6 +234,30 @@ class AsyncFireProx(BaseFireProx):
         """
         return self._create_collection_proxy(path, AsyncFireCollection)
 
+    def collection_group(self, collection_id: str) -> AsyncFireQuery:
+        """
+        Query every collection with the given ID, at any depth.
+
+        Filtering, ordering and aggregation run on the server across all
+        matching subcollections, so there is no need to walk parent
+        documents and query each subcollection from Python.
+
+        Args:
+            collection_id: The collection ID to match, e.g. 'posts' for
+                          'users/*/posts'. Must not contain '/'.
+
+        Returns:
+            A AsyncFireQuery over all documents in matching collections.
+
+        Raises:
+            ValueError: If collection_id is empty or contains '/'.
+
+        Example:
+            # Count published posts across every user
+            published = await db.collection_group('posts').where('published', '==', True).count()
+        """
+        return AsyncFireQuery(self._collection_group_query(collection_id))
+
     async def collections(self, path: str, *, names_only: bool = False) -> list[Any]:
         """
         List subcollections beneath the specified document path asynchronously.
@@ -192,8 +272,58 @@ class AsyncFireProx(BaseFireProx):
         document = self.doc(path)
         return await document.collections(names_only=names_only)
 
+    async def fetch_many(
+        self,
+        documents: Iterable[Union[str, AsyncFireObject]],
+        force: bool = False,
+        *,
+        missing_ok: bool = False,
+    ) -> List[AsyncFireObject]:
+        """
+        Load several documents with one batched get.
+
+        Shorthand for AsyncFireObject.fetch_many() that also accepts paths.
+
+        Args:
+            documents: AsyncFireObjects or document paths.
+            force: If True, also refresh objects that are already LOADED.
+            missing_ok: If True, return objects for documents that don't
+                       exist in ATTACHED state instead of raising NotFound.
+
+        Returns:
+            AsyncFireObjects in the order given; LOADED unless missing.
+
+        Raises:
+            NotFound: If some documents don't exist and missing_ok is False.
+
+        Example:
+            ada, grace = await db.fetch_many(['users/alovelace', 'users/ghopper'])
+        """
+        objects = [self.doc(doc) if isinstance(doc, str) else doc for doc in documents]
+        return await AsyncFireObject.fetch_many(objects, force=force, missing_ok=missing_ok)
+
+    def bulk(self, batch_size: int = MAX_BATCH_SIZE) -> AbstractAsyncContextManager[None]:
+        """
+        Batch every save() and delete() made in this task inside a block.
+
+        Shorthand for AsyncFireObject.bulk(db, batch_size).
+
+        Args:
+            batch_size: Writes per commit (1-500). Default is 500.
+
+        Returns:
+            An async context manager; see AsyncFireObject.bulk().
+
+        Example:
+            async with db.bulk():
+                async for user in db.collection('users').get_all():
+                    user.active = False
+                    await user.save()  # Queued, committed in chunks of 500
+        """
+        return AsyncFireObject.bulk(self._client, batch_size)
+
     def _get_document_kwargs(self, path: str) -> Dict[str, Any]:
-        sync_doc_ref = self._sync_client.document(path)
+        sync_doc_ref = _cached_ref(self._sync_document_refs, path, self._sync_client.document)
         return {'sync_doc_ref': sync_doc_ref, 'sync_client': self._sync_client}
 
     def _get_collection_kwargs(self, path: str) -> Dict[str, Any]:
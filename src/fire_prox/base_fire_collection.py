@@ -5,7 +5,9 @@ This module contains the base class that implements all logic that is
 identical between synchronous and asynchronous FireCollection implementations.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+
+from google.cloud.firestore_v1.base_query import FieldFilter
 
 from .state import State
 
@@ -24,6 +26,10 @@ class BaseFireCollection:
     - Query methods (Phase 2)
     """
 
+    # Collection handles are created in bulk (one per subcollection access),
+    # so keep them dict-free. Subclasses declare empty __slots__.
+    __slots__ = ('_collection_ref', '_client', '_sync_client', '_select_cache', '_document')
+
     def __init__(
         self,
         collection_ref: Any,  # CollectionReference or AsyncCollectionReference
@@ -40,8 +46,12 @@ class BaseFireCollection:
             sync_client: Optional sync Firestore client for lazy loading (async only).
         """
         self._collection_ref = collection_ref
+        # Bound once: doc() is the hot path for handing out document proxies
+        self._document = collection_ref.document
         self._client = client
         self._sync_client = sync_client
+        # Native projection queries keyed by field paths (see _select_query)
+        self._select_cache: Dict[Tuple[str, ...], Any] = {}
 
     # =========================================================================
     # Document Factories (SHARED)
@@ -83,6 +93,50 @@ class BaseFireCollection:
         if batch_size <= 0:
             raise ValueError(f"batch_size must be positive, got {batch_size}")
 
+    # -------------------------------------------------------------------------
+    # Native query builders
+    # -------------------------------------------------------------------------
+
+    def _where_query(self, field: str, op: str, value: Any) -> Any:
+        """Return the native query filtering this collection on one field."""
+        return self._collection_ref.where(filter=FieldFilter(field, op, value))
+
+    def _order_by_query(self, field: str, direction: str) -> Any:
+        """Return the native query ordering this collection by one field."""
+        return self._collection_ref.order_by(field, direction=direction)
+
+    def _limit_query(self, count: int) -> Any:
+        """
+        Return the native query limiting this collection's results.
+
+        Raises:
+            ValueError: If count is not positive.
+        """
+        if count <= 0:
+            raise ValueError(f"Limit count must be positive, got {count}")
+        return self._collection_ref.limit(count)
+
+    def _select_query(self, field_paths: Tuple[str, ...]) -> Any:
+        """
+        Return the native projection query for the given field paths.
+
+        Native queries are immutable, so the query built for a projection is
+        cached on the collection and reused by later select() calls with the
+        same field paths. Field paths are plain strings, so the key is always
+        hashable and cannot conflate distinct projections.
+
+        Args:
+            field_paths: Tuple of field paths to project.
+
+        Returns:
+            A native Query with the projection applied.
+        """
+        native_query = self._select_cache.get(field_paths)
+        if native_query is None:
+            native_query = self._collection_ref.select(field_paths)
+            self._select_cache[field_paths] = native_query
+        return native_query
+
     def new(self) -> Any:
         """Create a new document proxy in DETACHED state."""
         return self._instantiate_object(
@@ -94,7 +148,7 @@ class BaseFireCollection:
 
     def doc(self, doc_id: str) -> Any:
         """Create a document proxy in ATTACHED state."""
-        doc_ref = self._collection_ref.document(doc_id)
+        doc_ref = self._document(doc_id)
         return self._instantiate_object(
             doc_ref=doc_ref,
             initial_state=State.ATTACHED,
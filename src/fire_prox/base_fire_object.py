@@ -5,15 +5,193 @@ This module contains the base class that implements all logic that is
 identical between synchronous and asynchronous FireObject implementations.
 """
 
-from typing import Any, Dict, Optional, Set
+from __future__ import annotations
+
+import itertools
+import os
+import string
+import sys
+import threading
+import weakref
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from google.cloud import firestore
 from google.cloud.exceptions import NotFound
 from google.cloud.firestore_v1.async_document import AsyncDocumentReference
 from google.cloud.firestore_v1.document import DocumentReference, DocumentSnapshot
+from google.cloud.firestore_v1.field_path import FieldPath
 
+from .request_cache import cached_snapshot, store_snapshot
 from .state import State
 
+# States bound once so hot paths can compare by identity (enum members are
+# singletons) instead of going through Enum.__eq__
+_DETACHED = State.DETACHED
+_ATTACHED = State.ATTACHED
+_LOADED = State.LOADED
+_DELETED = State.DELETED
+
+# Sentinel for _data lookups where None is a legitimate field value
+_MISSING = object()
+
+# Field value types that _materialize_value() always returns unchanged
+_SCALAR_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+# Read-only empty _data shared by objects that hold no fields yet (DETACHED
+# and ATTACHED), replaced by a real dict on the first write
+_EMPTY_DATA: Any = MappingProxyType({})
+
+
+# =========================================================================
+# Auto-generated document IDs
+# =========================================================================
+
+# Same alphabet and length as the native client's auto IDs
+_AUTO_ID_CHARS = string.ascii_letters + string.digits
+_AUTO_ID_LENGTH = 20
+_AUTO_ID_POOL_SIZE = 256
+
+# Maps random bytes onto the alphabet; bytes >= 248 (62 * 4) are dropped so
+# that every character is equally likely.
+_AUTO_ID_TABLE = (_AUTO_ID_CHARS * 5)[:256].encode('ascii')
+_AUTO_ID_REJECT = bytes(range(248, 256))
+
+_id_pool = threading.local()
+
+
+def _generate_auto_ids(count: int) -> List[str]:
+    """Generate count random document IDs from a single urandom read."""
+    needed = count * _AUTO_ID_LENGTH
+    chars = b''
+    while len(chars) < needed:
+        chars += os.urandom(needed).translate(_AUTO_ID_TABLE, _AUTO_ID_REJECT)
+    text = chars[:needed].decode('ascii')
+    return [text[i:i + _AUTO_ID_LENGTH] for i in range(0, needed, _AUTO_ID_LENGTH)]
+
+
+def _auto_id() -> str:
+    """
+    Return a random 20-character document ID.
+
+    IDs are drawn from a per-thread pool that is refilled
+    _AUTO_ID_POOL_SIZE at a time, instead of reading urandom for every
+    character as collection_ref.document() does.
+    """
+    pool = getattr(_id_pool, 'ids', None)
+    if not pool:
+        pool = _id_pool.ids = _generate_auto_ids(_AUTO_ID_POOL_SIZE)
+    return pool.pop()
+
+
+def _reset_id_pool() -> None:
+    # A forked child must not hand out the IDs left in its parent's pool
+    _id_pool.ids = None
+
+
+os.register_at_fork(after_in_child=_reset_id_pool)
+
+
+# Firestore rejects commits with more than 500 writes
+MAX_BATCH_SIZE = 500
+
+# Per-thread ATTACHED objects registered by prefetch() (keyed by id() and
+# held weakly, so objects the caller drops unaccessed do not accumulate) and
+# whether prefetch_scope() is collecting referenced documents
+_prefetch_local = threading.local()
+
+
+# =========================================================================
+# Client Pools
+# =========================================================================
+
+class _ClientPool:
+    """Round-robin over a FireProx's own client and its pool= clients."""
+
+    __slots__ = ('_owner', '_clients', '__weakref__')
+
+    def __init__(self, owner: Any, clients: List[Any]):
+        # Holding the owning client keeps its id() from being reused while
+        # the pool is registered under it
+        self._owner = owner
+        self._clients = itertools.cycle([owner, *clients])
+
+    def rebind(self, doc_ref: Any) -> Any:
+        """Return doc_ref bound to the next pooled client."""
+        pooled = next(self._clients)
+        if pooled is doc_ref._client:
+            return doc_ref
+        return pooled.document(doc_ref.path)
+
+
+# Pools keyed by id() of the native client whose FireProx owns them. Values
+# are held weakly, so a pool goes away with the FireProx that created it.
+_client_pools: 'weakref.WeakValueDictionary[int, _ClientPool]' = weakref.WeakValueDictionary()
+
+
+def _register_client_pool(client: Any, clients: Iterable[Any]) -> Optional[_ClientPool]:
+    """
+    Validate clients and register them as the pool for client.
+
+    Returns the pool, which the caller must keep alive, or None if clients
+    is empty.
+
+    Raises:
+        TypeError: If a pooled client is not the same type as client.
+        ValueError: If a pooled client targets another project or database,
+                   or client already has a pool owned by another FireProx.
+    """
+    clients = list(clients)
+    if not clients:
+        return None
+
+    for pooled in clients:
+        if not isinstance(pooled, type(client)):
+            raise TypeError(f"pool clients must be {type(client).__name__} instances, got {type(pooled)}")
+        if (pooled.project, pooled._database) != (client.project, client._database):
+            raise ValueError(
+                "pool clients must use the same project and database as the FireProx client, "
+                f"got {pooled.project}/{pooled._database}"
+            )
+    if id(client) in _client_pools:
+        raise ValueError("client already has a pool owned by another FireProx instance")
+
+    pool = _ClientPool(client, clients)
+    _client_pools[id(client)] = pool
+    return pool
+
+
+def _check_bulk_target(client: Any, doc_ref: Any) -> None:
+    """
+    Check that a bulk() writer bound to client can commit a write to doc_ref.
+
+    Raises:
+        ValueError: If doc_ref belongs to another project or database.
+    """
+    other = doc_ref._client
+    if other is not client and (other.project, other._database) != (client.project, client._database):
+        raise ValueError(
+            f"Cannot add a write to '{doc_ref.path}' ({other.project}/{other._database}) to a "
+            f"bulk() block for {client.project}/{client._database}; save it outside the block"
+        )
+
+
+def _direct_ref(doc_ref: Any) -> Any:
+    """
+    Return the reference to use for a direct read or write of doc_ref.
+
+    Documents whose client belongs to a FireProx created with pool= are
+    re-bound to the next pooled client; every other reference is returned
+    unchanged.
+    """
+    if not _client_pools:
+        return doc_ref
+    pool = _client_pools.get(id(doc_ref._client))
+    if pool is None:
+        return doc_ref
+    return pool.rebind(doc_ref)
+
 
 class BaseFireObject:
     """
@@ -34,11 +212,16 @@ class BaseFireObject:
     - __getattr__() - may need async support for lazy loading
     """
 
-    # Class-level constants for internal attribute names
-    _INTERNAL_ATTRS = {
+    # Internal state lives in slots rather than a per-instance __dict__, which
+    # makes proxies smaller and internal attribute reads cheaper.
+    __slots__ = (
         '_doc_ref', '_sync_doc_ref', '_sync_client', '_data', '_state', '_dirty_fields',
-        '_deleted_fields', '_atomic_ops', '_parent_collection', '_client', '_id', '_path'
-    }
+        '_deleted_fields', '_atomic_ops', '_parent_collection', '_client', '_id', '_path',
+        '_prefetched_collections', '_update_time', '__weakref__',
+    )
+
+    # Class-level constants for internal attribute names
+    _INTERNAL_ATTRS = frozenset(__slots__) - {'__weakref__'}
 
     def __init__(
         self,
@@ -64,9 +247,13 @@ class BaseFireObject:
         object.__setattr__(self, '_doc_ref', doc_ref)
         object.__setattr__(self, '_sync_doc_ref', sync_doc_ref)
         object.__setattr__(self, '_sync_client', sync_client)
-        object.__setattr__(self, '_data', {})
+        object.__setattr__(self, '_data', _EMPTY_DATA)
         object.__setattr__(self, '_parent_collection', parent_collection)
 
+        # Document ID and path, computed on first use of the id/path properties
+        object.__setattr__(self, '_id', None)
+        object.__setattr__(self, '_path', None)
+
         # Determine initial state
         if initial_state is not None:
             object.__setattr__(self, '_state', initial_state)
@@ -84,6 +271,14 @@ class BaseFireObject:
         # Store atomic operations (ArrayUnion, ArrayRemove, Increment) to apply on save
         object.__setattr__(self, '_atomic_ops', {})
 
+        # Subcollection IDs listed by fetch(prefetch_collections=True), consumed
+        # by the next collections() call
+        object.__setattr__(self, '_prefetched_collections', None)
+
+        # Server update_time of the snapshot _data was loaded from, used by
+        # fetch(force=True, if_modified=True) to skip unchanged documents
+        object.__setattr__(self, '_update_time', None)
+
     # =========================================================================
     # Firestore I/O Hooks (to be implemented by subclasses)
     # =========================================================================
@@ -123,12 +318,6 @@ class BaseFireObject:
     # Shared lifecycle helpers
     # =========================================================================
 
-    def _should_skip_fetch(self, force: bool) -> bool:
-        """Return True if a fetch can be skipped based on current state."""
-        self._validate_not_detached("fetch()")
-        self._validate_not_deleted("fetch()")
-        return self._state == State.LOADED and not force
-
     def _process_snapshot(self, snapshot: DocumentSnapshot, *, is_async: bool) -> None:
         """Populate internal state from a Firestore snapshot."""
         if not snapshot.exists:
@@ -143,15 +332,18 @@ class BaseFireObject:
             elif getattr(self, '_sync_client', None) is not None:
                 sync_client = self._sync_client
 
-        converted_data: Dict[str, Any] = {}
-        for key, value in data.items():
-            converted_data[key] = self._convert_snapshot_value_for_retrieval(
-                value,
-                is_async,
-                sync_client,
-            )
+        self._transition_to_loaded(self._convert_snapshot_data(data, is_async, sync_client))
+        object.__setattr__(self, '_update_time', snapshot.update_time)
 
-        self._transition_to_loaded(converted_data)
+    def _can_skip_refresh(self) -> bool:
+        """Whether a forced refresh may be skipped if the server copy is unchanged."""
+        return (
+            self._state is _LOADED
+            and self._update_time is not None
+            and not self._dirty_fields
+            and not self._deleted_fields
+            and not self._atomic_ops
+        )
 
     def _prepare_detached_save(
         self,
@@ -172,22 +364,26 @@ class BaseFireObject:
                 "Create the document first, then use batches for updates."
             )
 
+        if self._parent_collection is None:
+            raise ValueError("DETACHED object has no parent collection")
+
         doc_ref = self._create_document(doc_id)
         storage_data = self._prepare_data_for_storage()
         return doc_ref, storage_data
 
     def _build_update_dict(self) -> Dict[str, Any]:
         """Create the payload for partial updates on LOADED objects."""
-        update_dict: Dict[str, Any] = {}
-
-        for field in self._dirty_fields:
-            update_dict[field] = self._convert_value_for_storage(self._data[field])
+        # Values are converted here rather than at assignment time so that
+        # in-place changes to lists/dicts made after assignment are saved.
+        data = self._data
+        convert = self._convert_value_for_storage
+        update_dict: Dict[str, Any] = {field: convert(data[field]) for field in self._dirty_fields}
 
-        for field in self._deleted_fields:
-            update_dict[field] = firestore.DELETE_FIELD
+        if self._deleted_fields:
+            update_dict.update(dict.fromkeys(self._deleted_fields, firestore.DELETE_FIELD))
 
-        for field, operation in self._atomic_ops.items():
-            update_dict[field] = operation
+        if self._atomic_ops:
+            update_dict.update(self._atomic_ops)
 
         return update_dict
 
@@ -242,23 +438,56 @@ class BaseFireObject:
 
     def _materialize_field(self, name: str) -> Any:
         """Return a field value, materializing nested references as needed."""
-        if name not in self._data:
+        data = self._data
+        value = data.get(name, _MISSING)
+        if value is _MISSING:
             raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
+        # Scalars never hold references, so they can be returned as-is
+        if type(value) in _SCALAR_TYPES:
+            return value
+
         is_async = self._is_async_context()
         sync_client = self._get_sync_client_for_async() if is_async else None
-        value = self._data[name]
         converted = self._materialize_value(value, is_async=is_async, sync_client=sync_client)
 
         if converted is not value:
-            self._data[name] = converted
+            data[name] = converted
 
-        return self._data[name]
+        return converted
 
     def _prepare_delete(self) -> None:
         """Validate delete preconditions before performing I/O."""
-        self._validate_not_detached("delete()")
-        self._validate_not_deleted("delete()")
+        self._validate_has_document("delete()")
+
+    def _native_client(self) -> Any:
+        """Return the native client this object reads and writes through."""
+        if self._doc_ref is not None:
+            return self._doc_ref._client
+        if self._parent_collection is None:
+            raise ValueError("DETACHED object has no parent collection")
+        return self._parent_collection._collection_ref._client
+
+    def _descendant_group_query(self, collection_id: str) -> Any:
+        """
+        Build a collection-group query for this document's descendants.
+
+        The query is ordered by document name and bounded to this document's
+        path, and projects only the document ID so that no field data is
+        downloaded.
+        """
+        client = self._doc_ref._client
+        path = self.path
+        # Names sort segment by segment: every descendant of path falls
+        # between path itself and path/\uf8ff/\uf8ff
+        document_id = FieldPath.document_id()
+        return (
+            client.collection_group(collection_id)
+            .order_by(document_id)
+            .start_at([client.document(path)])
+            .end_at([client.document(path, '\uf8ff', '\uf8ff')])
+            .select([document_id])
+        )
 
     # =========================================================================
     # State Inspection (SHARED)
@@ -271,27 +500,26 @@ class BaseFireObject:
 
     def is_detached(self) -> bool:
         """Check if object is in DETACHED state."""
-        return self._state == State.DETACHED
+        return self._state is _DETACHED
 
     def is_attached(self) -> bool:
         """Check if object has a DocumentReference (ATTACHED or LOADED)."""
-        return self._state in (State.ATTACHED, State.LOADED)
+        state = self._state
+        return state is _ATTACHED or state is _LOADED
 
     def is_loaded(self) -> bool:
         """Check if object is in LOADED state."""
-        return self._state == State.LOADED
+        return self._state is _LOADED
 
     def is_deleted(self) -> bool:
         """Check if object is in DELETED state."""
-        return self._state == State.DELETED
+        return self._state is _DELETED
 
     def is_dirty(self) -> bool:
         """Check if object has unsaved changes."""
-        if self._state == State.DETACHED:
+        if self._state is _DETACHED:
             return True  # DETACHED is always dirty
-        return (len(self._dirty_fields) > 0 or
-                len(self._deleted_fields) > 0 or
-                len(self._atomic_ops) > 0)
+        return bool(self._dirty_fields or self._deleted_fields or self._atomic_ops)
 
     @property
     def dirty_fields(self) -> Set[str]:
@@ -310,12 +538,23 @@ class BaseFireObject:
     @property
     def id(self) -> Optional[str]:
         """Get document ID, or None if DETACHED."""
-        return self._doc_ref.id if self._doc_ref else None
+        # Cached like path; the reference never changes once assigned
+        doc_id = self._id
+        if doc_id is None and self._doc_ref is not None:
+            doc_id = self._doc_ref.id
+            object.__setattr__(self, '_id', doc_id)
+        return doc_id
 
     @property
     def path(self) -> Optional[str]:
         """Get full document path, or None if DETACHED."""
-        return self._doc_ref.path if self._doc_ref else None
+        # DocumentReference.path re-joins the path tuple on every access;
+        # the reference is immutable, so the string is computed once
+        path = self._path
+        if path is None and self._doc_ref is not None:
+            path = self._doc_ref.path
+            object.__setattr__(self, '_path', path)
+        return path
 
     # =========================================================================
     # Transaction Support (Phase 2)
@@ -416,8 +655,7 @@ class BaseFireObject:
             new_post.title = "On Analytical Engines"
             new_post.save()
         """
-        self._validate_not_detached("collection()")
-        self._validate_not_deleted("collection()")
+        self._validate_has_document("collection()")
 
         # Get subcollection reference from document reference
         subcollection_ref = self._doc_ref.collection(name)
@@ -482,10 +720,9 @@ class BaseFireObject:
         current_array = self._data.get(field, [])
         # Add only values that aren't already in the array (deduplication)
         updated_array = current_array + [v for v in values if v not in current_array]
-        self._data[field] = updated_array
+        self._writable_data()[field] = updated_array
 
         # Store the operation for server-side execution
-        from google.cloud import firestore
         self._atomic_ops[field] = firestore.ArrayUnion(values)
 
     def array_remove(self, field: str, values: list) -> None:
@@ -527,10 +764,9 @@ class BaseFireObject:
         # Simulate locally: filter out values to remove
         current_array = self._data.get(field, [])
         updated_array = [item for item in current_array if item not in values]
-        self._data[field] = updated_array
+        self._writable_data()[field] = updated_array
 
         # Store the operation for server-side execution
-        from google.cloud import firestore
         self._atomic_ops[field] = firestore.ArrayRemove(values)
 
     def increment(self, field: str, value: float) -> None:
@@ -573,10 +809,9 @@ class BaseFireObject:
 
         # Simulate locally: get current value (default to 0) and add increment
         current_value = self._data.get(field, 0)
-        self._data[field] = current_value + value
+        self._writable_data()[field] = current_value + value
 
         # Store the operation for server-side execution
-        from google.cloud import firestore
         self._atomic_ops[field] = firestore.Increment(value)
 
     # =========================================================================
@@ -592,35 +827,39 @@ class BaseFireObject:
         Phase 2: Track field-level changes for efficient partial updates.
         Enforces mutual exclusivity between vanilla and atomic operations.
         """
-        # Internal attributes bypass _data storage
+        # Internal attributes bypass _data storage. Slot names are interned
+        # string literals, so the frozenset probe is a single hash lookup.
         if name in self._INTERNAL_ATTRS:
             object.__setattr__(self, name, value)
             return
 
+        # Every slot is initialized before user code can assign fields, so
+        # no hasattr() guards are needed on this path
+
         # Cannot modify DELETED objects
-        if hasattr(self, '_state') and self._state == State.DELETED:
+        if self._state is _DELETED:
             raise AttributeError("Cannot modify a DELETED FireObject")
 
-        # Initialize phase - before _data exists
-        if not hasattr(self, '_data'):
-            object.__setattr__(self, name, value)
-        else:
-            # Enforce mutual exclusivity: cannot modify field with pending atomic operation
-            if hasattr(self, '_atomic_ops') and name in self._atomic_ops:
-                raise ValueError(
-                    f"Cannot modify field '{name}' directly - "
-                    "field has a pending atomic operation. Save changes first "
-                    "or use vanilla modifications exclusively."
-                )
+        # Enforce mutual exclusivity: cannot modify field with pending atomic operation
+        if name in self._atomic_ops:
+            raise ValueError(
+                f"Cannot modify field '{name}' directly - "
+                "field has a pending atomic operation. Save changes first "
+                "or use vanilla modifications exclusively."
+            )
 
-            # Convert special types for storage (FireObject → DocumentReference, etc.)
+        # Convert special types for storage (FireObject → DocumentReference, etc.)
+        if type(value) not in _SCALAR_TYPES:
             value = self._convert_value_for_storage(value)
 
-            # Store in _data and track in dirty fields
-            self._data[name] = value
-            self._dirty_fields.add(name)
-            # If this field was marked for deletion, remove it from deleted set
-            self._deleted_fields.discard(name)
+        # Store in _data and track in dirty fields
+        data = self._data
+        if data is _EMPTY_DATA:
+            data = self._writable_data()
+        data[name] = value
+        self._dirty_fields.add(name)
+        # If this field was marked for deletion, remove it from deleted set
+        self._deleted_fields.discard(name)
 
     def __delattr__(self, name: str) -> None:
         """
@@ -628,7 +867,7 @@ class BaseFireObject:
 
         Phase 2: Track deletions for efficient partial updates with DELETE_FIELD.
         """
-        if self._state == State.DELETED:
+        if self._state is _DELETED:
             raise AttributeError("Cannot delete attributes from a DELETED FireObject")
 
         if name not in self._data:
@@ -654,21 +893,23 @@ class BaseFireObject:
         Raises:
             RuntimeError: If object is in ATTACHED state (data not loaded).
         """
-        if self._state == State.ATTACHED:
+        if self._state is _ATTACHED:
             raise RuntimeError("Cannot call to_dict() on ATTACHED FireObject. Call fetch() first.")
 
-        return dict(self._data)
+        # dict.copy() clones the hash table directly; the shared empty
+        # MappingProxyType forwards copy() to its dict, so this is always a dict
+        return self._data.copy()
 
     def __repr__(self) -> str:
         """Return detailed string representation."""
-        if self._state == State.DETACHED:
+        if self._state is _DETACHED:
             return f"<{type(self).__name__} DETACHED dirty_fields={len(self._dirty_fields)}>"
         dirty_count = len(self._dirty_fields) + len(self._deleted_fields)
         return f"<{type(self).__name__} {self._state.name} path='{self.path}' dirty_fields={dirty_count}>"
 
     def __str__(self) -> str:
         """Return human-readable string representation."""
-        if self._state == State.DETACHED:
+        if self._state is _DETACHED:
             return f"{type(self).__name__}(detached)"
         return f"{type(self).__name__}({self.path})"
 
@@ -686,7 +927,7 @@ class BaseFireObject:
         Raises:
             RuntimeError: If object is DELETED.
         """
-        if self._state == State.DELETED:
+        if self._state is _DELETED:
             raise RuntimeError(f"Cannot {operation} on a DELETED FireObject")
 
     def _validate_not_detached(self, operation: str) -> None:
@@ -699,9 +940,37 @@ class BaseFireObject:
         Raises:
             ValueError: If object is DETACHED.
         """
-        if self._state == State.DETACHED:
+        if self._state is _DETACHED:
             raise ValueError(f"Cannot {operation} on a DETACHED FireObject (no DocumentReference)")
 
+    def _validate_has_document(self, operation: str) -> None:
+        """
+        Validate that object is ATTACHED or LOADED.
+
+        Same as _validate_not_detached() followed by _validate_not_deleted(),
+        but the common case costs a single state check.
+
+        Args:
+            operation: Name of operation being attempted.
+
+        Raises:
+            ValueError: If object is DETACHED.
+            RuntimeError: If object is DELETED.
+        """
+        state = self._state
+        if state is _LOADED or state is _ATTACHED:
+            return
+        self._validate_not_detached(operation)
+        self._validate_not_deleted(operation)
+
+    def _writable_data(self) -> Dict[str, Any]:
+        """Return _data, swapping the shared empty mapping for a private dict."""
+        data = self._data
+        if data is _EMPTY_DATA:
+            data = {}
+            object.__setattr__(self, '_data', data)
+        return data
+
     def _mark_clean(self) -> None:
         """Mark object as clean (no unsaved changes)."""
         self._dirty_fields.clear()
@@ -739,8 +1008,23 @@ class BaseFireObject:
         Args:
             data: Document data dictionary.
         """
-        object.__setattr__(self, '_data', data)
-        object.__setattr__(self, '_state', State.LOADED)
+        self._transition_loaded_clean(data)
+
+    def _transition_loaded_clean(self, data: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Enter LOADED state with no pending changes.
+
+        Used after a successful save() (data=None keeps the local data) and
+        when hydrating from a snapshot.
+
+        Args:
+            data: Optional document data dictionary to install as _data.
+        """
+        if data is not None:
+            object.__setattr__(self, '_data', data)
+        object.__setattr__(self, '_state', _LOADED)
+        # The server's update_time for this data is unknown after a save
+        object.__setattr__(self, '_update_time', None)
         # Clear dirty tracking (Phase 2: field-level tracking)
         self._dirty_fields.clear()
         self._deleted_fields.clear()
@@ -750,6 +1034,96 @@ class BaseFireObject:
         """Transition to DELETED state."""
         object.__setattr__(self, '_state', State.DELETED)
 
+    # =========================================================================
+    # Prefetching (SHARED)
+    # =========================================================================
+
+    @classmethod
+    def prefetch(cls, objects: Iterable['BaseFireObject']) -> None:
+        """
+        Register ATTACHED objects to be loaded together on first access.
+
+        No request is made here. The first time any registered object
+        lazy-loads on attribute access, all registered objects of the same
+        kind that are still ATTACHED are fetched with a single batched get,
+        so a loop touching each one costs one round-trip instead of one per
+        object. AsyncFireObjects are loaded through their companion sync
+        client, as their lazy loading already is. Registration is per thread
+        and holds objects weakly, so objects that are never accessed are
+        dropped once the caller releases them.
+
+        Args:
+            objects: FireObjects or AsyncFireObjects to load together.
+                    Objects that are not ATTACHED are ignored.
+
+        Example:
+            FireObject.prefetch(post.author for post in posts)
+            for post in posts:
+                print(post.author.name)  # First access loads every author
+        """
+        pending = getattr(_prefetch_local, 'pending', None)
+        if pending is None:
+            pending = _prefetch_local.pending = weakref.WeakValueDictionary()
+        for obj in objects:
+            if obj._state is _ATTACHED:
+                pending[id(obj)] = obj
+
+    @classmethod
+    @contextmanager
+    def prefetch_scope(cls) -> Iterator[None]:
+        """
+        Automatically prefetch referenced documents inside a block.
+
+        While the block runs on this thread, every reference field
+        hydrated into an ATTACHED FireObject or AsyncFireObject is
+        registered as with prefetch(), so the first lazy load resolves all
+        of them in one round-trip. Registrations are dropped when the
+        outermost block exits.
+
+        Example:
+            with FireObject.prefetch_scope():
+                posts = db.collection('posts').get_all()
+                for post in posts:
+                    print(post.author.name)  # One fetch for all authors
+        """
+        if getattr(_prefetch_local, 'collect', False):
+            yield
+            return
+
+        _prefetch_local.collect = True
+        _prefetch_local.pending = weakref.WeakValueDictionary()
+        try:
+            yield
+        finally:
+            _prefetch_local.collect = False
+            _prefetch_local.pending = None
+
+    @staticmethod
+    def _collect_reference(obj: 'BaseFireObject') -> 'BaseFireObject':
+        """Register a hydrated reference object if prefetch_scope() is active."""
+        if getattr(_prefetch_local, 'collect', False):
+            _prefetch_local.pending[id(obj)] = obj
+        return obj
+
+    def _is_prefetched(self) -> bool:
+        """Return True if this object is waiting in the prefetch registry."""
+        pending = getattr(_prefetch_local, 'pending', None)
+        return bool(pending) and id(self) in pending
+
+    @staticmethod
+    def _take_prefetched(kind: type) -> List['BaseFireObject']:
+        """
+        Remove pending objects of the given kind and return the ATTACHED ones.
+
+        Objects of the other kind (sync or async) stay registered for their
+        own first access.
+        """
+        pending = _prefetch_local.pending
+        taken = [obj for obj in pending.values() if isinstance(obj, kind)]
+        for obj in taken:
+            pending.pop(id(obj), None)
+        return [obj for obj in taken if obj._state is _ATTACHED]
+
     # =========================================================================
     # Real-Time Listeners (Sync-only via _sync_doc_ref or _doc_ref)
     # =========================================================================
@@ -806,8 +1180,7 @@ class BaseFireObject:
             The callback runs on a separate thread. Use threading primitives
             (Event, Lock, Queue) for synchronization with your main thread.
         """
-        self._validate_not_detached("on_snapshot()")
-        self._validate_not_deleted("on_snapshot()")
+        self._validate_has_document("on_snapshot()")
 
         # For sync FireObject, use _doc_ref directly
         # For async FireObject, use _sync_doc_ref (always available)
@@ -866,10 +1239,14 @@ class BaseFireObject:
             post.author = user  # user is a FireObject
             # Internally converts to DocumentReference
         """
+        # Scalars are by far the most common field values
+        if type(value) in _SCALAR_TYPES:
+            return value
+
         # Handle FireObject/AsyncFireObject → DocumentReference
         if isinstance(value, BaseFireObject):
             # Validate not DETACHED
-            if value._state == State.DETACHED:
+            if value._state is _DETACHED:
                 raise ValueError(
                     "Cannot assign a DETACHED FireObject as a reference. "
                     "The object must be saved first to have a document path."
@@ -932,6 +1309,10 @@ class BaseFireObject:
             doc.fetch()
             author = doc.author  # Automatically converted to FireObject
         """
+        # Most field values are scalars; skip the isinstance checks for them
+        if type(value) in _SCALAR_TYPES:
+            return value
+
         # Handle DocumentReference → FireObject/AsyncFireObject
         if isinstance(value, (DocumentReference, AsyncDocumentReference)):
             if is_async:
@@ -945,34 +1326,174 @@ class BaseFireObject:
                     # Create sync ref from async ref using sync_client
                     sync_ref = sync_client.document(value.path)
 
-                return AsyncFireObject(
+                return cls._collect_reference(AsyncFireObject(
                     doc_ref=value,
                     initial_state=State.ATTACHED,
                     sync_doc_ref=sync_ref,
                     sync_client=sync_client
-                )
+                ))
             else:
                 from .fire_object import FireObject
-                return FireObject(doc_ref=value, initial_state=State.ATTACHED)
+                return cls._collect_reference(FireObject(value, _ATTACHED))
 
         # Handle lists → recursively convert items
+        convert = cls._convert_snapshot_value_for_retrieval
         if isinstance(value, list):
-            return [cls._convert_snapshot_value_for_retrieval(item, is_async, sync_client) for item in value]
+            return [convert(item, is_async, sync_client) for item in value]
 
         # Handle dicts → recursively convert values
         if isinstance(value, dict):
-            return {k: cls._convert_snapshot_value_for_retrieval(v, is_async, sync_client) for k, v in value.items()}
+            return {k: convert(v, is_async, sync_client) for k, v in value.items()}
 
         # Everything else passes through unchanged
         return value
 
+    @classmethod
+    def _convert_snapshot_data(
+        cls,
+        data: Dict[str, Any],
+        is_async: bool,
+        sync_client: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        """
+        Convert a snapshot's to_dict() output into a _data dictionary.
+
+        Values are converted for retrieval (DocumentReference → FireObject,
+        etc.). Field names are interned: attribute names used in lookups
+        are interned by the compiler, so interned keys let _data lookups
+        match on identity instead of comparing string contents.
+
+        Args:
+            data: Raw field data from DocumentSnapshot.to_dict().
+            is_async: Whether to create AsyncFireObject references.
+            sync_client: Optional sync Firestore client for async lazy loading.
+
+        Returns:
+            Dictionary of converted values keyed by interned field names.
+        """
+        convert = cls._convert_snapshot_value_for_retrieval
+        intern = sys.intern
+        return {intern(key): convert(value, is_async, sync_client) for key, value in data.items()}
+
+    @staticmethod
+    def _plan_fetch_many(
+        objects: List[Any],
+        force: bool
+    ) -> Tuple[Dict[str, List[Any]], List[Any], List[Any]]:
+        """
+        Work out which documents a fetch_many() call has to read.
+
+        Args:
+            objects: The objects passed to fetch_many().
+            force: Whether LOADED objects are refreshed too.
+
+        Returns:
+            Tuple of (objects to load grouped by path, references to read,
+            snapshots already available from the request cache).
+
+        Raises:
+            ValueError: If any object is DETACHED.
+            RuntimeError: If any object is DELETED.
+        """
+        # Group by path so duplicate references are only requested once
+        pending: Dict[str, List[Any]] = {}
+        for obj in objects:
+            state = obj._state
+            if state is _LOADED:
+                if not force:
+                    continue
+            elif state is not _ATTACHED:
+                obj._validate_has_document("fetch_many()")
+            pending.setdefault(obj.path, []).append(obj)
+
+        refs = []
+        snapshots = []
+        for group in pending.values():
+            doc_ref = group[0]._doc_ref
+            snapshot = None if force else cached_snapshot(doc_ref)
+            if snapshot is None:
+                refs.append(doc_ref)
+            else:
+                snapshots.append(snapshot)
+        return pending, refs, snapshots
+
+    @staticmethod
+    def _hydrate_fetch_many(
+        pending: Dict[str, List[Any]],
+        snapshots: List[Any],
+        is_async: bool,
+        missing_ok: bool = False
+    ) -> None:
+        """
+        Load fetch_many() results into the waiting objects.
+
+        Raises:
+            NotFound: If some documents don't exist and missing_ok is False,
+                     after every existing document has been loaded.
+        """
+        missing = []
+        for snapshot in snapshots:
+            store_snapshot(snapshot.reference, snapshot)
+            if not snapshot.exists:
+                missing.append(snapshot.reference.path)
+                continue
+            for obj in pending[snapshot.reference.path]:
+                obj._process_snapshot(snapshot, is_async=is_async)
+
+        if missing and not missing_ok:
+            raise NotFound(f"Documents do not exist: {', '.join(sorted(missing))}")
+
+    @classmethod
+    def _new_loaded(
+        cls,
+        doc_ref: Any,
+        data: Dict[str, Any],
+        parent_collection: Optional[Any] = None,
+        sync_client: Optional[Any] = None,
+        update_time: Optional[Any] = None
+    ) -> 'BaseFireObject':
+        """
+        Create a LOADED object holding data without running __init__.
+
+        Hydration fast path for from_snapshot() and from_snapshots(): the
+        slots are filled directly, skipping __init__'s argument handling
+        and state selection.
+
+        Args:
+            doc_ref: The document reference the object is attached to.
+            data: Converted field data to install as _data.
+            parent_collection: Optional parent collection reference.
+            sync_client: Optional sync Firestore client for async lazy loading.
+            update_time: Server update_time of the snapshot data came from.
+
+        Returns:
+            A new instance of cls in LOADED state with clean dirty tracking.
+        """
+        obj = cls.__new__(cls)
+        set_slot = object.__setattr__
+        set_slot(obj, '_doc_ref', doc_ref)
+        set_slot(obj, '_sync_doc_ref', None)
+        set_slot(obj, '_sync_client', sync_client)
+        set_slot(obj, '_data', data)
+        set_slot(obj, '_parent_collection', parent_collection)
+        set_slot(obj, '_id', None)
+        set_slot(obj, '_path', None)
+        set_slot(obj, '_state', _LOADED)
+        set_slot(obj, '_dirty_fields', set())
+        set_slot(obj, '_deleted_fields', set())
+        set_slot(obj, '_atomic_ops', {})
+        set_slot(obj, '_prefetched_collections', None)
+        set_slot(obj, '_update_time', update_time)
+        return obj
+
     @classmethod
     def _create_from_snapshot_base(
         cls,
         snapshot: DocumentSnapshot,
         parent_collection: Optional[Any] = None,
-        sync_client: Optional[Any] = None
-    ) -> Dict[str, Any]:
+        sync_client: Optional[Any] = None,
+        copy: bool = True
+    ) -> Tuple[Any, Dict[str, Any]]:
         """
         Extract data for creating FireObject from snapshot.
 
@@ -982,9 +1503,12 @@ class BaseFireObject:
             snapshot: DocumentSnapshot from native API.
             parent_collection: Optional parent collection reference.
             sync_client: Optional sync Firestore client for async lazy loading.
+            copy: If False, read the snapshot's data without the deep copy
+                 made by to_dict(). Nested values are then shared with the
+                 snapshot, so only use this for snapshots nobody else holds.
 
         Returns:
-            Dictionary with initialization parameters.
+            Tuple of (document reference, converted field data).
 
         Raises:
             ValueError: If snapshot doesn't exist.
@@ -992,20 +1516,11 @@ class BaseFireObject:
         if not snapshot.exists:
             raise ValueError("Cannot create FireObject from non-existent snapshot")
 
-        # Get data from snapshot
-        data = snapshot.to_dict() or {}
+        # Get data from snapshot; to_dict() deep-copies every nested value
+        data = (snapshot.to_dict() if copy else snapshot._data) or {}
+        doc_ref = snapshot.reference
 
         # Detect async context from snapshot reference
-        is_async = 'Async' in snapshot.reference.__class__.__name__
-
-        # Convert all values (DocumentReference → FireObject, etc.)
-        converted_data = {}
-        for key, value in data.items():
-            converted_data[key] = cls._convert_snapshot_value_for_retrieval(value, is_async, sync_client)
-
-        return {
-            'doc_ref': snapshot.reference,
-            'initial_state': State.LOADED,
-            'parent_collection': parent_collection,
-            'data': converted_data
-        }
+        is_async = 'Async' in doc_ref.__class__.__name__
+
+        return doc_ref, cls._convert_snapshot_data(data, is_async, sync_client)
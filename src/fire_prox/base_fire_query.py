@@ -0,0 +1,110 @@
+"""
+Shared query-building helpers for sync and async FireQuery implementations.
+
+This module contains the constants and small helpers that are identical
+between FireQuery, AsyncFireQuery and the collection methods that start a
+query (where, order_by, ...).
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from google.cloud.firestore_v1.base_query import BaseQuery
+
+# Comparison operators accepted by the native Firestore client
+VALID_OPERATORS = frozenset({
+    '==', '!=', '<', '<=', '>', '>=',
+    'in', 'not-in', 'array_contains', 'array_contains_any',
+})
+
+
+def validate_operator(op: str) -> None:
+    """
+    Validate a where() comparison operator.
+
+    Args:
+        op: The operator string passed to where().
+
+    Raises:
+        ValueError: If op is not a supported comparison operator.
+    """
+    if op not in VALID_OPERATORS:
+        raise ValueError(
+            f"Invalid operator: {op!r}. Must be one of: {', '.join(sorted(VALID_OPERATORS))}"
+        )
+
+
+# order_by() direction names mapped to the native Query constants
+DIRECTIONS = {
+    'ASCENDING': BaseQuery.ASCENDING,
+    'DESCENDING': BaseQuery.DESCENDING,
+}
+
+
+def order_direction(direction: str) -> str:
+    """
+    Resolve an order_by() direction name to the native Query constant.
+
+    Args:
+        direction: 'ASCENDING' or 'DESCENDING' (case-insensitive).
+
+    Returns:
+        The matching Query.ASCENDING or Query.DESCENDING constant.
+
+    Raises:
+        ValueError: If direction is not a supported sort direction.
+    """
+    # Callers almost always pass the canonical upper-case name, so only
+    # normalise the case when the exact lookup misses
+    direction_const = DIRECTIONS.get(direction)
+    if direction_const is None:
+        direction_const = DIRECTIONS.get(direction.upper())
+    if direction_const is None:
+        raise ValueError(f"Invalid direction: {direction}. Must be 'ASCENDING' or 'DESCENDING'")
+    return direction_const
+
+
+def shard_cursors(
+    native_query: Any,
+    shard_field: str,
+    boundaries: Sequence[Any],
+) -> List[Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]]:
+    """
+    Split an ordered query into contiguous shards on its first order field.
+
+    The shards are (start_at, end_before) cursor pairs: everything before
+    boundaries[0], then each [boundaries[i], boundaries[i+1]) range, then
+    everything from boundaries[-1] on. Together they cover exactly the
+    results of the unsharded query, in the same order.
+
+    Args:
+        native_query: The native query to shard.
+        shard_field: The field the query is ordered by first.
+        boundaries: Split points, in the same order as the query's
+                   ordering on shard_field.
+
+    Returns:
+        One (start_at, end_before) pair per shard; None marks an open end.
+
+    Raises:
+        ValueError: If boundaries is empty, the query is not ordered by
+                   shard_field first, or it already has a limit, offset or
+                   cursor.
+    """
+    if not boundaries:
+        raise ValueError("get_parallel() requires at least one shard boundary")
+
+    orders = native_query._orders
+    if not orders or orders[0].field.field_path != shard_field:
+        raise ValueError(
+            f"get_parallel() requires the query to be ordered by '{shard_field}' first; "
+            f"call order_by('{shard_field}') before get_parallel()"
+        )
+
+    if (native_query._limit is not None or native_query._offset is not None
+            or native_query._start_at is not None or native_query._end_at is not None):
+        raise ValueError("get_parallel() cannot shard a query that has a limit, offset or cursor")
+
+    edges: List[Optional[Dict[str, Any]]] = [None]
+    edges.extend({shard_field: boundary} for boundary in boundaries)
+    edges.append(None)
+    return list(zip(edges[:-1], edges[1:]))
@@ -5,10 +5,32 @@ This module contains the base class that implements all logic that is
 identical between synchronous and asynchronous FireProx implementations.
 """
 
-from typing import Any, Dict
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional
 
+from .base_fire_object import _register_client_pool
 from .state import State
 
+# Number of validated document/collection references kept per FireProx
+REF_CACHE_SIZE = 4096
+
+
+def _cached_ref(cache: 'OrderedDict[str, Any]', path: str, build: Callable[[str], Any]) -> Any:
+    """
+    Return the reference cached for path, building and caching it on a miss.
+
+    The oldest entry is dropped once the cache holds more than
+    REF_CACHE_SIZE references. Caches are plain dicts of paths to native
+    references, so they hold no reference back to their FireProx and are
+    freed with it by reference counting.
+    """
+    ref = cache.get(path)
+    if ref is None:
+        ref = cache[path] = build(path)
+        if len(cache) > REF_CACHE_SIZE:
+            cache.popitem(last=False)
+    return ref
+
 
 class BaseFireProx:
     """
@@ -16,7 +38,7 @@ class BaseFireProx:
 
     Contains all shared logic:
     - Client storage
-    - Path validation
+    - Path validation and reference caching
     - String representations
 
     Subclasses must implement:
@@ -24,19 +46,27 @@ class BaseFireProx:
     - collection() - creates FireCollection/AsyncFireCollection
     """
 
-    def __init__(self, client: Any):
+    def __init__(self, client: Any, pool: Optional[Iterable[Any]] = None):
         """
         Initialize FireProx with a native Firestore client.
 
         Args:
             client: A configured google.cloud.firestore.Client or
                    google.cloud.firestore.AsyncClient instance.
+            pool: Optional clients of the same type, project and database
+                 that direct document reads and writes are spread across.
 
         Note:
             Type checking is handled in subclasses since they know
             which client type to expect.
         """
         self._client = client
+        self._client_pool = _register_client_pool(client, pool or ())
+
+        # References are immutable value objects, so repeated doc()/collection()
+        # calls for the same path can reuse the one already validated and built
+        self._document_refs: 'OrderedDict[str, Any]' = OrderedDict()
+        self._collection_refs: 'OrderedDict[str, Any]' = OrderedDict()
 
     # =========================================================================
     # Client Access (SHARED)
@@ -240,6 +270,32 @@ class BaseFireProx:
                     f"Collection path must have odd number of segments, got {num_segments}: '{path}'"
                 )
 
+    def _document_ref(self, path: str) -> Any:
+        """Return the cached native DocumentReference for path."""
+        return _cached_ref(self._document_refs, path, self._new_document_ref)
+
+    def _collection_ref(self, path: str) -> Any:
+        """Return the cached native CollectionReference for path."""
+        return _cached_ref(self._collection_refs, path, self._new_collection_ref)
+
+    def _new_document_ref(self, path: str) -> Any:
+        """Validate path and build its native DocumentReference."""
+        self._validate_path(path, 'document')
+        return self._client.document(path)
+
+    def _new_collection_ref(self, path: str) -> Any:
+        """Validate path and build its native CollectionReference."""
+        self._validate_path(path, 'collection')
+        return self._client.collection(path)
+
+    def _collection_group_query(self, collection_id: str) -> Any:
+        """Validate collection_id and build a native collection group query."""
+        if not collection_id or '/' in collection_id:
+            raise ValueError(
+                f"collection_id must be a single collection ID without '/', got '{collection_id}'"
+            )
+        return self._client.collection_group(collection_id)
+
     def _get_document_kwargs(self, path: str) -> Dict[str, Any]:
         """Return extra keyword arguments for document wrappers."""
         return {}
@@ -250,8 +306,7 @@ class BaseFireProx:
 
     def _create_document_proxy(self, path: str, factory: Any) -> Any:
         """Validate and construct a document wrapper using the provided factory."""
-        self._validate_path(path, 'document')
-        doc_ref = self._client.document(path)
+        doc_ref = self._document_ref(path)
         kwargs: Dict[str, Any] = {
             'doc_ref': doc_ref,
             'initial_state': State.ATTACHED,
@@ -262,8 +317,7 @@ class BaseFireProx:
 
     def _create_collection_proxy(self, path: str, factory: Any) -> Any:
         """Validate and construct a collection wrapper using the provided factory."""
-        self._validate_path(path, 'collection')
-        collection_ref = self._client.collection(path)
+        collection_ref = self._collection_ref(path)
         kwargs: Dict[str, Any] = {'collection_ref': collection_ref, 'client': self}
         kwargs.update(self._get_collection_kwargs(path))
         return factory(**kwargs)
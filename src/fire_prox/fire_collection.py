@@ -6,15 +6,15 @@ Firestore collection and provides methods for creating new documents and
 querying existing ones.
 """
 
-from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
+from functools import partial
+from typing import Any, Dict, Iterator, Optional
 
 from .base_fire_collection import BaseFireCollection
+from .base_fire_query import order_direction, validate_operator
 from .fire_object import FireObject
+from .fire_query import FireQuery
 from .state import State
 
-if TYPE_CHECKING:
-    from .fire_query import FireQuery
-
 
 class FireCollection(BaseFireCollection):
     """
@@ -47,6 +47,8 @@ class FireCollection(BaseFireCollection):
             print(user.name)
     """
 
+    __slots__ = ()
+
     # =========================================================================
     # Document Creation
     # =========================================================================
@@ -60,19 +62,16 @@ class FireCollection(BaseFireCollection):
         **_: Any,
     ) -> FireObject:
         """Instantiate the synchronous FireObject wrapper."""
-        return FireObject(
-            doc_ref=doc_ref,
-            initial_state=initial_state,
-            parent_collection=parent_collection,
-        )
+        # Positional call: this runs once per document handed out by new()/doc()
+        return FireObject(doc_ref, initial_state, parent_collection)
 
     def new(self) -> FireObject:
         """Create a new FireObject in DETACHED state."""
-        return super().new()
+        return BaseFireCollection.new(self)
 
     def doc(self, doc_id: str) -> FireObject:
         """Get a reference to a specific document in this collection."""
-        return super().doc(doc_id)
+        return BaseFireCollection.doc(self, doc_id)
 
     # =========================================================================
     # Parent Property (Phase 2)
@@ -87,22 +86,21 @@ class FireCollection(BaseFireCollection):
             FireObject representing the parent document if this is a
             subcollection, None if this is a root-level collection.
 
-        Note:
-            Phase 2 feature. Returns None in Phase 1 as subcollections
-            are not yet implemented.
-
         Example:
             posts = db.doc('users/alovelace').collection('posts')
             parent = posts.parent
             print(parent.path)  # 'users/alovelace'
         """
-        raise NotImplementedError("Phase 2 feature - subcollections")
+        parent_ref = self._collection_ref.parent
+        if parent_ref is None:
+            return None
+        return FireObject(parent_ref, State.ATTACHED)
 
     # =========================================================================
     # Query Methods (Phase 2)
     # =========================================================================
 
-    def where(self, field: str, op: str, value: Any) -> 'FireQuery':
+    def where(self, field: str, op: str, value: Any) -> FireQuery:
         """
         Create a query with a filter condition.
 
@@ -113,7 +111,7 @@ class FireCollection(BaseFireCollection):
         Args:
             field: The field path to filter on (e.g., 'name', 'address.city').
             op: Comparison operator: '==', '!=', '<', '<=', '>', '>=',
-                'in', 'not-in', 'array-contains', 'array-contains-any'.
+                'in', 'not-in', 'array_contains', 'array_contains_any'.
             value: The value to compare against.
 
         Returns:
@@ -126,20 +124,17 @@ class FireCollection(BaseFireCollection):
             for user in query.get():
                 print(user.name)
         """
-        from google.cloud.firestore_v1.base_query import FieldFilter
-
-        from .fire_query import FireQuery
+        validate_operator(op)
 
         # Create initial query with filter
-        filter_obj = FieldFilter(field, op, value)
-        native_query = self._collection_ref.where(filter=filter_obj)
+        native_query = self._where_query(field, op, value)
         return FireQuery(native_query, parent_collection=self)
 
     def order_by(
         self,
         field: str,
         direction: str = 'ASCENDING'
-    ) -> 'FireQuery':
+    ) -> FireQuery:
         """
         Create a query with ordering.
 
@@ -152,23 +147,10 @@ class FireCollection(BaseFireCollection):
         Returns:
             A FireQuery instance for method chaining.
         """
-        from google.cloud.firestore_v1 import Query as QueryClass
-
-        from .fire_query import FireQuery
-
-        # Convert direction string to constant
-        if direction.upper() == 'ASCENDING':
-            direction_const = QueryClass.ASCENDING
-        elif direction.upper() == 'DESCENDING':
-            direction_const = QueryClass.DESCENDING
-        else:
-            raise ValueError(f"Invalid direction: {direction}. Must be 'ASCENDING' or 'DESCENDING'")
-
-        # Create query with ordering
-        native_query = self._collection_ref.order_by(field, direction=direction_const)
+        native_query = self._order_by_query(field, order_direction(direction))
         return FireQuery(native_query, parent_collection=self)
 
-    def limit(self, count: int) -> 'FireQuery':
+    def limit(self, count: int) -> FireQuery:
         """
         Create a query with a result limit.
 
@@ -180,16 +162,11 @@ class FireCollection(BaseFireCollection):
         Returns:
             A FireQuery instance for method chaining.
         """
-        from .fire_query import FireQuery
-
-        if count <= 0:
-            raise ValueError(f"Limit count must be positive, got {count}")
-
-        # Create query with limit
-        native_query = self._collection_ref.limit(count)
+        # Create query with limit (validated by _limit_query)
+        native_query = self._limit_query(count)
         return FireQuery(native_query, parent_collection=self)
 
-    def select(self, *field_paths: str) -> 'FireQuery':
+    def select(self, *field_paths: str) -> FireQuery:
         """
         Create a query with field projection.
 
@@ -207,13 +184,11 @@ class FireCollection(BaseFireCollection):
             results = users.select('name', 'email').get()
             # Returns: [{'name': 'Alice', 'email': 'alice@example.com'}, ...]
         """
-        from .fire_query import FireQuery
-
         if not field_paths:
             raise ValueError("select() requires at least one field path")
 
         # Create query with projection
-        native_query = self._collection_ref.select(list(field_paths))
+        native_query = self._select_query(field_paths)
         return FireQuery(native_query, parent_collection=self, projection=field_paths)
 
     def get_all(self) -> Iterator[FireObject]:
@@ -222,16 +197,17 @@ class FireCollection(BaseFireCollection):
 
         Phase 2.5 feature. Returns an iterator of all documents.
 
-        Yields:
-            FireObject instances in LOADED state for each document.
+        Returns:
+            Iterator of FireObject instances in LOADED state, one per document.
 
         Example:
             for user in users.get_all():
                 print(f"{user.name}: {user.year}")
         """
-        # Stream all documents from the collection
-        for snapshot in self._collection_ref.stream():
-            yield FireObject.from_snapshot(snapshot, parent_collection=self)
+        # Stream all documents from the collection; map() hydrates each
+        # snapshot without a Python generator frame per item
+        hydrate = partial(FireObject.from_snapshot, parent_collection=self, copy=False)
+        return map(hydrate, self._collection_ref.stream())
 
     # =========================================================================
     # Vector Query Methods
@@ -244,7 +220,7 @@ class FireCollection(BaseFireCollection):
         distance_measure: Any,
         limit: int,
         distance_result_field: Optional[str] = None,
-    ) -> 'FireQuery':
+    ) -> FireQuery:
         """
         Find the nearest neighbors based on vector similarity.
 
@@ -284,14 +260,10 @@ class FireCollection(BaseFireCollection):
             - Can be combined with where() for pre-filtering (requires composite index)
             - Does not work with Firestore emulator (production only)
         """
-        from .fire_query import FireQuery
-
-        # Create vector query using native find_nearest
+        # Create vector query using native find_nearest (note the native
+        # argument order puts limit before distance_measure)
         native_query = self._collection_ref.find_nearest(
-            vector_field=vector_field,
-            query_vector=query_vector,
-            distance_measure=distance_measure,
-            limit=limit,
+            vector_field, query_vector, limit, distance_measure,
             distance_result_field=distance_result_field,
         )
         return FireQuery(native_query, parent_collection=self)
@@ -314,7 +286,6 @@ class FireCollection(BaseFireCollection):
             total = users.count()
             print(f"Total users: {total}")
         """
-        from .fire_query import FireQuery
         # Use collection reference directly as a query for aggregation
         query = FireQuery(self._collection_ref, parent_collection=self)
         return query.count()
@@ -335,7 +306,6 @@ class FireCollection(BaseFireCollection):
         Example:
             total_revenue = orders.sum('amount')
         """
-        from .fire_query import FireQuery
         # Use collection reference directly as a query for aggregation
         query = FireQuery(self._collection_ref, parent_collection=self)
         return query.sum(field)
@@ -356,7 +326,6 @@ class FireCollection(BaseFireCollection):
         Example:
             avg_rating = products.avg('rating')
         """
-        from .fire_query import FireQuery
         # Use collection reference directly as a query for aggregation
         query = FireQuery(self._collection_ref, parent_collection=self)
         return query.avg(field)
@@ -384,7 +353,6 @@ class FireCollection(BaseFireCollection):
             )
             # Returns: {'total': 42, 'total_score': 5000, 'avg_age': 28.5}
         """
-        from .fire_query import FireQuery
         # Use collection reference directly as a query for aggregation
         query = FireQuery(self._collection_ref, parent_collection=self)
         return query.aggregate(**aggregations)
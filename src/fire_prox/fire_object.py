@@ -3,14 +3,125 @@ FireObject: The core proxy class for Firestore documents (synchronous).
 
 This module implements the synchronous FireObject class, which serves as a
 schemaless, state-aware proxy for Firestore documents.
-"""
 
-from typing import Any, Dict, List, Optional
+Every I/O method here blocks the calling thread on gRPC. Calling them
+directly from a coroutine (e.g. a FastAPI/Uvicorn handler) stalls the
+event loop for the whole round-trip. Use AsyncFireObject for native async
+I/O, or the afetch()/asave()/adelete() bridges, which run the blocking call
+in a worker thread via asyncio.to_thread().
+"""
 
-from google.cloud.firestore_v1.document import DocumentReference, DocumentSnapshot
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional
+
+from google.api_core.exceptions import DeadlineExceeded, RetryError, ServiceUnavailable
+from google.api_core.gapic_v1.method import DEFAULT
+from google.cloud.exceptions import NotFound
+
+from .base_fire_object import (
+    _ATTACHED,
+    _DETACHED,
+    _LOADED,
+    _MISSING,
+    _SCALAR_TYPES,
+    MAX_BATCH_SIZE,
+    BaseFireObject,
+    _auto_id,
+    _check_bulk_target,
+    _direct_ref,
+)
+from .request_cache import (
+    FALLBACK_RETRY,
+    SERVER_AND_CACHE_TIMEOUT,
+    cached_snapshot,
+    invalidate,
+    recent_snapshot,
+    store_snapshot,
+    validate_source,
+)
+
+if TYPE_CHECKING:
+    from google.cloud.firestore_v1.document import DocumentReference, DocumentSnapshot
+
+# Runs subcollection listings started by fetch(prefetch_collections=True);
+# created on first use so that importing the module starts no threads
+_prefetch_executor: Optional[ThreadPoolExecutor] = None
+_prefetch_executor_lock = threading.Lock()
+
+# Per-thread writer installed by FireObject.bulk()
+_bulk_local = threading.local()
+
+
+class _BulkWriter:
+    """Accumulate implicit writes inside FireObject.bulk() and commit them in chunks."""
+
+    def __init__(self, client: Any, batch_size: int):
+        self._client = client
+        self._batch_size = batch_size
+        self._batch = client.batch()
+        self._pending = 0
+
+    def set(self, doc_ref: Any, data: Dict[str, Any]) -> None:
+        _check_bulk_target(self._client, doc_ref)
+        self._batch.set(doc_ref, data)
+        self._added()
+
+    def update(self, doc_ref: Any, update_dict: Dict[str, Any]) -> None:
+        _check_bulk_target(self._client, doc_ref)
+        self._batch.update(doc_ref, update_dict)
+        self._added()
+
+    def delete(self, doc_ref: Any) -> None:
+        _check_bulk_target(self._client, doc_ref)
+        self._batch.delete(doc_ref)
+        self._added()
+
+    def _added(self) -> None:
+        self._pending += 1
+        if self._pending >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit any pending writes and start a fresh batch."""
+        if self._pending:
+            self._batch.commit()
+            self._batch = self._client.batch()
+            self._pending = 0
+
+
+def _get_prefetch_executor() -> ThreadPoolExecutor:
+    """Return the subcollection listing pool, creating it on first use."""
+    global _prefetch_executor
+    if _prefetch_executor is None:
+        with _prefetch_executor_lock:
+            if _prefetch_executor is None:
+                _prefetch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='fire_prox_prefetch')
+    return _prefetch_executor
+
+
+def _active_bulk_writer() -> Optional[_BulkWriter]:
+    """Return the bulk writer for the current thread, if any."""
+    return getattr(_bulk_local, 'writer', None)
+
+
+def _write_sink(transaction: Optional[Any], batch: Optional[Any]) -> Optional[Any]:
+    """
+    Return the object that should receive a write, or None to write directly.
 
-from .base_fire_object import BaseFireObject
-from .state import State
+    Transactions, batches and the bulk writer all expose the same
+    set(ref, data) / update(ref, data) / delete(ref) methods, so callers
+    only need to choose between the sink and the document reference.
+    """
+    if transaction is not None:
+        return transaction
+    if batch is not None:
+        return batch
+    return _active_bulk_writer()
 
 
 class FireObject(BaseFireObject):
@@ -47,26 +158,58 @@ class FireObject(BaseFireObject):
         user.delete()  # Transitions to DELETED
     """
 
+    __slots__ = ()
+
     # =========================================================================
     # Firestore I/O Hooks
     # =========================================================================
 
-    def _get_snapshot(self, transaction: Optional[Any] = None) -> DocumentSnapshot:
+    def _get_snapshot(
+        self,
+        transaction: Optional[Any] = None,
+        retry: Any = DEFAULT,
+        timeout: Optional[float] = None,
+    ) -> 'DocumentSnapshot':
         """Retrieve a document snapshot using the synchronous client."""
         if transaction is not None:
             return self._doc_ref.get(transaction=transaction)
-        return self._doc_ref.get()
 
-    def _create_document(self, doc_id: Optional[str] = None) -> DocumentReference:
+        snapshot = cached_snapshot(self._doc_ref)
+        if snapshot is None:
+            snapshot = _direct_ref(self._doc_ref).get(retry=retry, timeout=timeout)
+            store_snapshot(self._doc_ref, snapshot)
+        return snapshot
+
+    def _unmodified_on_server(self) -> bool:
+        """Check with a field-less read whether the loaded data is still current."""
+        if not self._can_skip_refresh():
+            return False
+        meta = _direct_ref(self._doc_ref).get(field_paths=['__name__'])
+        return meta.exists and meta.update_time == self._update_time
+
+    def _read_snapshot(self, transaction: Optional[Any], source: str) -> Any:
+        """Retrieve a snapshot from the server and/or the recent-snapshot cache."""
+        if source == 'server':
+            return self._get_snapshot(transaction)
+
+        validate_source(source, transaction)
+        if source == 'cache':
+            return recent_snapshot(self._doc_ref)
+
+        try:
+            return self._get_snapshot(retry=FALLBACK_RETRY, timeout=SERVER_AND_CACHE_TIMEOUT)
+        except (DeadlineExceeded, ServiceUnavailable, RetryError) as exc:
+            # Serve a recent copy if there is one, otherwise surface the outage
+            try:
+                return recent_snapshot(self._doc_ref)
+            except NotFound:
+                raise exc from None
+
+    def _create_document(self, doc_id: Optional[str] = None) -> 'DocumentReference':
         """Create a new synchronous document reference for DETACHED saves."""
-        if not self._parent_collection:
-            raise ValueError("DETACHED object has no parent collection")
-
-        collection_ref = self._parent_collection._collection_ref
-        if doc_id:
-            doc_ref = collection_ref.document(doc_id)
-        else:
-            doc_ref = collection_ref.document()
+        # _prepare_detached_save() has already checked for a parent collection,
+        # which keeps collection_ref.document pre-bound
+        doc_ref = self._parent_collection._document(doc_id or _auto_id())
 
         object.__setattr__(self, '_doc_ref', doc_ref)
         return doc_ref
@@ -74,19 +217,19 @@ class FireObject(BaseFireObject):
     def _write_set(
         self,
         data: Dict[str, Any],
-        doc_ref: Optional[DocumentReference] = None,
+        doc_ref: Optional['DocumentReference'] = None,
         transaction: Optional[Any] = None,
         batch: Optional[Any] = None,
     ) -> None:
         """Persist data via a set call on the synchronous client."""
         target_ref = doc_ref or self._doc_ref
+        invalidate(target_ref)
 
-        if transaction is not None:
-            transaction.set(target_ref, data)
-        elif batch is not None:
-            batch.set(target_ref, data)
+        sink = _write_sink(transaction, batch)
+        if sink is None:
+            _direct_ref(target_ref).set(data)
         else:
-            target_ref.set(data)
+            sink.set(target_ref, data)
 
     def _write_update(
         self,
@@ -95,19 +238,21 @@ class FireObject(BaseFireObject):
         batch: Optional[Any] = None,
     ) -> None:
         """Perform an update operation using the synchronous client."""
-        if transaction is not None:
-            transaction.update(self._doc_ref, update_dict)
-        elif batch is not None:
-            batch.update(self._doc_ref, update_dict)
+        invalidate(self._doc_ref)
+        sink = _write_sink(transaction, batch)
+        if sink is None:
+            _direct_ref(self._doc_ref).update(update_dict)
         else:
-            self._doc_ref.update(update_dict)
+            sink.update(self._doc_ref, update_dict)
 
     def _write_delete(self, batch: Optional[Any] = None) -> None:
         """Delete the document using the synchronous client."""
-        if batch is not None:
-            batch.delete(self._doc_ref)
+        invalidate(self._doc_ref)
+        sink = _write_sink(None, batch)
+        if sink is None:
+            _direct_ref(self._doc_ref).delete()
         else:
-            self._doc_ref.delete()
+            sink.delete(self._doc_ref)
 
     # =========================================================================
     # Dynamic Attribute Handling (Sync-specific for lazy loading)
@@ -139,14 +284,31 @@ class FireObject(BaseFireObject):
             name = user.name  # Triggers fetch, transitions to LOADED
             year = user.year  # No fetch needed, already LOADED
         """
-        # Check if we're accessing internal data
-        if name == '_data':
+        # An unset internal slot (e.g. _data before __init__) must not recurse
+        if name in self._INTERNAL_ATTRS:
             raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
-        # If we're in ATTACHED state, trigger lazy loading
-        if self._state == State.ATTACHED:
-            # Synchronous fetch for lazy loading
-            self.fetch()
+        # Fast path: scalar values need no state check or materialization
+        value = self._data.get(name, _MISSING)
+        if type(value) in _SCALAR_TYPES:
+            return value
+
+        # An ATTACHED object holds no fetched fields, so lazy loading only
+        # has to be considered when the lookup misses
+        if value is _MISSING:
+            # Firestore reserves __*__ field names, so protocol probes such
+            # as copy's __deepcopy__ can never be fields and must not fetch
+            if name.startswith('__'):
+                raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+            if self._state is _ATTACHED:
+                # Load every prefetched object in one round-trip if this is one
+                if self._is_prefetched():
+                    self._load_prefetched()
+
+                if self._state is _ATTACHED:
+                    # Synchronous fetch for lazy loading
+                    self.fetch()
 
         return self._materialize_field(name)
 
@@ -154,7 +316,14 @@ class FireObject(BaseFireObject):
     # Core Lifecycle Methods (Sync-specific I/O)
     # =========================================================================
 
-    def fetch(self, force: bool = False, transaction: Optional[Any] = None) -> 'FireObject':
+    def fetch(
+        self,
+        force: bool = False,
+        transaction: Optional[Any] = None,
+        prefetch_collections: bool = False,
+        source: str = 'server',
+        if_modified: bool = False,
+    ) -> 'FireObject':
         """
         Fetch document data from Firestore (synchronous).
 
@@ -168,14 +337,34 @@ class FireObject(BaseFireObject):
                   Default is False.
             transaction: Optional transaction object for transactional reads.
                         If provided, the read will be part of the transaction.
+            prefetch_collections: If True, list the document's subcollections
+                                 in the background while the document is
+                                 fetched. The next collections() call returns
+                                 that listing instead of issuing its own RPC.
+            source: Where to read from. 'server' (default) always reads from
+                   Firestore. 'cache' serves the most recent snapshot read
+                   by this process within the recent-snapshot TTL, with no
+                   RPC; the cache must first be enabled with
+                   configure_recent_snapshots(). 'server_and_cache' reads
+                   from Firestore, giving up after SERVER_AND_CACHE_TIMEOUT
+                   seconds (retries included), and falls back to that
+                   snapshot if the server is unavailable or too slow.
+            if_modified: With force=True, first read only the document's
+                        metadata and skip the full read if its update_time
+                        matches the loaded data. Saves bandwidth and decoding
+                        when polling documents that rarely change, at the
+                        cost of a second round-trip when they have changed.
+                        Objects with unsaved changes are always re-read.
 
         Returns:
             Self, to allow method chaining.
 
         Raises:
-            ValueError: If called on a DETACHED object (no DocumentReference).
+            ValueError: If called on a DETACHED object (no DocumentReference),
+                       or source is invalid or combined with a transaction.
             RuntimeError: If called on a DELETED object.
-            NotFound: If document doesn't exist in Firestore.
+            NotFound: If document doesn't exist in Firestore, or
+                     source='cache' and no recent snapshot is cached.
 
         State Transitions:
             ATTACHED -> LOADED: First fetch populates data
@@ -186,6 +375,9 @@ class FireObject(BaseFireObject):
             user = db.doc('users/alovelace')  # ATTACHED
             user.fetch()  # Now LOADED with data
 
+            # Stale-tolerant read with no RPC
+            user.fetch(force=True, source='cache')
+
             # Transactional fetch
             transaction = db.transaction()
             @firestore.transactional
@@ -194,14 +386,96 @@ class FireObject(BaseFireObject):
                 return user.credits
             credits = read_user(transaction)
         """
-        if self._should_skip_fetch(force):
+        # Only LOADED and ATTACHED objects can be fetched; LOADED ones are
+        # already current unless a refresh is forced
+        state = self._state
+        if state is _LOADED:
+            if not force:
+                return self
+        elif state is not _ATTACHED:
+            self._validate_has_document("fetch()")
+
+        if force:
+            invalidate(self._doc_ref, recent=False)
+            if (
+                if_modified
+                and transaction is None
+                and source == 'server'
+                and self._unmodified_on_server()
+            ):
+                return self
+
+        if not prefetch_collections:
+            snapshot = self._read_snapshot(transaction, source)
+            self._process_snapshot(snapshot, is_async=False)
             return self
 
-        snapshot = self._get_snapshot(transaction)
+        listing = _get_prefetch_executor().submit(self._list_collection_ids)
+        snapshot = self._read_snapshot(transaction, source)
         self._process_snapshot(snapshot, is_async=False)
+        object.__setattr__(self, '_prefetched_collections', listing.result())
 
         return self
 
+    def _load_prefetched(self) -> None:
+        """Fetch every pending prefetched FireObject, grouped by client."""
+        objects = self._take_prefetched(FireObject)
+
+        by_client: Dict[int, List['FireObject']] = {}
+        for obj in objects:
+            by_client.setdefault(id(obj._doc_ref._client), []).append(obj)
+
+        for group in by_client.values():
+            try:
+                self.fetch_many(group)
+            except NotFound:
+                # Missing documents stay ATTACHED; each raises NotFound
+                # from its own fetch() when it is accessed
+                pass
+
+    @classmethod
+    def fetch_many(
+        cls,
+        objects: Iterable['FireObject'],
+        force: bool = False,
+        *,
+        missing_ok: bool = False,
+    ) -> List['FireObject']:
+        """
+        Fetch several documents with a single get_all() round-trip.
+
+        Calling fetch() (or triggering lazy loading) on N ATTACHED objects
+        costs N sequential RPCs. fetch_many() sends all their references in
+        one batched get and hydrates every object from the result.
+
+        Args:
+            objects: FireObjects to fetch. They must share a client.
+            force: If True, also refresh objects that are already LOADED.
+            missing_ok: If True, leave objects for documents that don't
+                       exist ATTACHED instead of raising NotFound.
+
+        Returns:
+            The objects, as a list in the order given.
+
+        Raises:
+            ValueError: If any object is DETACHED.
+            RuntimeError: If any object is DELETED.
+            NotFound: If some documents don't exist and missing_ok is False.
+                     All existing documents are still loaded before this is
+                     raised.
+
+        Example:
+            users = [db.doc(f'users/{uid}') for uid in user_ids]
+            FireObject.fetch_many(users)  # One RPC
+            names = [user.name for user in users]  # No further fetches
+        """
+        objects = list(objects)
+        pending, refs, snapshots = cls._plan_fetch_many(objects, force)
+        if refs:
+            snapshots.extend(refs[0]._client.get_all(refs))
+        cls._hydrate_fetch_many(pending, snapshots, is_async=False, missing_ok=missing_ok)
+        return objects
+
     def save(
         self,
         doc_id: Optional[str] = None,
@@ -215,6 +489,12 @@ class FireObject(BaseFireObject):
         current state. For DETACHED objects, creates a new document. For
         LOADED objects, performs a full overwrite (Phase 1).
 
+        Saving an ATTACHED object with no assigned fields makes no network
+        call: it neither creates an empty document nor wipes an existing one,
+        and the object stays ATTACHED. Assigned fields on an ATTACHED object
+        are written with a full set() rather than set(merge=True), so the
+        object's data matches the stored document once it becomes LOADED.
+
         Args:
             doc_id: Optional custom document ID. Only used when saving a
                    DETACHED object. If None, Firestore auto-generates an ID.
@@ -234,6 +514,8 @@ class FireObject(BaseFireObject):
         State Transitions:
             DETACHED -> LOADED: Creates new document with doc_id or auto-ID
             LOADED -> LOADED: Updates document if dirty, no-op if clean
+            ATTACHED -> LOADED: Overwrites document with the assigned fields
+            ATTACHED -> ATTACHED: No-op if no fields were assigned
 
         Example:
             # Create new document
@@ -262,27 +544,31 @@ class FireObject(BaseFireObject):
         """
         self._validate_not_deleted("save()")
 
-        if self._state == State.DETACHED:
+        state = self._state
+        if state is _DETACHED:
             doc_ref, storage_data = self._prepare_detached_save(doc_id, transaction, batch)
             self._write_set(storage_data, doc_ref=doc_ref)
-            object.__setattr__(self, '_state', State.LOADED)
-            self._mark_clean()
+            self._transition_loaded_clean()
             return self
 
-        if self._state == State.LOADED:
+        if state is _LOADED:
             if not self.is_dirty():
                 return self
 
             update_dict = self._build_update_dict()
             self._write_update(update_dict, transaction=transaction, batch=batch)
-            self._mark_clean()
+            self._transition_loaded_clean()
             return self
 
-        if self._state == State.ATTACHED:
+        if state is _ATTACHED:
+            # Nothing was fetched or modified, so a set() would only wipe
+            # the stored document; stay ATTACHED and skip the write
+            if not self.is_dirty():
+                return self
+
             storage_data = self._prepare_data_for_storage()
             self._write_set(storage_data, transaction=transaction, batch=batch)
-            object.__setattr__(self, '_state', State.LOADED)
-            self._mark_clean()
+            self._transition_loaded_clean()
             return self
 
         return self
@@ -297,14 +583,22 @@ class FireObject(BaseFireObject):
         Returns:
             List of subcollection names or FireCollection wrappers.
         """
-        self._validate_not_detached("collections()")
-        self._validate_not_deleted("collections()")
+        self._validate_has_document("collections()")
+
+        collection_ids = self._prefetched_collections
+        if collection_ids is None:
+            collection_ids = self._list_collection_ids()
+        else:
+            object.__setattr__(self, '_prefetched_collections', None)
 
-        subcollections = list(self._doc_ref.collections())
         if names_only:
-            return [col.id for col in subcollections]
+            return collection_ids
+
+        return [self.collection(name) for name in collection_ids]
 
-        return [self.collection(col.id) for col in subcollections]
+    def _list_collection_ids(self) -> List[str]:
+        """List the IDs of this document's subcollections."""
+        return [col.id for col in self._doc_ref.collections()]
 
     def delete(
         self,
@@ -312,6 +606,8 @@ class FireObject(BaseFireObject):
         *,
         recursive: bool = True,
         batch_size: int = 50,
+        max_workers: int = 8,
+        subcollection_ids: Optional[Iterable[str]] = None,
     ) -> None:
         """
         Delete the document from Firestore (synchronous).
@@ -325,11 +621,20 @@ class FireObject(BaseFireObject):
                   the delete will be accumulated in the batch (committed later).
             recursive: When True (default), delete all subcollections first.
             batch_size: Batch size to use for recursive subcollection cleanup.
+            max_workers: Maximum number of subcollections (or, with
+                        subcollection_ids, delete batches) cleared concurrently
+                        during recursive deletion. Use 1 to clear them serially.
+            subcollection_ids: Optional collection IDs to clear with one
+                              collection-group query each instead of walking
+                              the subcollection tree level by level. Only
+                              descendants in collections with these IDs (at
+                              any depth) are deleted.
 
         Raises:
             ValueError: If called on a DETACHED object (no document to delete).
             RuntimeError: If called on an already-DELETED object.
-            ValueError: If recursive deletion is requested while using a batch.
+            ValueError: If recursive deletion is requested while using a batch,
+                       or if batch_size or max_workers is not positive.
 
         State Transitions:
             ATTACHED -> DELETED: Deletes document (data never loaded)
@@ -352,17 +657,117 @@ class FireObject(BaseFireObject):
                 raise ValueError("Cannot delete recursively as part of a batch.")
             if batch_size <= 0:
                 raise ValueError(f"batch_size must be positive, got {batch_size}")
-            self._delete_descendant_collections(batch_size=batch_size)
+            if max_workers <= 0:
+                raise ValueError(f"max_workers must be positive, got {max_workers}")
+            if subcollection_ids is not None:
+                self._delete_collection_group_descendants(subcollection_ids, batch_size, max_workers)
+            else:
+                self._delete_descendant_collections(batch_size=batch_size, max_workers=max_workers)
 
         self._prepare_delete()
         self._write_delete(batch=batch)
         self._transition_to_deleted()
 
-    def _delete_descendant_collections(self, batch_size: int) -> None:
-        """Delete all subcollections beneath this document."""
-        for name in self.collections(names_only=True):
-            subcollection = self.collection(name)
-            subcollection.delete_all(batch_size=batch_size, recursive=True)
+    def _delete_collection_group_descendants(
+        self, collection_ids: Iterable[str], batch_size: int, max_workers: int = 8
+    ) -> None:
+        """
+        Delete descendants in the given collection groups.
+
+        Each collection ID is one streaming collection-group query bounded
+        to this document's path, so the whole hierarchy is found without
+        listing it level by level. Only document IDs are fetched. Deletes
+        are committed batch_size at a time, with up to max_workers commits
+        in flight. The first failure cancels pending commits and is
+        re-raised.
+        """
+        client = self._doc_ref._client
+
+        def commit(refs: List[Any]) -> None:
+            batch = client.batch()
+            for ref in refs:
+                batch.delete(ref)
+            batch.commit()
+
+        chunks = self._collection_group_chunks(collection_ids, batch_size)
+        if max_workers == 1:
+            for refs in chunks:
+                commit(refs)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(commit, refs) for refs in chunks]
+            done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in pending:
+                future.cancel()
+            for future in done:
+                future.result()
+
+    def _collection_group_chunks(
+        self, collection_ids: Iterable[str], batch_size: int
+    ) -> Iterator[List[Any]]:
+        """Yield references to this document's descendants, batch_size at a time."""
+        refs: List[Any] = []
+        for collection_id in collection_ids:
+            for snapshot in self._descendant_group_query(collection_id).stream():
+                refs.append(snapshot.reference)
+                if len(refs) == batch_size:
+                    yield refs
+                    refs = []
+        if refs:
+            yield refs
+
+    def _delete_descendant_collections(self, batch_size: int, max_workers: int = 8) -> None:
+        """
+        Delete all subcollections beneath this document.
+
+        Subcollections are independent, so they are cleared on a thread pool
+        (gRPC calls from different threads run concurrently). The first
+        failure cancels pending work and is re-raised.
+        """
+        names = self.collections(names_only=True)
+        if len(names) <= 1 or max_workers == 1:
+            for name in names:
+                self.collection(name).delete_all(batch_size=batch_size, recursive=True)
+            return
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(names))) as executor:
+            futures = [
+                executor.submit(self.collection(name).delete_all, batch_size=batch_size, recursive=True)
+                for name in names
+            ]
+            done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in pending:
+                future.cancel()
+            for future in done:
+                future.result()
+
+    # =========================================================================
+    # Event-Loop Bridges
+    # =========================================================================
+
+    async def afetch(self, *args: Any, **kwargs: Any) -> 'FireObject':
+        """
+        Run fetch() in a worker thread so the event loop is not blocked.
+
+        Accepts the same arguments as fetch(). Each call pays for a thread
+        hop; code that is async end-to-end should use AsyncFireObject.
+
+        Example:
+            async def handler():
+                user = db.doc('users/alovelace')
+                await user.afetch()
+                return user.name
+        """
+        return await asyncio.to_thread(self.fetch, *args, **kwargs)
+
+    async def asave(self, *args: Any, **kwargs: Any) -> 'FireObject':
+        """Run save() in a worker thread. Accepts the same arguments as save()."""
+        return await asyncio.to_thread(self.save, *args, **kwargs)
+
+    async def adelete(self, *args: Any, **kwargs: Any) -> None:
+        """Run delete() in a worker thread. Accepts the same arguments as delete()."""
+        await asyncio.to_thread(self.delete, *args, **kwargs)
 
     # =========================================================================
     # Subcollection Utilities
@@ -403,11 +808,154 @@ class FireObject(BaseFireObject):
     # Factory Methods
     # =========================================================================
 
+    @classmethod
+    @contextmanager
+    def bulk(cls, client: Any, batch_size: int = MAX_BATCH_SIZE) -> Iterator[None]:
+        """
+        Route save() and delete() writes through batched commits.
+
+        Inside the block, every write made by save() or delete() on this
+        thread without an explicit transaction or batch is added to a native
+        WriteBatch instead of being sent immediately. The batch is committed
+        every batch_size writes and once more when the block exits normally.
+        This replaces N round-trips with roughly N / batch_size commits, and
+        unlike an explicit batch it also accepts DETACHED saves.
+
+        Args:
+            client: The native google.cloud.firestore.Client, or a FireProx
+                   instance wrapping one.
+            batch_size: Writes per commit (1-500). Default is 500, the
+                       Firestore limit.
+
+        Raises:
+            ValueError: If batch_size is outside 1-500, or (from save() or
+                       delete() inside the block) if a document belongs to
+                       another project or database than client.
+
+        Example:
+            with FireObject.bulk(db):
+                for i in range(1000):
+                    user = users.new()
+                    user.name = f'User {i}'
+                    user.save()      # Queued, committed in chunks of 500
+                old_user.delete(recursive=False)
+
+        Note:
+            - Objects transition state when save()/delete() is called, before
+              their write is committed.
+            - If the block raises, writes not yet committed are discarded;
+              chunks committed earlier are not rolled back.
+            - Reads (fetch, lazy loading) and recursive subcollection cleanup
+              still execute immediately.
+            - Nested bulk() blocks share the outermost writer.
+        """
+        if not 0 < batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {MAX_BATCH_SIZE}, got {batch_size}")
+
+        if _active_bulk_writer() is not None:
+            yield
+            return
+
+        native_client = getattr(client, 'native_client', client)
+        writer = _BulkWriter(native_client, batch_size)
+        _bulk_local.writer = writer
+        try:
+            yield
+            writer.flush()
+        finally:
+            _bulk_local.writer = None
+
+    @classmethod
+    def save_many(
+        cls,
+        objects: Iterable['FireObject'],
+        client: Optional[Any] = None,
+        batch_size: int = MAX_BATCH_SIZE,
+    ) -> List['FireObject']:
+        """
+        Save several objects with batched commits.
+
+        Runs save() on every object inside a bulk() block, so creates,
+        partial updates and overwrites are sent in batch_size commits
+        rather than one RPC per object. Clean LOADED objects add no write.
+
+        Args:
+            objects: FireObjects to save.
+            client: Native client (or FireProx) used for the batches.
+                   Defaults to the first object's client.
+            batch_size: Writes per commit (1-500).
+
+        Returns:
+            The objects, as a list in the order given.
+
+        Raises:
+            ValueError: If batch_size is outside 1-500, or if a DETACHED
+                       object has no parent collection.
+            RuntimeError: If any object is DELETED.
+
+        Example:
+            users = [users_collection.new() for _ in range(100)]
+            for i, user in enumerate(users):
+                user.name = f'User {i}'
+            FireObject.save_many(users)  # One commit
+        """
+        objects = list(objects)
+        if not objects:
+            return objects
+
+        with cls.bulk(client or objects[0]._native_client(), batch_size):
+            for obj in objects:
+                obj.save()
+        return objects
+
+    @classmethod
+    def delete_many(
+        cls,
+        objects: Iterable['FireObject'],
+        client: Optional[Any] = None,
+        batch_size: int = MAX_BATCH_SIZE,
+        *,
+        recursive: bool = True,
+    ) -> None:
+        """
+        Delete several documents with batched commits.
+
+        Runs delete() on every object inside a bulk() block, so the
+        document deletes are sent in batch_size commits rather than one
+        RPC per object.
+
+        Args:
+            objects: FireObjects to delete.
+            client: Native client (or FireProx) used for the batches.
+                   Defaults to the first object's client.
+            batch_size: Writes per commit (1-500).
+            recursive: When True (default), each document's subcollections
+                      are cleared first. That cleanup runs immediately and
+                      is not part of the batched commits.
+
+        Raises:
+            ValueError: If batch_size is outside 1-500, or if any object
+                       is DETACHED.
+            RuntimeError: If any object is already DELETED.
+
+        Example:
+            FireObject.delete_many(old_users, recursive=False)
+        """
+        objects = list(objects)
+        if not objects:
+            return
+
+        with cls.bulk(client or objects[0]._native_client(), batch_size):
+            for obj in objects:
+                obj.delete(recursive=recursive)
+
     @classmethod
     def from_snapshot(
         cls,
-        snapshot: DocumentSnapshot,
-        parent_collection: Optional[Any] = None
+        snapshot: 'DocumentSnapshot',
+        parent_collection: Optional[Any] = None,
+        *,
+        copy: bool = True,
     ) -> 'FireObject':
         """
         Create a FireObject from a Firestore DocumentSnapshot.
@@ -420,6 +968,9 @@ class FireObject(BaseFireObject):
             snapshot: A DocumentSnapshot from google-cloud-firestore, typically
                      obtained from query results or document.get().
             parent_collection: Optional reference to parent FireCollection.
+            copy: If False, skip the deep copy made by snapshot.to_dict().
+                 Nested lists and maps are then shared with the snapshot, so
+                 only pass False for snapshots that are not used afterwards.
 
         Returns:
             A new FireObject instance in LOADED state with data from snapshot.
@@ -438,16 +989,48 @@ class FireObject(BaseFireObject):
             user = FireObject.from_snapshot(snap)
         """
         # Use base class helper to extract snapshot data
-        init_params = cls._create_from_snapshot_base(snapshot, parent_collection)
+        doc_ref, data = cls._create_from_snapshot_base(snapshot, parent_collection, copy=copy)
 
-        # Create FireObject in LOADED state
-        obj = cls(
-            doc_ref=init_params['doc_ref'],
-            initial_state=init_params['initial_state'],
-            parent_collection=init_params['parent_collection']
-        )
+        # Create FireObject in LOADED state; dirty tracking starts empty
+        return cls._new_loaded(doc_ref, data, parent_collection, None, snapshot.update_time)
 
-        # Populate data from snapshot
-        object.__setattr__(obj, '_data', init_params['data'])
+    @classmethod
+    def from_snapshots(
+        cls,
+        snapshots: Iterable['DocumentSnapshot'],
+        parent_collection: Optional[Any] = None,
+        *,
+        copy: bool = True,
+    ) -> List['FireObject']:
+        """
+        Create FireObjects from an iterable of DocumentSnapshots.
+
+        Equivalent to calling from_snapshot() on each snapshot, but with
+        the per-object lookups hoisted out of the loop. Use this when
+        hydrating whole query results.
+
+        Args:
+            snapshots: DocumentSnapshots, e.g. from native_query.stream().
+            parent_collection: Optional reference to parent FireCollection.
+            copy: If False, skip the per-snapshot deep copy; see
+                 from_snapshot().
 
-        return obj
+        Returns:
+            List of FireObjects in LOADED state, in snapshot order.
+
+        Raises:
+            ValueError: If any snapshot doesn't exist.
+
+        Example:
+            native_query = client.collection('users').where('year', '>', 1800)
+            results = FireObject.from_snapshots(native_query.stream())
+        """
+        create = cls._create_from_snapshot_base
+        new_loaded = cls._new_loaded
+
+        results: List['FireObject'] = []
+        append = results.append
+        for snapshot in snapshots:
+            doc_ref, data = create(snapshot, parent_collection, copy=copy)
+            append(new_loaded(doc_ref, data, parent_collection, None, snapshot.update_time))
+        return results
@@ -6,13 +6,38 @@ Firestore Query objects and provides a chainable interface for building and
 executing queries.
 """
 
-from typing import Any, Dict, Iterator, List, Optional, Union
+import threading
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import partial
+from operator import attrgetter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
 
 from google.cloud.firestore_v1.base_query import FieldFilter
 from google.cloud.firestore_v1.document import DocumentReference
 from google.cloud.firestore_v1.query import Query
 
+from .base_fire_object import _SCALAR_TYPES
+from .base_fire_query import order_direction, shard_cursors, validate_operator
 from .fire_object import FireObject
+from .request_cache import recent_query_results, store_query_results
+
+# Default pool for running independent queries concurrently. The gRPC
+# channel multiplexes concurrent streams and workers release the GIL while
+# waiting on the network. Created on first use, so processes that never call
+# get_future()/get_many() (or pass their own executor) don't have it.
+QUERY_POOL_SIZE = 32
+_query_pool: Optional[ThreadPoolExecutor] = None
+_query_pool_lock = threading.Lock()
+
+
+def _default_query_pool() -> ThreadPoolExecutor:
+    """Return the shared query pool, creating it on first use."""
+    global _query_pool
+    if _query_pool is None:
+        with _query_pool_lock:
+            if _query_pool is None:
+                _query_pool = ThreadPoolExecutor(max_workers=QUERY_POOL_SIZE, thread_name_prefix='fire_prox_query')
+    return _query_pool
 
 
 class FireQuery:
@@ -54,6 +79,9 @@ class FireQuery:
             results = [FireObject.from_snapshot(snap) for snap in native_query.stream()]
     """
 
+    # Every builder call creates a new query, so keep instances small
+    __slots__ = ('_query', '_parent_collection', '_projection')
+
     def __init__(
         self,
         native_query: Query,
@@ -91,13 +119,16 @@ class FireQuery:
                 '<' (less than), '<=' (less than or equal),
                 '>' (greater than), '>=' (greater than or equal),
                 'in' (value in list), 'not-in' (value not in list),
-                'array-contains' (array contains value),
-                'array-contains-any' (array contains any of the values).
+                'array_contains' (array contains value),
+                'array_contains_any' (array contains any of the values).
             value: The value to compare against.
 
         Returns:
             A new FireQuery instance with the added filter.
 
+        Raises:
+            ValueError: If op is not a supported comparison operator.
+
         Example:
             # Single condition
             query = users.where('birth_year', '>', 1800)
@@ -107,6 +138,8 @@ class FireQuery:
                      .where('birth_year', '>', 1800)
                      .where('country', '==', 'England'))
         """
+        validate_operator(op)
+
         # Create FieldFilter and add to query
         filter_obj = FieldFilter(field, op, value)
         new_query = self._query.where(filter=filter_obj)
@@ -138,17 +171,7 @@ class FireQuery:
                      .order_by('country')
                      .order_by('birth_year', direction='DESCENDING'))
         """
-        # Convert direction string to Query constant
-        if direction.upper() == 'ASCENDING':
-            from google.cloud.firestore_v1 import Query as QueryClass
-            direction_const = QueryClass.ASCENDING
-        elif direction.upper() == 'DESCENDING':
-            from google.cloud.firestore_v1 import Query as QueryClass
-            direction_const = QueryClass.DESCENDING
-        else:
-            raise ValueError(f"Invalid direction: {direction}. Must be 'ASCENDING' or 'DESCENDING'")
-
-        new_query = self._query.order_by(field, direction=direction_const)
+        new_query = self._query.order_by(field, direction=order_direction(direction))
         return FireQuery(new_query, self._parent_collection, self._projection)
 
     def limit(self, count: int) -> 'FireQuery':
@@ -210,8 +233,7 @@ class FireQuery:
             last_snapshot = last_doc_ref.get()
             page2 = users.order_by('age').start_at(last_snapshot).limit(10).get()
         """
-        new_query = self._query.start_at(*document_fields_or_snapshot)
-        return FireQuery(new_query, self._parent_collection, self._projection)
+        return self._with_cursor('start_at', document_fields_or_snapshot)
 
     def start_after(self, *document_fields_or_snapshot) -> 'FireQuery':
         """
@@ -241,8 +263,7 @@ class FireQuery:
             last_snapshot = last_doc_ref.get()
             page2 = users.order_by('age').start_after(last_snapshot).limit(10).get()
         """
-        new_query = self._query.start_after(*document_fields_or_snapshot)
-        return FireQuery(new_query, self._parent_collection, self._projection)
+        return self._with_cursor('start_after', document_fields_or_snapshot)
 
     def end_at(self, *document_fields_or_snapshot) -> 'FireQuery':
         """
@@ -269,8 +290,7 @@ class FireQuery:
             target_snapshot = target_doc_ref.get()
             query = users.order_by('age').end_at(target_snapshot)
         """
-        new_query = self._query.end_at(*document_fields_or_snapshot)
-        return FireQuery(new_query, self._parent_collection, self._projection)
+        return self._with_cursor('end_at', document_fields_or_snapshot)
 
     def end_before(self, *document_fields_or_snapshot) -> 'FireQuery':
         """
@@ -297,8 +317,7 @@ class FireQuery:
             target_snapshot = target_doc_ref.get()
             query = users.order_by('age').end_before(target_snapshot)
         """
-        new_query = self._query.end_before(*document_fields_or_snapshot)
-        return FireQuery(new_query, self._parent_collection, self._projection)
+        return self._with_cursor('end_before', document_fields_or_snapshot)
 
     def select(self, *field_paths: str) -> 'FireQuery':
         """
@@ -354,7 +373,7 @@ class FireQuery:
             raise ValueError("select() requires at least one field path")
 
         # Create new query with projection
-        new_query = self._query.select(list(field_paths))
+        new_query = self._query.select(field_paths)
         return FireQuery(new_query, self._parent_collection, projection=field_paths)
 
     def find_nearest(
@@ -405,12 +424,10 @@ class FireQuery:
             - Maximum limit is 1000 documents
             - Does not work with Firestore emulator (production only)
         """
-        # Create vector query using native find_nearest
+        # Create vector query using native find_nearest (note the native
+        # argument order puts limit before distance_measure)
         new_query = self._query.find_nearest(
-            vector_field=vector_field,
-            query_vector=query_vector,
-            distance_measure=distance_measure,
-            limit=limit,
+            vector_field, query_vector, limit, distance_measure,
             distance_result_field=distance_result_field,
         )
         return FireQuery(new_query, self._parent_collection, self._projection)
@@ -689,6 +706,21 @@ class FireQuery:
     # Helper Methods
     # =========================================================================
 
+    def _with_cursor(self, cursor: str, document_fields_or_snapshot: tuple) -> 'FireQuery':
+        """
+        Return a new query with a start or end cursor applied.
+
+        Args:
+            cursor: Name of the native Query cursor method ('start_at',
+                   'start_after', 'end_at' or 'end_before').
+            document_fields_or_snapshot: Arguments for that method.
+
+        Returns:
+            A new FireQuery with the cursor applied.
+        """
+        new_query = getattr(self._query, cursor)(*document_fields_or_snapshot)
+        return FireQuery(new_query, self._parent_collection, self._projection)
+
     def _convert_projection_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Convert DocumentReferences in projection data to FireObjects.
@@ -707,7 +739,9 @@ class FireQuery:
 
         result = {}
         for key, value in data.items():
-            if isinstance(value, DocumentReference):
+            if type(value) in _SCALAR_TYPES:
+                result[key] = value
+            elif isinstance(value, DocumentReference):
                 # Convert DocumentReference to FireObject in ATTACHED state
                 result[key] = FireObject(
                     doc_ref=value,
@@ -734,11 +768,26 @@ class FireQuery:
                 result[key] = value
         return result
 
+    def _read_snapshots(self) -> List[Any]:
+        """
+        Run the query to completion and release its stream.
+
+        The stream is closed even if reading fails part-way, so the gRPC
+        call is cancelled right away instead of staying open until the
+        iterator is garbage collected. Results are fully read before any
+        hydration starts.
+        """
+        snapshot_stream = self._query.stream()
+        try:
+            return list(snapshot_stream)
+        finally:
+            snapshot_stream.close()
+
     # =========================================================================
     # Query Execution Methods
     # =========================================================================
 
-    def get(self) -> Union[List[FireObject], List[Dict[str, Any]]]:
+    def get(self, max_age: Optional[float] = None) -> Union[List[FireObject], List[Dict[str, Any]]]:
         """
         Execute the query and return results as a list.
 
@@ -746,6 +795,13 @@ class FireQuery:
         instances in LOADED state. If a projection is active (via .select()),
         returns vanilla dictionaries instead of FireObject instances.
 
+        Args:
+            max_age: If given, reuse the results of an identical query run
+                    within the last max_age seconds instead of querying
+                    Firestore again. Results may be stale by up to max_age;
+                    writes do not invalidate them. Each call still returns
+                    fresh objects.
+
         Returns:
             - If no projection: List of FireObject instances for all documents
               matching the query.
@@ -770,37 +826,162 @@ class FireQuery:
                 print(f"Found {len(results)} users")
             else:
                 print("No users found")
+
+            # Dashboard refresh: tolerate results up to 5 seconds old
+            top = query.order_by('score', direction='DESCENDING').limit(10).get(max_age=5)
         """
-        # Execute query
-        snapshots = self._query.stream()
+        # Execute query, or reuse recent results for an identical one
+        copy = False
+        if max_age is None:
+            snapshots = self._read_snapshots()
+        else:
+            snapshots = recent_query_results(self._query, max_age)
+            if snapshots is None:
+                snapshots = self._read_snapshots()
+                store_query_results(self._query, snapshots)
+            # Cached snapshots are shared between calls, so objects need their own data
+            copy = True
 
         # If projection is active, return vanilla dictionaries
         if self._projection:
-            results = []
-            for snap in snapshots:
-                data = snap.to_dict()
-                # Convert DocumentReferences to FireObjects
-                converted_data = self._convert_projection_data(data)
-                results.append(converted_data)
-            return results
+            convert = self._convert_projection_data
+            if copy:
+                # Cached snapshots are shared between calls, so convert a
+                # deep copy that the caller is free to mutate
+                return [convert(snap.to_dict()) for snap in snapshots]
+            # Fresh snapshots are not reused, so read their data directly
+            # instead of deep-copying it with to_dict() first
+            return [convert(snap._data) for snap in snapshots]
 
         # Otherwise, return FireObjects as usual
-        return [FireObject.from_snapshot(snap, self._parent_collection) for snap in snapshots]
+        return FireObject.from_snapshots(snapshots, self._parent_collection, copy=copy)
+
+    def get_future(
+        self,
+        max_age: Optional[float] = None,
+        executor: Optional[Executor] = None,
+    ) -> 'Future[Union[List[FireObject], List[Dict[str, Any]]]]':
+        """
+        Start executing the query in the background and return a Future.
+
+        The query runs on a thread pool, so the caller can do other work
+        (or start other queries) while it is in flight.
+
+        Args:
+            max_age: Passed through to get().
+            executor: Executor to run the query on. Defaults to a shared
+                     pool of QUERY_POOL_SIZE threads, created on first use.
+
+        Returns:
+            A concurrent.futures.Future whose result() is what get() returns.
+
+        Example:
+            pending = users.where('active', '==', True).get_future()
+            orders = recent_orders.get()  # Runs while users are loading
+            active_users = pending.result()
+        """
+        return (executor or _default_query_pool()).submit(self.get, max_age)
+
+    @classmethod
+    def get_many(
+        cls,
+        queries: Iterable['FireQuery'],
+        max_age: Optional[float] = None,
+        executor: Optional[Executor] = None,
+    ) -> List[Union[List[FireObject], List[Dict[str, Any]]]]:
+        """
+        Execute independent queries concurrently.
+
+        Each query runs on a thread pool, so N queries take about as long
+        as the slowest one instead of the sum of all of them.
+
+        Args:
+            queries: The queries to execute.
+            max_age: Passed through to each query's get().
+            executor: Executor to run the queries on; see get_future().
+
+        Returns:
+            One result list per query, in the order given.
+
+        Raises:
+            Any exception raised by a query's get(), after all queries have
+            been submitted.
+
+        Example:
+            active, admins = FireQuery.get_many([
+                users.where('active', '==', True),
+                users.where('role', '==', 'admin'),
+            ])
+        """
+        futures = [query.get_future(max_age, executor) for query in queries]
+        return [future.result() for future in futures]
+
+    def get_parallel(
+        self,
+        shard_field: str,
+        boundaries: Sequence[Any],
+        max_workers: Optional[int] = None,
+    ) -> Union[List[FireObject], List[Dict[str, Any]]]:
+        """
+        Execute the query as parallel shards and return results as a list.
+
+        Splits the query into contiguous ranges of shard_field at the given
+        boundaries and runs one sub-query per range concurrently on a thread pool.
+        Results are concatenated in shard order, so they match get() for
+        the same query. Useful for large result sets, where a single
+        query stream is bound by one round-trip at a time.
+
+        The query must be ordered by shard_field first and must not have
+        a limit, offset or cursor of its own.
+
+        Args:
+            shard_field: The field to shard on; the query's first order_by().
+            boundaries: Split points in the same order as the query's
+                       ordering on shard_field. N boundaries give N + 1
+                       shards.
+            max_workers: Maximum number of concurrent sub-queries.
+                        Defaults to one per shard.
+
+        Returns:
+            The same list get() would return.
+
+        Raises:
+            ValueError: If the query can't be sharded on shard_field.
+
+        Example:
+            # Dump a collection in four concurrent ranges
+            query = users_collection.order_by('birth_year')
+            users = query.get_parallel('birth_year', [1850, 1900, 1950])
+        """
+        shards = []
+        for start, end in shard_cursors(self._query, shard_field, boundaries):
+            shard = self
+            if start is not None:
+                shard = shard.start_at(start)
+            if end is not None:
+                shard = shard.end_before(end)
+            shards.append(shard)
+
+        with ThreadPoolExecutor(max_workers=max_workers or len(shards)) as executor:
+            results = list(executor.map(FireQuery.get, shards))
+        return [item for shard_results in results for item in shard_results]
 
     def stream(self) -> Union[Iterator[FireObject], Iterator[Dict[str, Any]]]:
         """
         Execute the query and stream results as an iterator.
 
-        Returns a generator that yields FireObject instances one at a time.
-        This is more memory-efficient than .get() for large result sets
+        Returns a lazy iterator that produces FireObject instances one at a
+        time. This is more memory-efficient than .get() for large result sets
         as it doesn't load all results into memory at once. If a projection
-        is active (via .select()), yields vanilla dictionaries instead.
+        is active (via .select()), produces vanilla dictionaries instead. The
+        query runs when iteration starts.
 
-        Yields:
-            - If no projection: FireObject instances in LOADED state for each
-              matching document.
-            - If projection active: Dictionaries containing only the selected
-              fields. DocumentReferences are converted to FireObjects.
+        Returns:
+            - If no projection: An iterator of FireObject instances in LOADED
+              state for each matching document.
+            - If projection active: An iterator of dictionaries containing only
+              the selected fields. DocumentReferences are converted to
+              FireObjects.
 
         Example:
             # Stream results one at a time as FireObjects
@@ -819,17 +1000,19 @@ class FireQuery:
                         .stream()):
                 print(post.title)
         """
+        # The native stream is itself lazy, so map() over it keeps the same
+        # deferred execution without a Python generator frame per result
+        snapshots = self._query.stream()
+
         # If projection is active, stream vanilla dictionaries
         if self._projection:
-            for snapshot in self._query.stream():
-                data = snapshot.to_dict()
-                # Convert DocumentReferences to FireObjects
-                converted_data = self._convert_projection_data(data)
-                yield converted_data
-        else:
-            # Otherwise, stream FireObjects as usual
-            for snapshot in self._query.stream():
-                yield FireObject.from_snapshot(snapshot, self._parent_collection)
+            # The conversion builds new containers, so read the snapshot's
+            # data directly instead of deep-copying it with to_dict() first
+            return map(self._convert_projection_data, map(attrgetter('_data'), snapshots))
+
+        # Otherwise, stream FireObjects as usual
+        hydrate = partial(FireObject.from_snapshot, parent_collection=self._parent_collection, copy=False)
+        return map(hydrate, snapshots)
 
     # =========================================================================
     # Real-Time Listeners (Sync-only)
@@ -5,13 +5,15 @@ This module provides the synchronous FireProx class, which serves as the primary
 interface for users to interact with Firestore through the simplified FireProx API.
 """
 
-from typing import Any
+from contextlib import AbstractContextManager
+from typing import Any, Iterable, List, Optional, Union
 
 from google.cloud.firestore import Client as FirestoreClient
 
 from .base_fireprox import BaseFireProx
 from .fire_collection import FireCollection
-from .fire_object import FireObject
+from .fire_object import MAX_BATCH_SIZE, FireObject
+from .fire_query import FireQuery
 
 
 class FireProx(BaseFireProx):
@@ -57,7 +59,7 @@ class FireProx(BaseFireProx):
         user.delete()
     """
 
-    def __init__(self, client: FirestoreClient):
+    def __init__(self, client: FirestoreClient, pool: Optional[Iterable[FirestoreClient]] = None):
         """
         Initialize FireProx with a native Firestore client.
 
@@ -65,9 +67,27 @@ class FireProx(BaseFireProx):
             client: A configured google.cloud.firestore.Client instance.
                    Authentication and project configuration should be handled
                    before creating this instance.
+            pool: Optional extra google.cloud.firestore.Client instances for
+                 the same project and database. Each native client
+                 multiplexes every RPC over one gRPC channel; with a pool,
+                 fetch(), save() and delete() calls on documents from this
+                 instance that are not part of a transaction, batch or
+                 bulk() block rotate between client and the pooled
+                 clients in round-robin order. Documents from FireProx
+                 instances wrapping other clients are never affected.
 
         Raises:
-            TypeError: If client is not a google.cloud.firestore.Client instance.
+            TypeError: If client or a pooled client is not a
+                      google.cloud.firestore.Client instance.
+            ValueError: If a pooled client uses another project or database,
+                       or client already has a pool from another FireProx.
+
+        Note:
+            Every collection, query and document created from this instance
+            uses its client, and each native client owns its own gRPC channel.
+            Create one client per process and share one FireProx across
+            requests. Building a client per request repeats credential
+            lookup and the TCP/TLS handshake for every request.
 
         Example:
             from google.cloud import firestore
@@ -86,6 +106,9 @@ class FireProx(BaseFireProx):
 
             # Initialize FireProx
             db = FireProx(native_client)
+
+            # Spread direct reads and writes over four channels
+            db = FireProx(native_client, pool=[firestore.Client() for _ in range(3)])
         """
         # Type checking for sync client
         if not isinstance(client, FirestoreClient):
@@ -94,7 +117,7 @@ class FireProx(BaseFireProx):
             )
 
         # Initialize base class
-        super().__init__(client)
+        super().__init__(client, pool)
 
     # =========================================================================
     # Document Access
@@ -184,6 +207,30 @@ class FireProx(BaseFireProx):
         """
         return self._create_collection_proxy(path, FireCollection)
 
+    def collection_group(self, collection_id: str) -> FireQuery:
+        """
+        Query every collection with the given ID, at any depth.
+
+        Filtering, ordering and aggregation run on the server across all
+        matching subcollections, so there is no need to walk parent
+        documents and query each subcollection from Python.
+
+        Args:
+            collection_id: The collection ID to match, e.g. 'posts' for
+                          'users/*/posts'. Must not contain '/'.
+
+        Returns:
+            A FireQuery over all documents in matching collections.
+
+        Raises:
+            ValueError: If collection_id is empty or contains '/'.
+
+        Example:
+            # Count published posts across every user
+            published = db.collection_group('posts').where('published', '==', True).count()
+        """
+        return FireQuery(self._collection_group_query(collection_id))
+
     def collections(self, path: str, *, names_only: bool = False) -> list[Any]:
         """
         List subcollections beneath the specified document path.
@@ -198,4 +245,56 @@ class FireProx(BaseFireProx):
         document = self.doc(path)
         return document.collections(names_only=names_only)
 
+    def fetch_many(
+        self,
+        documents: Iterable[Union[str, FireObject]],
+        force: bool = False,
+        *,
+        missing_ok: bool = False,
+    ) -> List[FireObject]:
+        """
+        Load several documents with one batched get.
+
+        Shorthand for FireObject.fetch_many() that also accepts paths.
+
+        Args:
+            documents: FireObjects or document paths, e.g. 'users/alovelace'.
+            force: If True, also refresh objects that are already LOADED.
+            missing_ok: If True, return objects for documents that don't
+                       exist in ATTACHED state instead of raising NotFound.
+
+        Returns:
+            FireObjects in the order given; LOADED unless missing.
+
+        Raises:
+            NotFound: If some documents don't exist and missing_ok is False.
+
+        Example:
+            ada, grace = db.fetch_many(['users/alovelace', 'users/ghopper'])
+        """
+        objects = [self.doc(doc) if isinstance(doc, str) else doc for doc in documents]
+        return FireObject.fetch_many(objects, force=force, missing_ok=missing_ok)
+
+    def bulk(self, batch_size: int = MAX_BATCH_SIZE) -> AbstractContextManager[None]:
+        """
+        Batch every save() and delete() made on this thread inside a block.
+
+        Shorthand for FireObject.bulk(db, batch_size). Writes are collected
+        into native WriteBatches and committed every batch_size operations
+        and on exit, so N writes cost about N / batch_size round-trips.
+
+        Args:
+            batch_size: Writes per commit (1-500). Default is 500.
+
+        Returns:
+            A context manager; see FireObject.bulk() for the details.
+
+        Example:
+            with db.bulk():
+                for user in db.collection('users').get_all():
+                    user.active = False
+                    user.save()  # Queued, committed in chunks of 500
+        """
+        return FireObject.bulk(self._client, batch_size)
+
     # Note: batch() and transaction() methods are inherited from BaseFireProx
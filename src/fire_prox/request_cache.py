@@ -0,0 +1,268 @@
+"""
+Snapshot caches for FireObject fetches and query results.
+
+Three caches are kept:
+
+- A request-scoped cache. Within a request_cache() block, fetch() on any
+  FireObject or AsyncFireObject reuses the snapshot already read for the
+  same document instead of issuing another get. It lives in a ContextVar,
+  so it is private to the current thread or asyncio task context.
+- A process-wide cache of recently read snapshots (bounded LRU with a
+  TTL), consulted only by fetch(source='cache') and as the fallback for
+  fetch(source='server_and_cache'). It is off until enabled with
+  configure_recent_snapshots(), so ordinary fetches don't pay for it.
+- A process-wide cache of recent query results (bounded LRU), consulted
+  only by FireQuery.get(max_age=...) and AsyncFireQuery.get(max_age=...).
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from google.api_core.exceptions import DeadlineExceeded, ServiceUnavailable
+from google.api_core.retry import Retry, if_exception_type
+from google.api_core.retry_async import AsyncRetry
+from google.cloud.exceptions import NotFound
+
+# Values accepted by fetch(source=...)
+FETCH_SOURCES = ('server', 'cache', 'server_and_cache')
+
+# Defaults for configure_recent_snapshots(): snapshots older than the TTL
+# (seconds) are not served
+RECENT_SNAPSHOT_TTL = 60.0
+RECENT_SNAPSHOT_MAX = 1000
+
+# fetch(source='server_and_cache') gives the server this long (seconds),
+# retries included, before falling back to the recent snapshot. The
+# client's default retry keeps trying for minutes during an outage.
+SERVER_AND_CACHE_TIMEOUT = 5.0
+_fallback_predicate = if_exception_type(DeadlineExceeded, ServiceUnavailable)
+FALLBACK_RETRY = Retry(predicate=_fallback_predicate, initial=0.1, maximum=1.0, timeout=SERVER_AND_CACHE_TIMEOUT)
+ASYNC_FALLBACK_RETRY = AsyncRetry(
+    predicate=_fallback_predicate, initial=0.1, maximum=1.0, timeout=SERVER_AND_CACHE_TIMEOUT
+)
+
+# Recent snapshots are only recorded once enabled (max size > 0)
+_recent_max = 0
+_recent_ttl = RECENT_SNAPSHOT_TTL
+RECENT_QUERY_MAX = 256
+
+_recent_snapshots: 'OrderedDict[Tuple[type, str], Tuple[Any, float]]' = OrderedDict()
+_recent_lock = threading.Lock()
+
+_recent_queries: 'OrderedDict[Tuple[Any, ...], Tuple[List[Any], float]]' = OrderedDict()
+
+_snapshot_cache: ContextVar[Optional[Dict[Tuple[type, str], Any]]] = ContextVar(
+    'fire_prox_snapshot_cache', default=None
+)
+
+
+@contextmanager
+def request_cache() -> Iterator[None]:
+    """
+    Deduplicate document reads for the duration of a block.
+
+    The first fetch() of a document inside the block reads it from
+    Firestore; later fetch() calls (including lazy loads) for the same
+    document on any FireObject reuse that snapshot. save() and delete()
+    drop the cached entry for the document they write. Transactional
+    reads and fetch(force=True) always go to Firestore. Nested blocks
+    share the outermost cache.
+
+    Example:
+        from fire_prox import request_cache
+
+        with request_cache():
+            a = db.doc('users/alovelace')
+            b = db.doc('users/alovelace')
+            a.fetch()  # Reads from Firestore
+            b.fetch()  # Served from the cache
+    """
+    if _snapshot_cache.get() is not None:
+        yield
+        return
+
+    token = _snapshot_cache.set({})
+    try:
+        yield
+    finally:
+        _snapshot_cache.reset(token)
+
+
+def _cache_key(doc_ref: Any) -> Tuple[type, str]:
+    # Sync and async references produce differently typed snapshots, and
+    # the full path keeps documents from different databases apart
+    return type(doc_ref), doc_ref._document_path
+
+
+def cached_snapshot(doc_ref: Any) -> Optional[Any]:
+    """Return the cached snapshot for doc_ref, or None."""
+    cache = _snapshot_cache.get()
+    if cache is None:
+        return None
+    return cache.get(_cache_key(doc_ref))
+
+
+def configure_recent_snapshots(
+    max_size: int = RECENT_SNAPSHOT_MAX,
+    ttl: float = RECENT_SNAPSHOT_TTL,
+) -> None:
+    """
+    Enable, resize or disable the process-wide recent-snapshot cache.
+
+    fetch(source='cache') and the fallback of
+    fetch(source='server_and_cache') can only serve snapshots recorded
+    while this cache is enabled. It is disabled by default, so ordinary
+    fetches skip the lock and bookkeeping.
+
+    Args:
+        max_size: Maximum number of snapshots kept (least recently stored
+                 are evicted first). 0 disables the cache and drops its
+                 contents.
+        ttl: Snapshots older than this many seconds are not served.
+
+    Raises:
+        ValueError: If max_size or ttl is negative.
+
+    Example:
+        from fire_prox import configure_recent_snapshots
+
+        configure_recent_snapshots(max_size=500, ttl=30)
+        user = db.doc('users/alovelace').fetch(source='server_and_cache')
+    """
+    global _recent_max, _recent_ttl
+    if max_size < 0 or ttl < 0:
+        raise ValueError("max_size and ttl must not be negative")
+
+    with _recent_lock:
+        _recent_max = max_size
+        _recent_ttl = ttl
+        while len(_recent_snapshots) > max_size:
+            _recent_snapshots.popitem(last=False)
+
+
+def store_snapshot(doc_ref: Any, snapshot: Any) -> None:
+    """Record a snapshot just read from Firestore for doc_ref."""
+    key = _cache_key(doc_ref)
+    cache = _snapshot_cache.get()
+    if cache is not None:
+        cache[key] = snapshot
+
+    if not _recent_max:
+        return
+    with _recent_lock:
+        _recent_snapshots[key] = (snapshot, time.monotonic())
+        _recent_snapshots.move_to_end(key)
+        if len(_recent_snapshots) > _recent_max:
+            _recent_snapshots.popitem(last=False)
+
+
+def recent_snapshot(doc_ref: Any) -> Any:
+    """
+    Return the most recent snapshot read for doc_ref within the TTL.
+
+    Raises:
+        NotFound: If no snapshot of the document is cached.
+    """
+    key = _cache_key(doc_ref)
+    with _recent_lock:
+        entry = _recent_snapshots.get(key)
+        if entry is not None and time.monotonic() - entry[1] > _recent_ttl:
+            del _recent_snapshots[key]
+            entry = None
+
+    if entry is None:
+        raise NotFound(f"Document {doc_ref.path} is not in the local cache")
+    return entry[0]
+
+
+def validate_source(source: str, transaction: Optional[Any]) -> None:
+    """
+    Validate a fetch(source=...) argument.
+
+    Raises:
+        ValueError: If source is unknown, or a cache source is combined
+                   with a transaction.
+    """
+    if source not in FETCH_SOURCES:
+        raise ValueError(f"source must be one of {', '.join(FETCH_SOURCES)}, got {source!r}")
+    if source != 'server' and transaction is not None:
+        raise ValueError("Transactional reads must use source='server'")
+
+
+def invalidate(doc_ref: Any, recent: bool = True) -> None:
+    """
+    Drop cached snapshots for doc_ref.
+
+    Args:
+        doc_ref: The document whose snapshots to drop.
+        recent: If False, keep the process-wide recent snapshot and only
+               clear the request-scoped cache (used by forced refreshes,
+               which still allow a cache fallback).
+    """
+    key = _cache_key(doc_ref)
+    cache = _snapshot_cache.get()
+    if cache is not None:
+        cache.pop(key, None)
+
+    if not recent:
+        return
+    with _recent_lock:
+        _recent_snapshots.pop(key, None)
+
+
+def _query_key(query: Any) -> Optional[Tuple[Any, ...]]:
+    """
+    Return the key under which query's results are cached, or None.
+
+    Two queries share a key only if they would return the same documents.
+    The key combines the query class (keeping sync and async apart), the
+    parent path (the structured query proto omits the parent document) and
+    the serialized structured query. The native queries expose neither the
+    proto nor the parent publicly, so this is the one place that reads
+    their private _to_protobuf(), _nested_query and _parent attributes.
+    Vector queries have no parent of their own and resolve it through the
+    query they wrap; their proto does include the find_nearest stage.
+
+    Returns None, so the query is never cached, for any query shape these
+    attributes don't cover.
+    """
+    try:
+        query_pb = query._to_protobuf()
+        parent = getattr(query, '_nested_query', query)._parent
+        parent_path = parent._parent_info()[0]
+    except AttributeError:
+        return None
+    return (
+        type(query),
+        parent_path,
+        type(query_pb).pb(query_pb).SerializeToString(deterministic=True),
+    )
+
+
+def recent_query_results(query: Any, max_age: float) -> Optional[List[Any]]:
+    """Return the snapshots last read for an identical query, or None if older than max_age."""
+    key = _query_key(query)
+    if key is None:
+        return None
+    with _recent_lock:
+        entry = _recent_queries.get(key)
+        if entry is None or time.monotonic() - entry[1] > max_age:
+            return None
+        _recent_queries.move_to_end(key)
+        return entry[0]
+
+
+def store_query_results(query: Any, snapshots: List[Any]) -> None:
+    """Record the snapshots just returned by query."""
+    key = _query_key(query)
+    if key is None:
+        return
+    with _recent_lock:
+        _recent_queries[key] = (snapshots, time.monotonic())
+        _recent_queries.move_to_end(key)
+        if len(_recent_queries) > RECENT_QUERY_MAX:
+            _recent_queries.popitem(last=False)
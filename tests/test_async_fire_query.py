@@ -95,6 +95,14 @@ class TestBasicQueriesAsync:
         for user in results:
             assert user.country != 'England'
 
+    async def test_where_invalid_operator_raises_error(self, async_test_collection):
+        """Test that an unsupported operator raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid operator"):
+            async_test_collection.where('country', '===', 'England')
+
+        with pytest.raises(ValueError, match="Invalid operator"):
+            async_test_collection.where('score', '>', 90).where('country', 'like', 'Eng')
+
 
 @pytest.mark.asyncio
 class TestChainedQueriesAsync:
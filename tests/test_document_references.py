@@ -368,6 +368,32 @@ class TestAsyncReferences:
         assert author.path == 'users/ada'
         assert author.name == 'Ada'
 
+    @pytest.mark.asyncio
+    async def test_async_prefetch_scope_loads_references_together(self, async_db):
+        """Test async references hydrated in prefetch_scope() load on first access."""
+        from fire_prox import AsyncFireObject
+
+        users = async_db.collection('users')
+        posts = async_db.collection('posts')
+
+        for i in range(3):
+            user = users.new()
+            user.name = f'User {i}'
+            await user.save(doc_id=f'user{i}')
+
+            post = posts.new()
+            post.title = f'Post {i}'
+            post.author = user
+            await post.save(doc_id=f'post{i}')
+
+        results = [async_db.doc(f'posts/post{i}') for i in range(3)]
+        with AsyncFireObject.prefetch_scope():
+            await async_db.fetch_many(results)
+            assert results[0].author.name == 'User 0'
+
+            # Every other author was loaded by the same batched get
+            assert all(post.author.is_loaded() for post in results)
+
     @pytest.mark.asyncio
     async def test_async_list_of_references(self, async_db):
         """Test list of references with async."""
@@ -560,3 +586,54 @@ class TestReferenceEdgeCases:
         assert 'author' in post_dict
         assert hasattr(post_dict['author'], 'path')
         assert post_dict['author'].path == 'users/ada'
+
+    def test_prefetch_scope_loads_references_together(self, db):
+        """Test references hydrated in prefetch_scope() load on first access."""
+        from fire_prox import FireObject
+
+        users = db.collection('users')
+        posts = db.collection('posts')
+
+        for i in range(3):
+            user = users.new()
+            user.name = f'User {i}'
+            user.save(doc_id=f'user{i}')
+
+            post = posts.new()
+            post.title = f'Post {i}'
+            post.author = user
+            post.save(doc_id=f'post{i}')
+
+        with FireObject.prefetch_scope():
+            results = list(posts.get_all())
+            first_author = results[0].author
+            assert first_author.name.startswith('User')
+
+            # Every other author was loaded by the same fetch
+            assert all(post.author.is_loaded() for post in results)
+
+    def test_prefetch_loads_registered_objects_together(self, db):
+        """Test prefetch() loads every registered object on the first access."""
+        import gc
+        import weakref
+
+        from fire_prox import FireObject
+
+        users = db.collection('users')
+        for i in range(3):
+            user = users.new()
+            user.name = f'User {i}'
+            user.save(doc_id=f'prefetched{i}')
+
+        loaded = [db.doc(f'users/prefetched{i}') for i in range(3)]
+        dropped = db.doc('users/never_accessed')
+        FireObject.prefetch(loaded + [dropped])
+
+        # Registration does not keep objects the caller releases alive
+        dropped_ref = weakref.ref(dropped)
+        del dropped
+        gc.collect()
+        assert dropped_ref() is None
+
+        assert loaded[0].name == 'User 0'
+        assert all(user.is_loaded() for user in loaded)
@@ -94,6 +94,31 @@ class TestBasicQueries:
         for user in results:
             assert user.country != 'England'
 
+    def test_where_in_tuple_distinguishes_element_types(self, test_collection):
+        """Test that chained 'in' filters with equal-comparing tuples are not conflated."""
+        test_collection._collection_ref.document('user1').update({'flag': 1})
+        test_collection._collection_ref.document('user2').update({'flag': True})
+
+        ints = test_collection.where('score', '>', 0).where('flag', 'in', (1,)).get()
+        bools = test_collection.where('score', '>', 0).where('flag', 'in', (True,)).get()
+
+        assert [user.name for user in ints] == ['Ada Lovelace']
+        assert [user.name for user in bools] == ['Charles Babbage']
+
+        # Same for filters applied directly on the collection
+        assert [user.name for user in test_collection.where('flag', 'in', (1,)).get()] == ['Ada Lovelace']
+        assert [user.name for user in test_collection.where('flag', 'in', (True,)).get()] == ['Charles Babbage']
+        assert [user.name for user in test_collection.where('flag', 'in', [1]).get()] == ['Ada Lovelace']
+        assert [user.name for user in test_collection.where('flag', 'in', [True]).get()] == ['Charles Babbage']
+
+    def test_where_invalid_operator_raises_error(self, test_collection):
+        """Test that an unsupported operator raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid operator"):
+            test_collection.where('country', '===', 'England')
+
+        with pytest.raises(ValueError, match="Invalid operator"):
+            test_collection.where('score', '>', 90).where('country', 'like', 'Eng')
+
 
 class TestChainedQueries:
     """Test chaining multiple query operations."""
@@ -247,6 +272,54 @@ class TestQueryExecution:
 
         assert results == []
 
+    def test_get_max_age_reuses_recent_results(self, test_collection):
+        """Test that get(max_age=...) serves identical queries from recent results."""
+        first = test_collection.where('country', '==', 'USA').get(max_age=60)
+
+        # Write behind the cache's back; the recent results are still served
+        test_collection.doc('user4').delete()
+        cached = test_collection.where('country', '==', 'USA').get(max_age=60)
+        fresh = test_collection.where('country', '==', 'USA').get()
+
+        assert [user.name for user in cached] == ['Grace Hopper']
+        assert fresh == []
+
+        # Objects are independent copies
+        cached[0].name = 'Changed'
+        assert first[0].name == 'Grace Hopper'
+
+    def test_get_max_age_results_do_not_share_nested_values(self, test_collection):
+        """Test that mutating a nested value in cached results never reaches later hits."""
+        test_collection._collection_ref.document('user1').update({'history': [{'event': 'born'}]})
+
+        def query():
+            return test_collection.where('name', '==', 'Ada Lovelace')
+
+        query().get(max_age=60)[0].history[0]['event'] = 'changed'
+        assert query().get(max_age=60)[0].history[0]['event'] == 'born'
+
+        query().select('history').get(max_age=60)[0]['history'][0]['event'] = 'changed'
+        assert query().select('history').get(max_age=60)[0]['history'][0]['event'] == 'born'
+
+    def test_get_max_age_with_vector_query(self, test_collection):
+        """Test that get(max_age=...) also works for find_nearest() queries."""
+        from google.cloud.firestore_v1.base_vector_query import DistanceMeasure
+        from google.cloud.firestore_v1.vector import Vector
+
+        for doc_id, embedding in [('user1', [1.0, 0.0]), ('user4', [0.0, 1.0])]:
+            test_collection._collection_ref.document(doc_id).update({'embedding': Vector(embedding)})
+
+        def nearest():
+            return test_collection.find_nearest(
+                'embedding', Vector([0.9, 0.1]), DistanceMeasure.EUCLIDEAN, limit=1
+            )
+
+        first = nearest().get(max_age=60)
+        cached = nearest().get(max_age=60)
+
+        assert [user.name for user in first] == ['Ada Lovelace']
+        assert [user.name for user in cached] == ['Ada Lovelace']
+
     def test_get_all_returns_all_documents(self, test_collection):
         """Test that get_all() returns all documents in collection."""
         results = list(test_collection.get_all())
@@ -504,6 +577,55 @@ class TestQueryPagination:
         assert page2_results[1].birth_year == 1815  # Ada
 
 
+class TestParallelGet:
+    """Test sharded get_parallel()."""
+
+    def test_get_parallel_matches_get(self, test_collection):
+        """Test that sharded results equal the unsharded query, in order."""
+        query = test_collection.order_by('birth_year')
+
+        results = query.get_parallel('birth_year', [1815, 1905])
+
+        assert [user.birth_year for user in results] == [1791, 1815, 1903, 1906, 1912]
+        assert all(user.is_loaded() for user in results)
+
+    def test_get_many_runs_queries_concurrently(self, test_collection):
+        """Test that get_many() returns each query's results in order."""
+        from src.fire_prox import FireQuery
+
+        england, usa = FireQuery.get_many([
+            test_collection.where('country', '==', 'England'),
+            test_collection.where('country', '==', 'USA'),
+        ])
+
+        assert len(england) == 3
+        assert [user.name for user in usa] == ['Grace Hopper']
+        assert test_collection.where('country', '==', 'Hungary').get_future().result()[0].birth_year == 1903
+
+    def test_get_many_uses_given_executor(self, test_collection):
+        """Test that get_many() runs queries on a caller-supplied executor."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from src.fire_prox import FireQuery
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            england, usa = FireQuery.get_many([
+                test_collection.where('country', '==', 'England'),
+                test_collection.where('country', '==', 'USA'),
+            ], executor=executor)
+
+        assert len(england) == 3
+        assert [user.name for user in usa] == ['Grace Hopper']
+
+    def test_get_parallel_requires_shard_ordering(self, test_collection):
+        """Test that unshardable queries raise ValueError."""
+        with pytest.raises(ValueError, match='ordered by'):
+            test_collection.order_by('score').get_parallel('birth_year', [1900])
+
+        with pytest.raises(ValueError, match='limit'):
+            test_collection.order_by('birth_year').limit(2).get_parallel('birth_year', [1900])
+
+
 class TestProjections:
     """Test query projections with .select() method."""
 
@@ -350,6 +350,19 @@ class TestAggregationEdgeCases:
         assert isinstance(count, int)
         assert count >= 0
 
+    def test_count_across_collection_group(self, db):
+        """Test counting documents in every subcollection with the same ID."""
+        for dept, headcount in [('eng', 3), ('ops', 2)]:
+            staff = db.collection(f'aggregation_test_departments/{dept}/aggregation_test_staff')
+            for i in range(headcount):
+                emp = staff.new()
+                emp.active = i != 0
+                emp.save()
+
+        group = db.collection_group('aggregation_test_staff')
+        assert group.count() == 5
+        assert group.where('active', '==', True).count() == 3
+
     def test_sum_with_all_zero_values(self, employees):
         """Test summing when all values are zero."""
         # Create employees with zero salary
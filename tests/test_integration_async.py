@@ -165,6 +165,48 @@ class TestAsyncIntegration:
         assert user.id == 'snapshot_test'
         assert user.to_dict()['name'] == 'Ada Lovelace'
 
+    @pytest.mark.asyncio
+    async def test_save_unmodified_attached_makes_no_write(self, async_db, monkeypatch):
+        """Test saving an unmodified ATTACHED object skips the RPC and creates nothing."""
+        async def fail_write(*args, **kwargs):
+            raise AssertionError('save() should not write')
+
+        user = async_db.doc('users/never_written')
+        monkeypatch.setattr(AsyncFireObject, '_write_set', fail_write)
+        await user.save()
+        monkeypatch.undo()
+
+        assert user.state == State.ATTACHED
+        assert not (await user._doc_ref.get()).exists
+
+    @pytest.mark.asyncio
+    async def test_client_pool_routes_direct_io(self, async_db):
+        """Test AsyncFireProx(pool=...) sends direct reads and writes through pooled clients."""
+        from unittest import mock
+
+        from fire_prox.testing import async_testing_client
+
+        pooled = async_testing_client()
+        pooled_db = AsyncFireProx(async_testing_client(), pool=[pooled])
+
+        with mock.patch.object(pooled, 'document', wraps=pooled.document) as spy:
+            user = pooled_db.collection('users').new()
+            user.name = 'Ada Lovelace'
+            await user.save(doc_id='pooled')
+            user.year = 1816
+            await user.save()
+            await pooled_db.doc('users/pooled').fetch()
+
+            assert spy.called
+            assert all(call.args == ('users/pooled',) for call in spy.call_args_list)
+
+            # An AsyncFireProx over another client never uses this pool
+            calls = spy.call_count
+            fetched = await async_db.doc('users/pooled').fetch()
+            assert spy.call_count == calls
+
+        assert fetched.year == 1816
+
     @pytest.mark.asyncio
     async def test_collection_properties(self, async_db, async_users_collection):
         """Test AsyncFireCollection properties."""
@@ -179,6 +221,28 @@ class TestAsyncIntegration:
         assert db.native_client == async_client
         assert db.client == async_client
 
+    @pytest.mark.asyncio
+    async def test_fetch_many_loads_documents_in_one_call(self, async_db, async_users_collection):
+        """Test AsyncFireProx.fetch_many() loads several documents at once."""
+        for doc_id in ('many_a', 'many_b'):
+            await async_users_collection._collection_ref.document(doc_id).set({'name': doc_id})
+
+        first, second = await async_db.fetch_many(['users/many_a', async_db.doc('users/many_b')])
+        assert first.is_loaded() and second.is_loaded()
+        assert (first.name, second.name) == ('many_a', 'many_b')
+
+    @pytest.mark.asyncio
+    async def test_async_fireprox_shares_companion_sync_client(self, async_client):
+        """Test AsyncFireProx instances reuse one sync client per database."""
+        assert AsyncFireProx(async_client)._sync_client is AsyncFireProx(async_client)._sync_client
+
+    @pytest.mark.asyncio
+    async def test_companion_sync_client_follows_emulator_host(self, async_client, monkeypatch):
+        """Test a changed FIRESTORE_EMULATOR_HOST gets its own companion sync client."""
+        shared = AsyncFireProx(async_client)._sync_client
+        monkeypatch.setenv('FIRESTORE_EMULATOR_HOST', 'localhost:1')
+        assert AsyncFireProx(async_client)._sync_client is not shared
+
     @pytest.mark.asyncio
     async def test_path_validation(self, async_db):
         """Test path validation."""
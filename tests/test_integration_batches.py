@@ -8,7 +8,7 @@ them atomically.
 
 import pytest
 
-from src.fire_prox import FireProx
+from src.fire_prox import FireObject, FireProx
 from src.fire_prox.testing import testing_client
 
 
@@ -577,3 +577,81 @@ class TestBatchAtomicity:
             user = test_collection.doc(f'atomic_test_{i}')
             user.fetch()
             assert user.counter == i + 1
+
+
+class TestImplicitBulkWrites:
+    """Test FireObject.bulk(), which routes implicit writes into batches."""
+
+    def test_bulk_creates_updates_and_deletes(self, db, test_collection):
+        """Test that writes inside bulk() are committed when the block exits."""
+        with FireObject.bulk(db, batch_size=3):
+            docs = []
+            for i in range(7):
+                doc = test_collection.new()
+                doc.name = f'Implicit{i}'
+                doc.save(doc_id=f'implicit_{i}')
+                docs.append(doc)
+
+            docs[0].name = 'Renamed'
+            docs[0].save()
+            docs[1].delete(recursive=False)
+
+        assert test_collection.doc('implicit_0').name == 'Renamed'
+        assert test_collection.doc('implicit_6').name == 'Implicit6'
+        assert not test_collection.doc('implicit_1')._doc_ref.get().exists
+
+    def test_bulk_discards_pending_writes_on_error(self, db, test_collection):
+        """Test that uncommitted writes are dropped when the block raises."""
+        with pytest.raises(RuntimeError):
+            with FireObject.bulk(db):
+                doc = test_collection.new()
+                doc.name = 'Never saved'
+                doc.save(doc_id='bulk_error')
+                raise RuntimeError("abort")
+
+        assert not test_collection.doc('bulk_error')._doc_ref.get().exists
+
+    def test_bulk_rejects_invalid_batch_size(self, db):
+        """Test that batch_size must be within Firestore's commit limit."""
+        with pytest.raises(ValueError, match="batch_size must be between 1 and 500"):
+            with FireObject.bulk(db, batch_size=501):
+                pass
+
+    def test_fireprox_bulk_shorthand(self, db, test_collection):
+        """Test that db.bulk() batches writes like FireObject.bulk(db)."""
+        with db.bulk():
+            doc = test_collection.new()
+            doc.name = 'Via FireProx'
+            doc.save(doc_id='bulk_shorthand')
+            assert not test_collection.doc('bulk_shorthand')._doc_ref.get().exists
+
+        assert test_collection.doc('bulk_shorthand').name == 'Via FireProx'
+
+    def test_save_many_and_delete_many(self, db, test_collection):
+        """Test saving and deleting several objects through batched commits."""
+        docs = []
+        for i in range(5):
+            doc = test_collection.new()
+            doc.name = f'Many{i}'
+            docs.append(doc)
+
+        FireObject.save_many(docs, batch_size=2)
+        assert all(doc.is_loaded() for doc in docs)
+        assert test_collection.doc(docs[4].id).name == 'Many4'
+
+        FireObject.delete_many(docs[:3], recursive=False)
+        assert all(doc.is_deleted() for doc in docs[:3])
+        assert not test_collection.doc(docs[0].id)._doc_ref.get().exists
+        assert test_collection.doc(docs[3].id)._doc_ref.get().exists
+
+    def test_bulk_rejects_documents_from_another_database(self, db, test_collection):
+        """Test that bulk() refuses writes it would commit against the wrong database."""
+        from google.cloud import firestore
+
+        other_db = FireProx(firestore.Client(project=db.native_client.project, database='fire-prox-other'))
+        with FireObject.bulk(db):
+            doc = other_db.collection(test_collection.path).new()
+            doc.name = 'Elsewhere'
+            with pytest.raises(ValueError, match="bulk"):
+                doc.save(doc_id='wrong_database')
+            assert doc.is_detached()
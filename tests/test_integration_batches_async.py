@@ -7,7 +7,7 @@ the async/await pattern.
 
 import pytest
 
-from src.fire_prox import AsyncFireProx
+from src.fire_prox import AsyncFireObject, AsyncFireProx
 from src.fire_prox.testing import async_testing_client
 
 
@@ -576,3 +576,67 @@ class TestBatchAtomicityAsync:
             user = test_collection.doc(f'atomic_test_{i}')
             await user.fetch()
             assert user.counter == i + 1
+
+
+class TestImplicitBulkWritesAsync:
+    """Test AsyncFireObject.bulk(), which routes implicit writes into batches."""
+
+    async def test_bulk_creates_updates_and_deletes(self, db, test_collection):
+        """Test that writes inside bulk() are committed in chunks and on exit."""
+        async with AsyncFireObject.bulk(db, batch_size=3):
+            docs = []
+            for i in range(7):
+                doc = test_collection.new()
+                doc.name = f'Implicit{i}'
+                await doc.save(doc_id=f'implicit_{i}')
+                docs.append(doc)
+
+            docs[0].name = 'Renamed'
+            await docs[0].save()
+            await docs[1].delete(recursive=False)
+
+        assert (await test_collection.doc('implicit_0').fetch()).name == 'Renamed'
+        assert (await test_collection.doc('implicit_6').fetch()).name == 'Implicit6'
+        assert not (await test_collection.doc('implicit_1')._doc_ref.get()).exists
+
+    async def test_bulk_discards_pending_writes_on_error(self, db, test_collection):
+        """Test that uncommitted writes are dropped when the block raises."""
+        with pytest.raises(RuntimeError):
+            async with db.bulk():
+                doc = test_collection.new()
+                doc.name = 'Never saved'
+                await doc.save(doc_id='bulk_error')
+                raise RuntimeError("abort")
+
+        assert not (await test_collection.doc('bulk_error')._doc_ref.get()).exists
+
+    async def test_bulk_rejects_documents_from_another_database(self, db, test_collection):
+        """Test that bulk() refuses writes it would commit against the wrong database."""
+        from google.cloud import firestore
+
+        other_db = AsyncFireProx(
+            firestore.AsyncClient(project=db.native_client.project, database='fire-prox-other')
+        )
+        async with db.bulk():
+            doc = other_db.collection(test_collection.path).new()
+            doc.name = 'Elsewhere'
+            with pytest.raises(ValueError, match="bulk"):
+                await doc.save(doc_id='wrong_database')
+            assert doc.is_detached()
+
+    async def test_save_many_and_delete_many(self, db, test_collection):
+        """Test saving and deleting several objects through batched commits."""
+        docs = []
+        for i in range(5):
+            doc = test_collection.new()
+            doc.name = f'Many{i}'
+            docs.append(doc)
+
+        await AsyncFireObject.save_many(docs, batch_size=2)
+        assert all(doc.is_loaded() for doc in docs)
+        assert (await test_collection.doc(docs[4].id).fetch()).name == 'Many4'
+
+        await AsyncFireObject.delete_many(docs[:3], recursive=False)
+        assert all(doc.is_deleted() for doc in docs[:3])
+        assert not (await test_collection.doc(docs[0].id)._doc_ref.get()).exists
+        assert (await test_collection.doc(docs[3].id)._doc_ref.get()).exists
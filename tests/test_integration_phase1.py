@@ -50,6 +50,162 @@ class TestPhase1Integration:
         assert user.to_dict()['name'] == 'Ada Lovelace'
         assert user.to_dict()['year'] == 1815
 
+    def test_fetch_many_loads_documents_in_one_call(self, db, users_collection, sample_user_data):
+        """Test fetching several ATTACHED documents at once."""
+        for doc_id in ('many_a', 'many_b'):
+            users_collection._collection_ref.document(doc_id).set(sample_user_data)
+
+        users = [db.doc('users/many_a'), db.doc('users/many_b')]
+        assert FireObject.fetch_many(users) == users
+        for user in users:
+            assert user.state == State.LOADED
+            assert user.to_dict()['name'] == 'Ada Lovelace'
+
+    def test_fetch_many_raises_for_missing_documents(self, db, users_collection, sample_user_data):
+        """Test fetch_many() loads what exists and reports what does not."""
+        users_collection._collection_ref.document('many_present').set(sample_user_data)
+
+        present = db.doc('users/many_present')
+        absent = db.doc('users/many_absent')
+        from google.cloud.exceptions import NotFound
+        with pytest.raises(NotFound, match='users/many_absent'):
+            FireObject.fetch_many([present, absent])
+
+        assert present.is_loaded()
+        assert absent.state == State.ATTACHED
+
+    def test_fireprox_fetch_many_missing_ok(self, db, users_collection, sample_user_data):
+        """Test db.fetch_many(missing_ok=True) leaves missing documents ATTACHED."""
+        users_collection._collection_ref.document('many_ok_present').set(sample_user_data)
+
+        present, absent = db.fetch_many(['users/many_ok_present', 'users/many_ok_absent'], missing_ok=True)
+
+        assert present.is_loaded()
+        assert absent.state == State.ATTACHED
+
+    def test_request_cache_reuses_snapshots(self, db, users_collection, sample_user_data):
+        """Test request_cache() serves repeated fetches and drops written documents."""
+        from fire_prox import request_cache
+
+        doc_ref = users_collection._collection_ref.document('cached')
+        doc_ref.set(sample_user_data)
+
+        with request_cache():
+            first = db.doc('users/cached')
+            first.fetch()
+
+            # Changed behind FireProx's back: the cached snapshot is reused
+            doc_ref.update({'year': 1900})
+            second = db.doc('users/cached')
+            assert second.year == 1815
+
+            # Writing through FireProx invalidates the cached entry
+            first.year = 1816
+            first.save()
+            third = db.doc('users/cached')
+            assert third.year == 1816
+
+    def test_fetch_from_recent_snapshot_cache(self, db, users_collection, sample_user_data):
+        """Test fetch(source='cache') serves recently read snapshots without an RPC."""
+        from google.cloud.exceptions import NotFound
+
+        from fire_prox import configure_recent_snapshots
+
+        doc_ref = users_collection._collection_ref.document('recent')
+        doc_ref.set(sample_user_data)
+
+        # Disabled by default: plain fetches record nothing
+        db.doc('users/recent').fetch()
+        with pytest.raises(NotFound):
+            db.doc('users/recent').fetch(source='cache')
+
+        configure_recent_snapshots(max_size=10)
+        try:
+            with pytest.raises(NotFound):
+                db.doc('users/recent').fetch(source='cache')
+
+            db.doc('users/recent').fetch()
+            doc_ref.update({'year': 1900})
+            stale = db.doc('users/recent').fetch(source='cache')
+            assert stale.year == 1815
+
+            # The server is reachable, so server_and_cache reads fresh data
+            assert db.doc('users/recent').fetch(source='server_and_cache').year == 1900
+
+            # Deleting through FireProx drops the cached snapshot
+            stale.delete()
+            with pytest.raises(NotFound):
+                db.doc('users/recent').fetch(source='cache')
+
+            with pytest.raises(ValueError):
+                db.doc('users/recent').fetch(source='disk')
+        finally:
+            configure_recent_snapshots(max_size=0)
+
+    def test_forced_fetch_if_modified(self, db, users_collection, sample_user_data):
+        """Test fetch(force=True, if_modified=True) re-reads only changed documents."""
+        doc_ref = users_collection._collection_ref.document('polled')
+        doc_ref.set(sample_user_data)
+
+        user = db.doc('users/polled')
+        user.fetch()
+        user.fetch(force=True, if_modified=True)
+        assert user.year == 1815
+
+        doc_ref.update({'year': 1900})
+        user.fetch(force=True, if_modified=True)
+        assert user.year == 1900
+
+    def test_save_unmodified_attached_is_noop(self, db, users_collection, sample_user_data):
+        """Test saving an ATTACHED object with no assigned fields leaves the document alone."""
+        users_collection._collection_ref.document('untouched').set(sample_user_data)
+
+        user = db.doc('users/untouched')
+        user.save()
+        assert user.state == State.ATTACHED
+        assert user.name == 'Ada Lovelace'
+
+    def test_save_unmodified_attached_makes_no_write(self, db, monkeypatch):
+        """Test saving an unmodified ATTACHED object skips the RPC and creates nothing."""
+        def fail_write(*args, **kwargs):
+            raise AssertionError('save() should not write')
+
+        user = db.doc('users/never_written')
+        monkeypatch.setattr(FireObject, '_write_set', fail_write)
+        user.save()
+        monkeypatch.undo()
+
+        assert user.state == State.ATTACHED
+        assert not user._doc_ref.get().exists
+
+    def test_save_assigned_attached_overwrites(self, db, users_collection, sample_user_data):
+        """Test saving an ATTACHED object with assigned fields replaces the document."""
+        users_collection._collection_ref.document('replaced').set(sample_user_data)
+
+        user = db.doc('users/replaced')
+        user.name = 'Grace Hopper'
+        user.save()
+        assert user.state == State.LOADED
+        assert users_collection._collection_ref.document('replaced').get().to_dict() == {'name': 'Grace Hopper'}
+
+    def test_dunder_probes_do_not_lazy_load(self, db):
+        """Test protocol probes like __deepcopy__ do not fetch ATTACHED documents."""
+        user = db.doc('users/does_not_exist')
+        assert not hasattr(user, '__deepcopy__')
+        assert user.state == State.ATTACHED
+
+    async def test_thread_bridges(self, db, users_collection):
+        """Test afetch()/asave()/adelete() run the sync calls off the event loop."""
+        user = users_collection.new()
+        user.name = 'Ada'
+        await user.asave(doc_id='bridged')
+
+        loaded = await db.doc('users/bridged').afetch()
+        assert loaded.name == 'Ada'
+
+        await loaded.adelete()
+        assert loaded.is_deleted()
+
     def test_update_document(self, db, users_collection):
         """Test updating an existing document."""
         # Create and save
@@ -158,6 +314,34 @@ class TestPhase1Integration:
         assert user.id == 'snapshot_test'
         assert user.to_dict()['name'] == 'Ada Lovelace'
 
+    def test_from_snapshots_bulk_hydration(self, db, users_collection, sample_user_data):
+        """Test creating FireObjects from several snapshots at once."""
+        for doc_id in ('bulk_a', 'bulk_b'):
+            users_collection._collection_ref.document(doc_id).set(sample_user_data)
+
+        from fire_prox import FireObject
+        users = FireObject.from_snapshots(
+            users_collection._collection_ref.stream(), users_collection
+        )
+
+        assert sorted(user.id for user in users) == ['bulk_a', 'bulk_b']
+        for user in users:
+            assert user.state == State.LOADED
+            assert not user.is_dirty()
+            assert user.name == 'Ada Lovelace'
+
+    def test_from_snapshot_without_copy(self, db, users_collection):
+        """Test from_snapshot(copy=False) hydrates without deep-copying the snapshot."""
+        users_collection._collection_ref.document('shared').set({'tags': ['a']})
+        snapshot = users_collection._collection_ref.document('shared').get()
+
+        from fire_prox import FireObject
+        user = FireObject.from_snapshot(snapshot, users_collection, copy=False)
+
+        assert user.state == State.LOADED
+        assert user.tags is snapshot._data['tags']
+        assert FireObject.from_snapshot(snapshot).tags is not snapshot._data['tags']
+
     def test_collection_properties(self, db, users_collection):
         """Test FireCollection properties."""
         assert users_collection.id == 'users'
@@ -258,6 +442,70 @@ class TestPhase1Integration:
         assert user.is_loaded()
         assert user.to_dict()['name'] == sample_user_data['name']
 
+    def test_client_pool_routes_direct_io(self, db):
+        """Test FireProx(pool=...) sends direct reads and writes through pooled clients."""
+        from unittest import mock
+
+        from fire_prox.testing import testing_client
+
+        pooled = testing_client()
+        pooled_db = FireProx(testing_client(), pool=[pooled])
+
+        with mock.patch.object(pooled, 'document', wraps=pooled.document) as spy:
+            user = pooled_db.collection('users').new()
+            user.name = 'Ada Lovelace'
+            user.save(doc_id='pooled')
+            user.year = 1816
+            user.save()
+            pooled_db.doc('users/pooled').fetch()
+
+            # Calls rotate between the FireProx's client and the pool
+            assert spy.called
+            assert all(call.args == ('users/pooled',) for call in spy.call_args_list)
+
+            # A FireProx over another client never uses this pool
+            calls = spy.call_count
+            fetched = db.doc('users/pooled').fetch()
+            assert spy.call_count == calls
+
+        assert fetched.name == 'Ada Lovelace'
+        assert fetched.year == 1816
+
+    def test_client_pool_rejects_other_databases(self, client):
+        """Test that pooled clients must target the FireProx client's project and database."""
+        from google.cloud import firestore
+
+        other = firestore.Client(project=client.project, database='fire-prox-other')
+        with pytest.raises(ValueError, match="same project and database"):
+            FireProx(client, pool=[other])
+
+    def test_doc_reuses_document_reference(self, db):
+        """Ensure repeated doc() calls share one native reference but not the proxy."""
+        first = db.doc('users/shared_ref')
+        second = db.doc('users/shared_ref')
+
+        assert first is not second
+        assert first._doc_ref is second._doc_ref
+        with pytest.raises(ValueError):
+            db.doc('users')
+
+    def test_fireprox_is_freed_without_cycle_collection(self, client):
+        """Ensure a FireProx with cached references is freed by reference counting."""
+        import gc
+        import weakref
+
+        short_lived = FireProx(client)
+        short_lived.doc('users/cached')
+        short_lived.collection('users')
+        ref = weakref.ref(short_lived)
+
+        gc.disable()
+        try:
+            del short_lived
+            assert ref() is None
+        finally:
+            gc.enable()
+
     def test_new_returns_detached_object(self, users_collection):
         """Ensure new() returns a detached FireObject ready for data entry."""
         user = users_collection.new()
@@ -491,6 +491,19 @@ class TestSubcollections:
         with pytest.raises(RuntimeError, match="Cannot .* on a DELETED FireObject"):
             doc.collection('subcollection')
 
+    def test_collection_parent(self, test_collection):
+        """Test that parent returns the owning document, or None at the root."""
+        assert test_collection.parent is None
+
+        user = test_collection.new()
+        user.name = 'Ada Lovelace'
+        user.save(doc_id='ada_parent')
+
+        parent = user.collection('posts').parent
+        assert parent.is_attached()
+        assert parent.path == 'phase2_test_collection/ada_parent'
+        assert parent.name == 'Ada Lovelace'
+
     def test_nested_subcollections(self, test_collection):
         """Test creating nested subcollections (3+ levels)."""
         # Create parent document
@@ -536,6 +549,22 @@ class TestSubcollections:
         db_subcollections = db.collections(f"{test_collection.path}/ada_lists", names_only=True)
         assert db_subcollections == ['posts']
 
+    def test_fetch_prefetches_collections(self, test_collection, db):
+        """fetch(prefetch_collections=True) should serve the next collections() call."""
+        user = test_collection.new()
+        user.name = 'Ada Lovelace'
+        user.save(doc_id='ada_prefetch')
+        user.collection('posts').new().save(doc_id='post1')
+
+        fetched = db.doc(f"{test_collection.path}/ada_prefetch")
+        fetched.fetch(prefetch_collections=True)
+        assert fetched.name == 'Ada Lovelace'
+        assert fetched.collections(names_only=True) == ['posts']
+
+        # The prefetched listing is used once; later calls query again
+        fetched.collection('notes').new().save(doc_id='note1')
+        assert sorted(fetched.collections(names_only=True)) == ['notes', 'posts']
+
 
 class TestCollectionDeletion:
     """Test collection and subcollection deletion helpers."""
@@ -630,6 +659,62 @@ class TestCollectionDeletion:
         posts_path = f"{test_collection.path}/cascade_user/posts"
         assert list(db.native_client.collection(posts_path).list_documents()) == []
 
+    def test_delete_clears_sibling_subcollections_concurrently(self, test_collection, db):
+        """Recursive delete should clear every sibling subcollection."""
+        user = test_collection.new()
+        user.name = 'Ada Lovelace'
+        user.save(doc_id='fanout_user')
+
+        names = ['posts', 'notes', 'drafts']
+        for name in names:
+            child = user.collection(name).new()
+            child.title = name
+            child.save(doc_id=f'{name}1')
+
+        user.delete(max_workers=2)
+        assert user.is_deleted()
+
+        for name in names:
+            path = f"{test_collection.path}/fanout_user/{name}"
+            assert list(db.native_client.collection(path).list_documents()) == []
+
+    def test_delete_with_subcollection_ids_uses_collection_groups(self, test_collection, db):
+        """Recursive delete with subcollection_ids clears only this document's descendants."""
+        user = test_collection.new()
+        user.name = 'Ada Lovelace'
+        user.save(doc_id='group_user')
+        other = test_collection.new()
+        other.name = 'Charles Babbage'
+        other.save(doc_id='group_user_other')
+
+        post = user.collection('posts').new()
+        post.title = 'Post'
+        post.save(doc_id='post1')
+        comment = post.collection('comments').new()
+        comment.text = 'Nested'
+        comment.save(doc_id='comment1')
+        other_post = other.collection('posts').new()
+        other_post.title = 'Keep me'
+        other_post.save(doc_id='post1')
+
+        user.delete(subcollection_ids=['posts', 'comments'])
+        assert user.is_deleted()
+
+        base = f"{test_collection.path}/group_user"
+        assert list(db.native_client.collection(f"{base}/posts").list_documents()) == []
+        assert list(db.native_client.collection(f"{base}/posts/post1/comments").list_documents()) == []
+        other_posts = f"{test_collection.path}/group_user_other/posts"
+        assert len(list(db.native_client.collection(other_posts).list_documents())) == 1
+
+    def test_delete_rejects_non_positive_max_workers(self, test_collection):
+        """Recursive delete should validate max_workers."""
+        user = test_collection.new()
+        user.name = 'Ada Lovelace'
+        user.save(doc_id='bad_workers')
+
+        with pytest.raises(ValueError, match="max_workers must be positive"):
+            user.delete(max_workers=0)
+
     def test_delete_non_recursive_preserves_subcollections(self, test_collection, db):
         """Document delete should skip subcollections when recursive=False."""
         user = test_collection.new()
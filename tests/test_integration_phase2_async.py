@@ -324,6 +324,20 @@ class TestSubcollectionsAsync:
         with pytest.raises(RuntimeError, match="Cannot .* on a DELETED FireObject"):
             doc.collection('subcollection')
 
+    async def test_collection_parent(self, test_collection):
+        """Test that parent returns the owning document, or None at the root."""
+        assert test_collection.parent is None
+
+        user = test_collection.new()
+        user.name = 'Ada Lovelace'
+        await user.save(doc_id='ada_parent')
+
+        parent = user.collection('posts').parent
+        assert parent.is_attached()
+        assert parent.path == 'phase2_async_test_collection/ada_parent'
+        await parent.fetch()
+        assert parent.name == 'Ada Lovelace'
+
     async def test_nested_subcollections(self, test_collection):
         """Test creating nested subcollections (3+ levels)."""
         # Create parent document
@@ -467,6 +481,65 @@ class TestCollectionDeletionAsync:
         nested_docs = [doc async for doc in db.native_client.collection(posts_path).list_documents()]
         assert nested_docs == []
 
+    async def test_delete_clears_sibling_subcollections_concurrently(self, test_collection, db):
+        """Async recursive delete should clear every sibling subcollection."""
+        user = test_collection.new()
+        user.name = 'Ada Lovelace'
+        await user.save(doc_id='fanout_user')
+
+        names = ['posts', 'notes', 'drafts']
+        for name in names:
+            child = user.collection(name).new()
+            child.title = name
+            await child.save(doc_id=f'{name}1')
+
+        await user.delete(max_concurrency=2)
+        assert user.is_deleted()
+
+        for name in names:
+            path = f"{test_collection.path}/fanout_user/{name}"
+            remaining = [doc async for doc in db.native_client.collection(path).list_documents()]
+            assert remaining == []
+
+    async def test_delete_with_subcollection_ids_uses_collection_groups(self, test_collection, db):
+        """Async recursive delete with subcollection_ids clears only this document's descendants."""
+        user = test_collection.new()
+        user.name = 'Ada Lovelace'
+        await user.save(doc_id='group_user')
+        other = test_collection.new()
+        other.name = 'Charles Babbage'
+        await other.save(doc_id='group_user_other')
+
+        post = user.collection('posts').new()
+        post.title = 'Post'
+        await post.save(doc_id='post1')
+        comment = post.collection('comments').new()
+        comment.text = 'Nested'
+        await comment.save(doc_id='comment1')
+        other_post = other.collection('posts').new()
+        other_post.title = 'Keep me'
+        await other_post.save(doc_id='post1')
+
+        await user.delete(subcollection_ids=['posts', 'comments'], batch_size=1, max_concurrency=2)
+        assert user.is_deleted()
+
+        base = f"{test_collection.path}/group_user"
+        for path in (f"{base}/posts", f"{base}/posts/post1/comments"):
+            remaining = [doc async for doc in db.native_client.collection(path).list_documents()]
+            assert remaining == []
+        other_posts = f"{test_collection.path}/group_user_other/posts"
+        kept = [doc async for doc in db.native_client.collection(other_posts).list_documents()]
+        assert len(kept) == 1
+
+    async def test_delete_rejects_non_positive_max_concurrency(self, test_collection):
+        """Async recursive delete should validate max_concurrency."""
+        user = test_collection.new()
+        user.name = 'Ada Lovelace'
+        await user.save(doc_id='bad_concurrency')
+
+        with pytest.raises(ValueError, match="max_concurrency must be positive"):
+            await user.delete(max_concurrency=0)
+
     async def test_delete_non_recursive_preserves_subcollections(self, test_collection, db):
         """Async delete should skip subcollections when recursive=False."""
         user = test_collection.new()